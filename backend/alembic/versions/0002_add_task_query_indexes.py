@@ -0,0 +1,52 @@
+"""Add indexes for hot task query predicates
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-17 09:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+revision = '0002'
+down_revision = '0001'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # The tasks table may already carry these indexes if it was created by
+    # SQLModel.metadata.create_all(), so every create is idempotent.
+
+    # Task list ordering and keyset pagination: WHERE user_id = ? ORDER BY created_at, id
+    op.create_index('ix_tasks_user_id_created_at_id', 'tasks', ['user_id', 'created_at', 'id'], if_not_exists=True)
+
+    # Status filter: WHERE user_id = ? AND completed = ?
+    op.create_index('ix_tasks_user_id_completed', 'tasks', ['user_id', 'completed'], if_not_exists=True)
+
+    # Priority filter: WHERE user_id = ? AND priority = ?
+    op.create_index('ix_tasks_user_id_priority', 'tasks', ['user_id', 'priority'], if_not_exists=True)
+
+    # Pending tasks only; both PostgreSQL and SQLite support partial indexes
+    bind = op.get_bind()
+    if bind.dialect.name in ('postgresql', 'sqlite'):
+        pending_predicate = 'completed = false' if bind.dialect.name == 'postgresql' else 'completed = 0'
+        op.create_index(
+            'ix_tasks_user_id_pending',
+            'tasks',
+            ['user_id', 'created_at'],
+            postgresql_where=sa.text(pending_predicate),
+            sqlite_where=sa.text(pending_predicate),
+            if_not_exists=True
+        )
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name in ('postgresql', 'sqlite'):
+        op.drop_index('ix_tasks_user_id_pending', table_name='tasks', if_exists=True)
+
+    op.drop_index('ix_tasks_user_id_priority', table_name='tasks', if_exists=True)
+    op.drop_index('ix_tasks_user_id_completed', table_name='tasks', if_exists=True)
+    op.drop_index('ix_tasks_user_id_created_at_id', table_name='tasks', if_exists=True)
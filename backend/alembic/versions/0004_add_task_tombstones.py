@@ -0,0 +1,39 @@
+"""Add task tombstones and updated_at index for delta sync
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-17 15:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+revision = '0004'
+down_revision = '0003'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # One row per deleted task, read by GET /tasks/changes
+    op.create_table(
+        'task_tombstones',
+        sa.Column('task_id', sa.String(), nullable=False),
+        sa.Column('user_id', sa.String(), nullable=False),
+        sa.Column('deleted_at', sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint('task_id'),
+        if_not_exists=True
+    )
+    op.create_index(
+        'ix_task_tombstones_user_id_deleted_at', 'task_tombstones', ['user_id', 'deleted_at'], if_not_exists=True
+    )
+
+    # Tasks changed since a sync token: WHERE user_id = ? AND updated_at > ?
+    op.create_index('ix_tasks_user_id_updated_at', 'tasks', ['user_id', 'updated_at'], if_not_exists=True)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_tasks_user_id_updated_at', table_name='tasks', if_exists=True)
+    op.drop_index('ix_task_tombstones_user_id_deleted_at', table_name='task_tombstones', if_exists=True)
+    op.drop_table('task_tombstones', if_exists=True)
@@ -0,0 +1,68 @@
+"""Store task and user keys, and the user_id columns referencing users, as native uuid on PostgreSQL
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-17 16:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+from sqlalchemy.dialects import postgresql
+
+revision = '0005'
+down_revision = '0004'
+branch_labels = None
+depends_on = None
+
+# (table, column) pairs whose varchar column becomes uuid; user_id columns follow users.id
+# so comparisons and future foreign keys need no casts
+UUID_COLUMNS = (
+    ('tasks', 'id'),
+    ('users', 'id'),
+    ('tasks', 'user_id'),
+    ('task_tombstones', 'user_id'),
+    ('conversation', 'user_id'),
+)
+
+UUID_PATTERN = '^[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}$'
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    # SQLite keeps its string keys: new IDs are UUIDv7 strings and sort the same way
+    if bind.dialect.name != 'postgresql':
+        return
+
+    for table_name, column_name in UUID_COLUMNS:
+        # Existing keys were generated by uuid4() and convert as they are; fail before altering anything otherwise
+        invalid = bind.execute(
+            sa.text(f"SELECT count(*) FROM {table_name} WHERE {column_name} !~ :pattern"), {'pattern': UUID_PATTERN}
+        ).scalar_one()
+        if invalid:
+            raise RuntimeError(
+                f"{invalid} rows in {table_name} have a {column_name} that is not a UUID; fix them before upgrading"
+            )
+
+    for table_name, column_name in UUID_COLUMNS:
+        op.alter_column(
+            table_name, column_name,
+            type_=postgresql.UUID(as_uuid=False),
+            existing_type=sa.String(),
+            existing_nullable=False,
+            postgresql_using=f'{column_name}::uuid'
+        )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    for table_name, column_name in reversed(UUID_COLUMNS):
+        op.alter_column(
+            table_name, column_name,
+            type_=sa.String(),
+            existing_type=postgresql.UUID(as_uuid=False),
+            existing_nullable=False,
+            postgresql_using=f'{column_name}::text'
+        )
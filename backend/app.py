@@ -48,18 +48,6 @@ if not os.getenv("BACKEND_URL"):
 from src.utils.logging_config import get_logger
 logger = get_logger(__name__)
 
-def create_tables():
-    """Create database tables."""
-    try:
-        from src.database.connection import create_tables
-        logger.info("Creating database tables...")
-        create_tables()
-        logger.info("Database tables created successfully.")
-        return True
-    except Exception as e:
-        logger.error(f"Error creating tables: {e}")
-        return False
-
 def start_server():
     """Start the FastAPI server."""
     try:
@@ -82,9 +70,6 @@ def start_server():
 if __name__ == "__main__":
     logger.info("Initializing Todo API for Hugging Face Spaces...")
 
-    if not create_tables():
-        logger.error("Failed to create database tables. Exiting.")
-        sys.exit(1)
-
+    # Database connection and table creation run in the app's lifespan startup
     logger.info("Starting the server...")
     start_server()
\ No newline at end of file
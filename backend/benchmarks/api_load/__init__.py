@@ -0,0 +1,14 @@
+"""
+In-process load and latency benchmarks for the Todo API.
+
+Drives the FastAPI app from main.py through httpx's ASGI transport against a
+temporary, seeded SQLite database, so no server, network or external LLM is
+involved. Each scenario reports throughput and p50/p95/p99 latency; results can
+be saved as a baseline and later runs compared against it to flag regressions.
+
+Usage (from backend/):
+    python -m benchmarks.api_load
+    python -m benchmarks.api_load --requests 500 --concurrency 8 --scenario list
+    python -m benchmarks.api_load --save-baseline benchmarks/api_load/baseline.json
+    python -m benchmarks.api_load --compare benchmarks/api_load/baseline.json
+"""
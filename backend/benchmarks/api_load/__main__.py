@@ -0,0 +1,85 @@
+"""Command-line entry point: python -m benchmarks.api_load --help"""
+
+import argparse
+import asyncio
+import logging
+import os
+import sys
+import tempfile
+
+from . import __doc__ as PACKAGE_DOC
+from .baseline import compare_to_baseline, load_baseline_settings, save_baseline
+from .harness import app_client, format_results, prepare_environment, run_scenario
+from .scenarios import DEFAULT_LIST_SIZES, build_scenarios, install_stub_llm, seed_context
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=PACKAGE_DOC, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=200, help="Timed requests per scenario")
+    parser.add_argument("--warmup", type=int, default=20, help="Untimed requests per scenario before measuring")
+    parser.add_argument("--concurrency", type=int, default=1, help="Requests in flight at once")
+    parser.add_argument("--list-sizes", type=int, nargs="+", default=list(DEFAULT_LIST_SIZES), help="Task counts for the list scenarios")
+    parser.add_argument("--llm-latency-ms", type=float, default=0.0, help="Delay added by the stub LLM per chat request")
+    parser.add_argument("--scenario", action="append", help="Only run scenarios whose name starts with this (repeatable)")
+    parser.add_argument("--save-baseline", metavar="PATH", help="Write the results to PATH")
+    parser.add_argument("--compare", metavar="PATH", help="Compare the results with the baseline at PATH")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="Relative change allowed before --compare flags a regression")
+    return parser.parse_args()
+
+
+async def run(args):
+    # Imported here: the environment must point at the benchmark database first
+    import main
+
+    install_stub_llm(args.llm_latency_ms)
+    scenarios = build_scenarios(args.list_sizes)
+    if args.scenario:
+        scenarios = [s for s in scenarios if any(s.name.startswith(prefix) for prefix in args.scenario)]
+
+    results = []
+    async with app_client(main.app) as client:
+        context = await seed_context(client)
+        for scenario in scenarios:
+            if args.warmup:
+                await run_scenario(client, scenario, context, args.warmup, args.concurrency)
+            results.append(await run_scenario(client, scenario, context, args.requests, args.concurrency))
+            print(f"  {scenario.name} done", file=sys.stderr)
+    return results
+
+
+def main():
+    args = parse_args()
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        prepare_environment(os.path.join(tmp_dir, "benchmark.db"))
+        # Log output would dominate the measurement
+        logging.disable(logging.CRITICAL)
+        results = asyncio.run(run(args))
+
+    print(f"\n{args.requests} requests per scenario, concurrency {args.concurrency}\n")
+    print(format_results(results))
+
+    run_settings = {
+        "requests": args.requests,
+        "concurrency": args.concurrency,
+        "list_sizes": args.list_sizes,
+        "llm_latency_ms": args.llm_latency_ms,
+    }
+    if args.save_baseline:
+        save_baseline(args.save_baseline, results, run_settings)
+        print(f"\nBaseline written to {args.save_baseline}")
+
+    if args.compare:
+        baseline_settings = load_baseline_settings(args.compare)
+        if baseline_settings != run_settings:
+            print(f"\nWarning: baseline was recorded with {baseline_settings}, this run used {run_settings}")
+        regressions = compare_to_baseline(args.compare, results, args.tolerance)
+        if regressions:
+            print(f"\n{len(regressions)} regressions against {args.compare} (tolerance {args.tolerance:.0%}):")
+            for regression in regressions:
+                print(f"  {regression}")
+            sys.exit(1)
+        print(f"\nNo regressions against {args.compare} (tolerance {args.tolerance:.0%})")
+
+
+if __name__ == "__main__":
+    main()
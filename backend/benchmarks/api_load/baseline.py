@@ -0,0 +1,82 @@
+"""Save benchmark results as a baseline and compare later runs against it."""
+
+import json
+import platform
+from datetime import datetime, timezone
+from typing import Dict, List
+
+from .harness import ScenarioResult
+
+# Metrics where a higher value is a regression; throughput regresses when it drops
+LATENCY_METRICS = ("p50_ms", "p95_ms", "p99_ms")
+
+
+def save_baseline(path: str, results: List[ScenarioResult], settings: Dict):
+    """
+    Write results to path as JSON.
+
+    Args:
+        path (str): Baseline file
+        results (List[ScenarioResult]): Results of this run
+        settings (Dict): Run parameters (requests, concurrency, ...) recorded for reference
+    """
+    baseline = {
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "settings": settings,
+        "scenarios": {result.name: result.summary() for result in results},
+    }
+    with open(path, "w") as f:
+        json.dump(baseline, f, indent=2)
+        f.write("\n")
+
+
+def load_baseline_settings(path: str) -> Dict:
+    """Return the run parameters recorded in the baseline at path."""
+    with open(path) as f:
+        return json.load(f).get("settings", {})
+
+
+def compare_to_baseline(path: str, results: List[ScenarioResult], tolerance: float) -> List[str]:
+    """
+    Compare results with the baseline at path.
+
+    A scenario regresses when a latency percentile is more than tolerance above
+    the baseline, when throughput is more than tolerance below it, or when it
+    returns errors the baseline did not have. Scenarios missing from the baseline
+    are skipped.
+
+    Args:
+        path (str): Baseline file written by save_baseline
+        results (List[ScenarioResult]): Results of this run
+        tolerance (float): Allowed relative change, e.g. 0.2 for 20%
+
+    Returns:
+        List[str]: One message per regressed metric; empty if nothing regressed
+    """
+    with open(path) as f:
+        baseline = json.load(f)["scenarios"]
+
+    regressions = []
+    for result in results:
+        expected = baseline.get(result.name)
+        if expected is None:
+            continue
+        actual = result.summary()
+        for metric in LATENCY_METRICS:
+            if expected[metric] and actual[metric] > expected[metric] * (1 + tolerance):
+                regressions.append(
+                    f"{result.name}: {metric} {actual[metric]:.2f} ms vs baseline {expected[metric]:.2f} ms "
+                    f"(+{actual[metric] / expected[metric] - 1:.0%})"
+                )
+        if expected["throughput"] and actual["throughput"] < expected["throughput"] * (1 - tolerance):
+            regressions.append(
+                f"{result.name}: throughput {actual['throughput']:.1f} req/s vs baseline {expected['throughput']:.1f} req/s "
+                f"({actual['throughput'] / expected['throughput'] - 1:.0%})"
+            )
+        if actual["error_rate"] > expected["error_rate"]:
+            regressions.append(
+                f"{result.name}: error rate {actual['error_rate']:.2%} vs baseline {expected['error_rate']:.2%}"
+            )
+    return regressions
@@ -0,0 +1,148 @@
+"""Run scenarios against the app in process and summarise their latencies."""
+
+import asyncio
+import os
+import statistics
+import sys
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+import httpx
+
+BACKEND_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+
+
+@dataclass
+class Scenario:
+    """
+    One kind of request to benchmark.
+
+    request(client, state, i) sends the i-th request and returns the response;
+    setup(client, context, count) runs untimed beforehand and returns the state
+    request needs (for example the IDs of tasks to delete).
+    """
+    name: str
+    request: Callable[[httpx.AsyncClient, Any, int], Awaitable[httpx.Response]]
+    setup: Optional[Callable[[httpx.AsyncClient, "BenchmarkContext", int], Awaitable[Any]]] = None
+    expected_status: int = 200
+
+
+@dataclass
+class BenchmarkContext:
+    """Seeded users shared by all scenarios: each entry has id, email, password and headers."""
+    users: List[Dict[str, Any]] = field(default_factory=list)
+
+
+@dataclass
+class ScenarioResult:
+    """Latency distribution and throughput of one scenario run."""
+    name: str
+    requests: int
+    errors: int
+    seconds: float
+    latencies_ms: List[float]
+
+    @property
+    def throughput(self) -> float:
+        return self.requests / self.seconds if self.seconds else 0.0
+
+    def percentile(self, p: float) -> float:
+        """Latency in milliseconds below which p percent of requests completed."""
+        if not self.latencies_ms:
+            return 0.0
+        if len(self.latencies_ms) == 1:
+            return self.latencies_ms[0]
+        return statistics.quantiles(self.latencies_ms, n=100, method="inclusive")[int(p) - 1]
+
+    def summary(self) -> Dict[str, float]:
+        """Metrics stored in baselines."""
+        return {
+            "throughput": round(self.throughput, 2),
+            "p50_ms": round(self.percentile(50), 3),
+            "p95_ms": round(self.percentile(95), 3),
+            "p99_ms": round(self.percentile(99), 3),
+            "error_rate": round(self.errors / self.requests, 4) if self.requests else 0.0,
+        }
+
+
+def prepare_environment(db_path: str):
+    """
+    Point the settings at db_path and make the app importable.
+
+    Must run before anything under src is imported: settings and the engines are
+    built at import time.
+    """
+    if BACKEND_DIR not in sys.path:
+        sys.path.insert(0, BACKEND_DIR)
+    database_url = f"sqlite:///{db_path}"
+    os.environ["DATABASE_URL"] = database_url
+    os.environ["NEON_DB_URL"] = database_url
+    os.environ.pop("NEON_ASYNC_DB_URL", None)
+    # No API key keeps the real LLM client from being built; the stub replaces the model call
+    os.environ["OPEN_ROUTER_API_KEY"] = ""
+    for name in ("BETTER_AUTH_SECRET", "BETTER_AUTH_URL", "SECRET_KEY"):
+        os.environ.setdefault(name, "benchmark-secret-key-with-at-least-32-bytes")
+
+
+@asynccontextmanager
+async def app_client(app):
+    """Yield an httpx client bound to app, running the app's lifespan around it."""
+    async with app.router.lifespan_context(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://benchmark") as client:
+            yield client
+
+
+async def run_scenario(
+    client: httpx.AsyncClient,
+    scenario: Scenario,
+    context: BenchmarkContext,
+    count: int,
+    concurrency: int
+) -> ScenarioResult:
+    """
+    Send count requests for scenario from concurrency workers and time each one.
+
+    Args:
+        client (httpx.AsyncClient): Client bound to the app
+        scenario (Scenario): Scenario to run
+        context (BenchmarkContext): Seeded users
+        count (int): Number of timed requests
+        concurrency (int): Requests in flight at once
+
+    Returns:
+        ScenarioResult: Per-request latencies, errors and wall-clock time
+    """
+    state = await scenario.setup(client, context, count) if scenario.setup else context
+    latencies_ms: List[float] = []
+    errors = 0
+    next_index = iter(range(count))
+
+    async def worker():
+        nonlocal errors
+        for i in next_index:
+            started = time.perf_counter()
+            try:
+                response = await scenario.request(client, state, i)
+                failed = response.status_code != scenario.expected_status
+            except Exception:
+                failed = True
+            latencies_ms.append((time.perf_counter() - started) * 1000)
+            errors += failed
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return ScenarioResult(scenario.name, count, errors, time.perf_counter() - started, latencies_ms)
+
+
+def format_results(results: List[ScenarioResult]) -> str:
+    """Render results as a table."""
+    lines = [f"{'scenario':<16} {'requests':>8} {'errors':>6} {'req/s':>9} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9}"]
+    for result in results:
+        lines.append(
+            f"{result.name:<16} {result.requests:>8} {result.errors:>6} {result.throughput:>9.1f} "
+            f"{result.percentile(50):>9.2f} {result.percentile(95):>9.2f} {result.percentile(99):>9.2f}"
+        )
+    return "\n".join(lines)
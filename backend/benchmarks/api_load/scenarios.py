@@ -0,0 +1,153 @@
+"""Benchmark scenarios covering auth, task CRUD, task lists and chat."""
+
+import asyncio
+import uuid
+from typing import Any, Dict, List
+
+import httpx
+
+from .harness import BenchmarkContext, Scenario
+
+PASSWORD = "benchmark-password"
+PRIORITIES = ("low", "medium", "high")
+
+# Tasks owned by each list scenario's user
+DEFAULT_LIST_SIZES = (10, 100, 1000)
+
+
+async def register_user(client: httpx.AsyncClient) -> Dict[str, Any]:
+    """Register a new user and return its id, email, password and auth headers."""
+    email = f"bench-{uuid.uuid4().hex[:12]}@example.com"
+    response = await client.post("/api/v1/register", json={
+        "email": email, "password": PASSWORD, "confirm_password": PASSWORD, "name": "Benchmark"
+    })
+    response.raise_for_status()
+    body = response.json()
+    return {
+        "id": body["id"],
+        "email": email,
+        "password": PASSWORD,
+        "headers": {"Authorization": f"Bearer {body['token']}"},
+    }
+
+
+async def seed_tasks(client: httpx.AsyncClient, user: Dict[str, Any], count: int) -> List[str]:
+    """Import count tasks for user through the bulk import endpoint and return their IDs."""
+    if count:
+        lines = ["title,description,completed,priority"]
+        lines += [f"Seeded task {i},Seeded for the benchmark,{i % 3 == 0},{PRIORITIES[i % 3]}" for i in range(count)]
+        response = await client.post(
+            f"/api/v1/users/{user['id']}/tasks/import",
+            content="\n".join(lines).encode(),
+            headers={**user["headers"], "Content-Type": "text/csv"}
+        )
+        response.raise_for_status()
+    response = await client.get(f"/api/v1/users/{user['id']}/tasks", params={"limit": count}, headers=user["headers"])
+    response.raise_for_status()
+    return [task["id"] for task in response.json()][-count:] if count else []
+
+
+def install_stub_llm(latency_ms: float = 0.0):
+    """
+    Replace the model call in AIAgentService with a canned reply.
+
+    The stub answers without tool calls after latency_ms, so chat measures the
+    endpoint's own work (auth, conversation and message writes) plus a fixed,
+    configurable model latency.
+    """
+    from src.services.ai_agent_service import AIAgentService
+
+    async def process_user_input(self, user_input: str, conversation_history: list = None) -> Dict[str, Any]:
+        if latency_ms:
+            await asyncio.sleep(latency_ms / 1000)
+        return {"response": f"Noted: {user_input}", "tool_calls": [], "tool_responses": []}
+
+    AIAgentService.process_user_input = process_user_input
+
+
+async def seed_context(client: httpx.AsyncClient) -> BenchmarkContext:
+    """Register the shared user the auth, task and chat scenarios act as."""
+    return BenchmarkContext(users=[await register_user(client)])
+
+
+def build_scenarios(list_sizes=DEFAULT_LIST_SIZES) -> List[Scenario]:
+    """
+    Build the scenarios in the order they run.
+
+    Args:
+        list_sizes (Iterable[int]): Number of tasks owned by the user of each list scenario
+
+    Returns:
+        List[Scenario]: Scenarios for register, login, task CRUD, each list size and chat
+    """
+    def tasks_url(user):
+        return f"/api/v1/users/{user['id']}/tasks"
+
+    async def register(client, context, i):
+        email = f"bench-{uuid.uuid4().hex[:12]}@example.com"
+        return await client.post("/api/v1/register", json={
+            "email": email, "password": PASSWORD, "confirm_password": PASSWORD, "name": "Benchmark"
+        })
+
+    async def login(client, context, i):
+        user = context.users[0]
+        return await client.post("/api/v1/login", json={"email": user["email"], "password": user["password"]})
+
+    async def create_task(client, context, i):
+        user = context.users[0]
+        return await client.post(tasks_url(user), json={"title": f"Task {i}", "priority": "high"}, headers=user["headers"])
+
+    async def existing_tasks(client, context, count):
+        user = context.users[0]
+        return user, await seed_tasks(client, user, min(count, 100))
+
+    async def deletable_tasks(client, context, count):
+        user = context.users[0]
+        return user, await seed_tasks(client, user, count)
+
+    async def get_task(client, state, i):
+        user, task_ids = state
+        return await client.get(f"{tasks_url(user)}/{task_ids[i % len(task_ids)]}", headers=user["headers"])
+
+    async def update_task(client, state, i):
+        user, task_ids = state
+        return await client.put(
+            f"{tasks_url(user)}/{task_ids[i % len(task_ids)]}", json={"title": f"Updated {i}"}, headers=user["headers"]
+        )
+
+    async def toggle_task(client, state, i):
+        user, task_ids = state
+        return await client.patch(f"{tasks_url(user)}/{task_ids[i % len(task_ids)]}/toggle", headers=user["headers"])
+
+    async def delete_task(client, state, i):
+        user, task_ids = state
+        return await client.delete(f"{tasks_url(user)}/{task_ids[i]}", headers=user["headers"])
+
+    async def chat(client, context, i):
+        user = context.users[0]
+        return await client.post(f"/api/{user['id']}/chat", json={"message": f"Remind me about item {i}"}, headers=user["headers"])
+
+    scenarios = [
+        Scenario("register", register),
+        Scenario("login", login),
+        Scenario("task_create", create_task, expected_status=201),
+        Scenario("task_get", get_task, setup=existing_tasks),
+        Scenario("task_update", update_task, setup=existing_tasks),
+        Scenario("task_toggle", toggle_task, setup=existing_tasks),
+        Scenario("task_delete", delete_task, setup=deletable_tasks, expected_status=204),
+    ]
+
+    for size in list_sizes:
+        async def list_user(client, context, count, size=size):
+            # A user of their own, so the list size is exact
+            user = await register_user(client)
+            await seed_tasks(client, user, size)
+            return user
+
+        async def list_tasks(client, user, i, size=size):
+            return await client.get(tasks_url(user), params={"limit": size}, headers=user["headers"])
+
+        scenarios.append(Scenario(f"list_{size}", list_tasks, setup=list_user))
+
+    scenarios.append(Scenario("chat", chat))
+    return scenarios
@@ -0,0 +1,190 @@
+"""
+Benchmark: database time and round trips of one chat turn.
+
+A turn stores the user's message, runs the agent's tools and stores the
+assistant's reply. The agent is stubbed to call add_task (--write-tools times)
+and then list_tasks, so only the persistence differs between the two flows:
+
+    separate     the previous chat_endpoint: the new conversation, the user message
+                 and the assistant message are each committed, and every tool opens
+                 its own session and commits
+    unit-of-work the current chat_endpoint: the conversation and user message are
+                 committed together, and the tools run inside share_transaction so
+                 their writes commit with the assistant message
+
+Both flows run in process on the async engine, on a SQLite file. A delay is added
+to every statement, commit, rollback and pool checkout (--rtt-ms) to stand in for
+the round trips to a serverless Postgres such as Neon; the checkout delay is the
+pool's pre-ping, and rollbacks end the read-only sessions.
+
+Usage:
+    python benchmarks/bench_chat_turn.py
+    python benchmarks/bench_chat_turn.py --turns 100 --rtt-ms 5 --write-tools 3
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+# Settings are required at import time; the benchmark uses its own SQLite file
+for name in ("DATABASE_URL", "NEON_DB_URL"):
+    os.environ.setdefault(name, "sqlite://")
+for name in ("BETTER_AUTH_SECRET", "BETTER_AUTH_URL", "SECRET_KEY"):
+    os.environ.setdefault(name, "benchmark")
+
+from sqlalchemy import event  # noqa: E402
+from sqlmodel import SQLModel  # noqa: E402
+from src.config.settings import settings  # noqa: E402
+from src.database import connection  # noqa: E402
+from src.database.session import get_async_db_session, share_transaction  # noqa: E402
+from src.mcp_server.server import load_tools  # noqa: E402
+from src.models.conversation import ConversationCreate  # noqa: E402
+from src.models.message import Message  # noqa: E402
+from src.services.async_conversation_service import AsyncConversationService  # noqa: E402
+
+
+class RoundTrips:
+    """Engine listeners that delay and count statements, commits, rollbacks and checkouts."""
+
+    def __init__(self, engine, rtt: float):
+        self.statements = self.commits = self.rollbacks = self.checkouts = 0
+
+        @event.listens_for(engine, "before_cursor_execute")
+        def statement(conn, cursor, statement, parameters, context, executemany):
+            self.statements += 1
+            time.sleep(rtt)
+
+        @event.listens_for(engine, "commit")
+        def commit(conn):
+            self.commits += 1
+            time.sleep(rtt)
+
+        @event.listens_for(engine, "rollback")
+        def rollback(conn):
+            self.rollbacks += 1
+            time.sleep(rtt)
+
+        @event.listens_for(engine.pool, "checkout")
+        def checkout(dbapi_connection, connection_record, connection_proxy):
+            self.checkouts += 1
+            time.sleep(rtt)
+
+    def snapshot(self):
+        return self.statements, self.commits, self.rollbacks, self.checkouts
+
+
+async def run_tools(tools, user_id: str, turn: int, write_tools: int):
+    results = []
+    for i in range(write_tools):
+        results.append(await tools["add_task"](user_id=user_id, title=f"Turn {turn} task {i}"))
+    results.append(await tools["list_tasks"](user_id=user_id))
+    assert all(result["success"] for result in results)
+    return results
+
+
+async def separate_turn(tools, user_id: str, conversation_id, turn: int, write_tools: int):
+    service = AsyncConversationService()
+    async with get_async_db_session(user_id) as db:
+        if conversation_id is None:
+            conversation = await service.create_conversation(ConversationCreate(user_id=user_id), db)
+            conversation_id = conversation.id
+        db.add(Message(conversation_id=conversation_id, sender="user", content=f"Message {turn}"))
+        await db.commit()
+
+        await run_tools(tools, user_id, turn, write_tools)
+
+        db.add(Message(conversation_id=conversation_id, sender="assistant", content="Done"))
+        await db.commit()
+    return conversation_id
+
+
+async def unit_of_work_turn(tools, user_id: str, conversation_id, turn: int, write_tools: int):
+    service = AsyncConversationService()
+    async with get_async_db_session(user_id) as db:
+        if conversation_id is None:
+            conversation = await service.create_conversation(ConversationCreate(user_id=user_id), db, commit=False)
+            conversation_id = conversation.id
+        db.add(Message(conversation_id=conversation_id, sender="user", content=f"Message {turn}"))
+        await db.commit()
+
+        with share_transaction(db):
+            await run_tools(tools, user_id, turn, write_tools)
+
+        db.add(Message(conversation_id=conversation_id, sender="assistant", content="Done"))
+        await db.commit()
+    return conversation_id
+
+
+FLOWS = {"separate": separate_turn, "unit-of-work": unit_of_work_turn}
+
+
+async def run_flow(flow: str, url: str, args) -> dict:
+    settings.NEON_DB_URL = url
+    await connection.dispose_engines()
+    engine = connection.get_async_engine()
+    async with engine.begin() as conn:
+        await conn.run_sync(SQLModel.metadata.create_all)
+    trips = RoundTrips(engine.sync_engine, args.rtt_ms / 1000)
+    tools = load_tools()
+    turn_function = FLOWS[flow]
+
+    durations = []
+    conversation_id = None
+    before = trips.snapshot()
+    for turn in range(args.turns):
+        # Every --conversation-length turns the user starts a new conversation
+        if turn % args.conversation_length == 0:
+            conversation_id = None
+        started = time.perf_counter()
+        conversation_id = await turn_function(tools, f"user-{flow}", conversation_id, turn, args.write_tools)
+        durations.append(time.perf_counter() - started)
+    statements, commits, rollbacks, checkouts = (after - start for after, start in zip(trips.snapshot(), before))
+    await connection.dispose_engines()
+
+    return {
+        "mean ms": statistics.mean(durations) * 1000,
+        "p95 ms": statistics.quantiles(durations, n=20)[-1] * 1000,
+        "statements": statements / args.turns,
+        "commits": commits / args.turns,
+        "rollbacks": rollbacks / args.turns,
+        "checkouts": checkouts / args.turns,
+        "round trips": (statements + commits + rollbacks + checkouts) / args.turns,
+    }
+
+
+async def run(args) -> dict:
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for flow in FLOWS:
+            results[flow] = await run_flow(flow, f"sqlite:///{os.path.join(tmp_dir, flow + '.db')}", args)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--turns", type=int, default=200, help="Chat turns per flow")
+    parser.add_argument("--conversation-length", type=int, default=5, help="Turns per conversation")
+    parser.add_argument("--write-tools", type=int, default=1, help="add_task calls per turn, before one list_tasks")
+    parser.add_argument("--rtt-ms", type=float, default=2.0, help="Delay per statement, commit, rollback and pool checkout")
+    args = parser.parse_args()
+    logging.disable(logging.CRITICAL)
+
+    results = asyncio.run(run(args))
+
+    print(f"\n{args.turns} turns, {args.write_tools} write tool(s) + list_tasks per turn, "
+          f"{args.conversation_length} turns per conversation, {args.rtt_ms:g} ms per round trip\n")
+    columns = ["mean ms", "p95 ms", "statements", "commits", "rollbacks", "checkouts", "round trips"]
+    print(f"{'flow':<14}" + "".join(f"{column:>12}" for column in columns))
+    for flow, values in results.items():
+        print(f"{flow:<14}" + "".join(f"{values[column]:>12.1f}" for column in columns))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,158 @@
+"""
+Benchmark: cold start to first response.
+
+Starts the app under uvicorn in a fresh process several times and measures, from
+process spawn:
+
+    import main     time to import the app module (in a separate process)
+    first /health   time until the server answers its first request
+    first DB        time until a request that touches the database (register) succeeds
+
+Pass --baseline-ref to run the same measurement on another commit, checked out
+with git archive into a temporary directory, for a before/after comparison:
+
+    python benchmarks/bench_cold_start.py --baseline-ref HEAD~1
+
+By default each run gets a fresh temporary SQLite database, where connecting is
+nearly free; point --database-url at a Neon database to include the network
+round trips a Hugging Face Space pays on startup.
+
+Usage:
+    python benchmarks/bench_cold_start.py
+    python benchmarks/bench_cold_start.py --runs 10 --baseline-ref HEAD~1
+"""
+
+import argparse
+import json
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import tarfile
+import tempfile
+import time
+import urllib.error
+import urllib.request
+import uuid
+
+BACKEND_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
+
+def export_ref(ref: str, destination: str) -> str:
+    """Extract the backend directory at ref into destination and return its path."""
+    top_level, prefix = subprocess.check_output(
+        ["git", "rev-parse", "--show-toplevel", "--show-prefix"], cwd=BACKEND_DIR, text=True
+    ).splitlines()
+    archive = os.path.join(destination, "source.tar")
+    subprocess.check_call(["git", "archive", "--format=tar", "-o", archive, f"{ref}:{prefix.rstrip('/')}"], cwd=top_level)
+    source_dir = os.path.join(destination, "backend")
+    with tarfile.open(archive) as tar:
+        tar.extractall(source_dir, filter="data")
+    return source_dir
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def request(url: str, body: dict = None) -> int:
+    """Send a GET (or a JSON POST if body is given) and return the status code, 0 if unreachable."""
+    data = json.dumps(body).encode() if body is not None else None
+    req = urllib.request.Request(url, data=data, headers={"Content-Type": "application/json"} if data else {})
+    try:
+        with urllib.request.urlopen(req, timeout=30) as response:
+            return response.status
+    except urllib.error.HTTPError as e:
+        return e.code
+    except (urllib.error.URLError, ConnectionError):
+        return 0
+
+
+def app_environment(database_url: str) -> dict:
+    env = dict(os.environ)
+    env.update({
+        "DATABASE_URL": database_url,
+        "NEON_DB_URL": database_url,
+        "OPEN_ROUTER_API_KEY": "",
+        "LOG_LEVEL": "WARNING",
+    })
+    for name in ("BETTER_AUTH_SECRET", "BETTER_AUTH_URL", "SECRET_KEY"):
+        env.setdefault(name, "benchmark-secret-key-with-at-least-32-bytes")
+    return env
+
+
+def measure_import(source_dir: str, env: dict) -> float:
+    """Return the seconds a fresh interpreter spends importing main."""
+    code = "import time; started = time.perf_counter(); import main; print(time.perf_counter() - started)"
+    output = subprocess.check_output([sys.executable, "-c", code], cwd=source_dir, env=env, stderr=subprocess.DEVNULL, text=True)
+    return float(output.strip().splitlines()[-1])
+
+
+def measure_startup(source_dir: str, env: dict, timeout: float = 60.0):
+    """Spawn uvicorn and return (seconds to first /health response, seconds to first successful DB request)."""
+    port = free_port()
+    base_url = f"http://127.0.0.1:{port}"
+    started = time.perf_counter()
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "main:app", "--host", "127.0.0.1", "--port", str(port), "--log-level", "warning"],
+        cwd=source_dir, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    try:
+        while request(f"{base_url}/health") != 200:
+            if server.poll() is not None or time.perf_counter() - started > timeout:
+                raise RuntimeError(f"Server in {source_dir} did not start")
+            time.sleep(0.005)
+        first_response = time.perf_counter() - started
+
+        email = f"cold-start-{uuid.uuid4().hex[:12]}@example.com"
+        status = request(f"{base_url}/api/v1/register", {
+            "email": email, "password": "benchmark", "confirm_password": "benchmark", "name": "Cold Start"
+        })
+        if status != 200:
+            raise RuntimeError(f"Register returned {status}")
+        first_db_response = time.perf_counter() - started
+        return first_response, first_db_response
+    finally:
+        server.terminate()
+        server.wait()
+
+
+def run(label: str, source_dir: str, args) -> dict:
+    samples = {"import main": [], "first /health": [], "first DB request": []}
+    for i in range(args.runs):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            env = app_environment(args.database_url or f"sqlite:///{os.path.join(tmp_dir, 'cold.db')}")
+            samples["import main"].append(measure_import(source_dir, env))
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            env = app_environment(args.database_url or f"sqlite:///{os.path.join(tmp_dir, 'cold.db')}")
+            first_response, first_db_response = measure_startup(source_dir, env)
+            samples["first /health"].append(first_response)
+            samples["first DB request"].append(first_db_response)
+        print(f"  {label}: run {i + 1}/{args.runs} done", file=sys.stderr)
+    return {name: statistics.median(values) for name, values in samples.items()}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5, help="Cold starts per tree (the median is reported)")
+    parser.add_argument("--baseline-ref", help="Git ref to compare against, e.g. HEAD~1")
+    parser.add_argument("--database-url", help="Database to start against instead of a fresh SQLite file per run")
+    args = parser.parse_args()
+
+    results = {}
+    with tempfile.TemporaryDirectory() as checkout_dir:
+        if args.baseline_ref:
+            results[args.baseline_ref] = run(args.baseline_ref, export_ref(args.baseline_ref, checkout_dir), args)
+        results["working tree"] = run("working tree", BACKEND_DIR, args)
+
+    print(f"\nMedian of {args.runs} cold starts, seconds from process spawn\n")
+    print(f"{'':<18}" + "".join(f"{label:>16}" for label in results))
+    for metric in ("import main", "first /health", "first DB request"):
+        print(f"{metric:<18}" + "".join(f"{values[metric]:>16.3f}" for values in results.values()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+"""
+Benchmark: logging overhead per task CRUD request.
+
+Drives the FastAPI app in process against a temporary SQLite database and runs
+create, get, update, toggle and delete requests for one user. Each round is
+repeated with logging disabled (the baseline) and with each logging mode writing
+to os.devnull:
+
+    development  LOG_FORMAT=rich, LOG_LEVEL=DEBUG, written synchronously
+    production   LOG_FORMAT=json, LOG_LEVEL=INFO, LOG_QUEUE=true
+    sampled      as production, but LOG_LEVEL=DEBUG with LOG_DEBUG_SAMPLE_RATE=0.01
+
+The overhead of a mode is its best round's mean request time minus the baseline's. Modes are
+interleaved round by round so drift in the machine affects them equally.
+
+Usage:
+    python benchmarks/bench_logging.py
+    python benchmarks/bench_logging.py --rounds 10 --iterations 100
+"""
+
+import argparse
+import logging
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+# Settings are read when main is imported, so point the app at a throwaway database first
+TMP_DIR = tempfile.mkdtemp()
+for name in ("DATABASE_URL", "NEON_DB_URL"):
+    os.environ[name] = f"sqlite:///{os.path.join(TMP_DIR, 'bench.db')}"
+for name in ("BETTER_AUTH_SECRET", "BETTER_AUTH_URL", "SECRET_KEY"):
+    os.environ.setdefault(name, "benchmark")
+# Keep startup logs out of the output
+logging.disable(logging.CRITICAL)
+
+from fastapi.testclient import TestClient  # noqa: E402
+from src.utils import logging_config  # noqa: E402
+import main  # noqa: E402
+
+
+MODES = {
+    "development": dict(log_format="rich", level="DEBUG", use_queue=False, debug_sample_rate=1.0),
+    "production": dict(log_format="json", level="INFO", use_queue=True, debug_sample_rate=1.0),
+    "sampled": dict(log_format="json", level="DEBUG", use_queue=True, debug_sample_rate=0.01),
+}
+
+REQUESTS_PER_ITERATION = 5
+
+
+def crud_iteration(client: TestClient, user_id: str, headers: dict):
+    """Create, read, update, toggle and delete one task."""
+    tasks_url = f"/api/v1/users/{user_id}/tasks"
+    task_id = client.post(tasks_url, json={"title": "Benchmark task", "priority": "high"}, headers=headers).json()["id"]
+    client.get(f"{tasks_url}/{task_id}", headers=headers)
+    client.put(f"{tasks_url}/{task_id}", json={"title": "Renamed task"}, headers=headers)
+    client.patch(f"{tasks_url}/{task_id}/toggle", headers=headers)
+    client.delete(f"{tasks_url}/{task_id}", headers=headers)
+
+
+def timed_round(client: TestClient, user_id: str, headers: dict, iterations: int) -> float:
+    """Run iterations CRUD cycles and return the mean seconds per request."""
+    started = time.perf_counter()
+    for _ in range(iterations):
+        crud_iteration(client, user_id, headers)
+    return (time.perf_counter() - started) / (iterations * REQUESTS_PER_ITERATION)
+
+
+def main_benchmark():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rounds", type=int, default=5, help="Interleaved rounds per mode")
+    parser.add_argument("--iterations", type=int, default=50, help="CRUD cycles per round")
+    args = parser.parse_args()
+
+    # Entering the client runs the app's lifespan, which creates the tables
+    with TestClient(main.app) as client:
+        run_rounds(client, args)
+
+
+def run_rounds(client: TestClient, args):
+    """Time every mode against the logging-disabled baseline and print the results."""
+    registration = client.post("/api/v1/register", json={
+        "email": "bench@example.com", "password": "benchmark", "confirm_password": "benchmark", "name": "Bench"
+    }).json()
+    user_id = registration["id"]
+    headers = {"Authorization": f"Bearer {registration['token']}"}
+
+    devnull = open(os.devnull, "w")
+    timings = {name: [] for name in ("disabled", *MODES)}
+    try:
+        # Warm up connections, caches and code paths
+        timed_round(client, user_id, headers, args.iterations)
+
+        for _ in range(args.rounds):
+            logging.disable(logging.CRITICAL)
+            timings["disabled"].append(timed_round(client, user_id, headers, args.iterations))
+            logging.disable(logging.NOTSET)
+            for name, options in MODES.items():
+                logging_config.configure_logging(stream=devnull, **options)
+                timings[name].append(timed_round(client, user_id, headers, args.iterations))
+                # Drain the queue outside the measurement
+                logging_config.stop_logging()
+    finally:
+        logging_config.stop_logging()
+        devnull.close()
+        shutil.rmtree(TMP_DIR, ignore_errors=True)
+
+    baseline = min(timings["disabled"])
+    print(f"{args.rounds} rounds x {args.iterations * REQUESTS_PER_ITERATION} CRUD requests per mode (best round)\n")
+    print(f"{'mode':<14} {'per request':>12} {'logging overhead':>18}")
+    for name, values in timings.items():
+        best = min(values)
+        overhead = "" if name == "disabled" else f"{(best - baseline) * 1e6:+13.0f} us {(best - baseline) / baseline:+6.1%}"
+        print(f"{name:<14} {best * 1e3:>9.3f} ms {overhead:>18}")
+
+
+if __name__ == "__main__":
+    main_benchmark()
@@ -0,0 +1,168 @@
+"""
+Benchmark: request throughput under concurrent load for each connection pool mode.
+
+Worker threads repeatedly check out a connection, run one query and commit, the
+shape of a typical API request. Each mode builds its engine from the same
+get_pool_options() the application uses, with the DB_POOL_* settings below:
+
+    queue+pre-ping  DB_POOL_MODE=queue, DB_POOL_PRE_PING=true (the default)
+    queue           DB_POOL_MODE=queue, DB_POOL_PRE_PING=false
+    null            DB_POOL_MODE=null, a new connection per checkout (pooling left to PgBouncer)
+
+SQLite is local, so a delay is added to every statement and commit (--rtt-ms) and
+to every new connection (--connect-ms, TCP + TLS + authentication) to stand in for
+a serverless Postgres such as Neon. The pre-ping SELECT 1 pays the statement delay
+too. Run with more --threads than DB_POOL_SIZE + DB_MAX_OVERFLOW to see checkout
+waits.
+
+Usage:
+    python benchmarks/bench_pool_modes.py
+    python benchmarks/bench_pool_modes.py --threads 50 --rtt-ms 5 --connect-ms 40
+"""
+
+import argparse
+import logging
+import os
+import sqlite3
+import statistics
+import sys
+import tempfile
+import threading
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+# Settings are required at import time; the benchmark uses its own SQLite file
+for name in ("DATABASE_URL", "NEON_DB_URL"):
+    os.environ.setdefault(name, "sqlite://")
+for name in ("BETTER_AUTH_SECRET", "BETTER_AUTH_URL", "SECRET_KEY"):
+    os.environ.setdefault(name, "benchmark")
+
+from sqlalchemy import create_engine, text  # noqa: E402
+from src.config.settings import settings  # noqa: E402
+from src.database.pool import get_pool_options, get_pool_stats  # noqa: E402
+
+
+MODES = {
+    "queue+pre-ping": {"DB_POOL_MODE": "queue", "DB_POOL_PRE_PING": True},
+    "queue": {"DB_POOL_MODE": "queue", "DB_POOL_PRE_PING": False},
+    "null": {"DB_POOL_MODE": "null"},
+}
+
+
+class NetworkSimulation:
+    """sqlite3 connection factory that sleeps to simulate connection setup and round trips."""
+
+    def __init__(self, path: str, rtt: float, connect_delay: float):
+        self.path = path
+        self.connects = 0
+        self._lock = threading.Lock()
+
+        class SlowCursor(sqlite3.Cursor):
+            def execute(self, *args, **kwargs):
+                time.sleep(rtt)
+                return super().execute(*args, **kwargs)
+
+        class SlowConnection(sqlite3.Connection):
+            def cursor(self, factory=SlowCursor):
+                return super().cursor(factory)
+
+            def commit(self):
+                time.sleep(rtt)
+                return super().commit()
+
+            def rollback(self):
+                # The pool rolls back on every return; a driver only sends it inside a transaction
+                if self.in_transaction:
+                    time.sleep(rtt)
+                return super().rollback()
+
+        self.connection_class = SlowConnection
+        self.connect_delay = connect_delay
+
+    def connect(self):
+        with self._lock:
+            self.connects += 1
+        time.sleep(self.connect_delay)
+        return sqlite3.connect(self.path, factory=self.connection_class, check_same_thread=False)
+
+
+def create_database(path: str):
+    with sqlite3.connect(path) as conn:
+        conn.execute("CREATE TABLE item (id INTEGER PRIMARY KEY, title TEXT)")
+        conn.executemany("INSERT INTO item (title) VALUES (?)", [(f"item {i}",) for i in range(100)])
+
+
+def run_mode(mode: str, path: str, args) -> dict:
+    for name, value in {**MODES[mode], "DB_POOL_SIZE": args.pool_size, "DB_MAX_OVERFLOW": args.max_overflow}.items():
+        setattr(settings, name, value)
+    network = NetworkSimulation(path, args.rtt_ms / 1000, args.connect_ms / 1000)
+    engine = create_engine("sqlite://", creator=network.connect, **get_pool_options())
+
+    latencies = []
+    latencies_lock = threading.Lock()
+    deadline = time.perf_counter() + args.duration
+
+    def worker():
+        local = []
+        while time.perf_counter() < deadline:
+            started = time.perf_counter()
+            with engine.connect() as conn:
+                conn.execute(text("SELECT title FROM item WHERE id = :id"), {"id": len(local) % 100 + 1}).all()
+                conn.commit()
+            local.append(time.perf_counter() - started)
+        with latencies_lock:
+            latencies.extend(local)
+
+    started = time.perf_counter()
+    threads = [threading.Thread(target=worker) for _ in range(args.threads)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+
+    stats = get_pool_stats(engine)
+    engine.dispose()
+    latencies.sort()
+    return {
+        "requests/s": len(latencies) / elapsed,
+        "p50 ms": statistics.median(latencies) * 1000,
+        "p95 ms": latencies[int(len(latencies) * 0.95)] * 1000,
+        "avg wait ms": stats["wait_seconds_avg"] * 1000,
+        "max wait ms": stats["wait_seconds_max"] * 1000,
+        "connects": network.connects,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--threads", type=int, default=32, help="Concurrent workers")
+    parser.add_argument("--duration", type=float, default=5.0, help="Seconds to run each mode")
+    parser.add_argument("--rtt-ms", type=float, default=2.0, help="Simulated round trip per statement and commit")
+    parser.add_argument("--connect-ms", type=float, default=30.0, help="Simulated cost of opening a connection")
+    parser.add_argument("--pool-size", type=int, default=settings.DB_POOL_SIZE)
+    parser.add_argument("--max-overflow", type=int, default=settings.DB_MAX_OVERFLOW)
+    parser.add_argument("--mode", action="append", choices=list(MODES), help="Only run this mode (repeatable)")
+    args = parser.parse_args()
+    logging.disable(logging.CRITICAL)
+
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, "pool.db")
+        create_database(path)
+        for mode in args.mode or MODES:
+            results[mode] = run_mode(mode, path, args)
+
+    print(
+        f"\n{args.threads} threads for {args.duration:g}s, pool {args.pool_size}+{args.max_overflow}, "
+        f"rtt {args.rtt_ms:g} ms, connect {args.connect_ms:g} ms\n"
+    )
+    columns = ["requests/s", "p50 ms", "p95 ms", "avg wait ms", "max wait ms", "connects"]
+    print(f"{'mode':<16}" + "".join(f"{column:>13}" for column in columns))
+    for mode, values in results.items():
+        print(f"{mode:<16}" + "".join(f"{values[column]:>13.1f}" for column in columns[:-1]) + f"{values['connects']:>13}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+"""
+Benchmark: SQLite write throughput with many concurrent threads.
+
+Writer threads create tasks through TaskService.create_task while reader threads
+page through task lists, the way the FastAPI threadpool drives a SQLite
+deployment. Two engines are compared on a fresh database file each:
+
+    plain   create_engine(url): rollback journal, synchronous=FULL, SQLAlchemy defaults
+    profile create_db_engine() with the SQLite profile: WAL, synchronous=NORMAL,
+            busy_timeout, cache_size, mmap_size, foreign_keys and a queue pool
+
+Writes that fail with "database is locked" are counted, not retried.
+
+Usage:
+    python benchmarks/bench_sqlite_concurrency.py
+    python benchmarks/bench_sqlite_concurrency.py --writers 1 --readers 8 --duration 10
+"""
+
+import argparse
+import logging
+import os
+import sys
+import tempfile
+import threading
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+# Settings are required at import time; each engine gets its own SQLite file
+for name in ("DATABASE_URL", "NEON_DB_URL"):
+    os.environ.setdefault(name, "sqlite://")
+for name in ("BETTER_AUTH_SECRET", "BETTER_AUTH_URL", "SECRET_KEY"):
+    os.environ.setdefault(name, "benchmark")
+
+from sqlalchemy.exc import OperationalError  # noqa: E402
+from sqlmodel import Session, SQLModel, create_engine, select  # noqa: E402
+from src.config.settings import settings  # noqa: E402
+from src.database.connection import create_db_engine  # noqa: E402
+from src.models.task import Task, TaskCreate  # noqa: E402
+from src.services.task_service import TaskService  # noqa: E402
+
+
+def build_engine(profile: str, url: str):
+    if profile == "plain":
+        return create_engine(url)
+    settings.NEON_DB_URL = url
+    return create_db_engine()
+
+
+def run_profile(profile: str, url: str, args) -> dict:
+    engine = build_engine(profile, url)
+    SQLModel.metadata.create_all(engine)
+
+    counts = {"writes": 0, "reads": 0, "locked": 0}
+    counts_lock = threading.Lock()
+    deadline = time.perf_counter() + args.duration
+
+    def writer(index: int):
+        writes = locked = 0
+        while time.perf_counter() < deadline:
+            try:
+                with Session(engine) as db:
+                    TaskService.create_task(TaskCreate(title=f"Task {writes}", user_id=f"user-{index % 8}"), db)
+                writes += 1
+            except OperationalError:
+                locked += 1
+        with counts_lock:
+            counts["writes"] += writes
+            counts["locked"] += locked
+
+    def reader(index: int):
+        reads = locked = 0
+        while time.perf_counter() < deadline:
+            try:
+                with Session(engine) as db:
+                    db.exec(select(Task).where(Task.user_id == f"user-{index % 8}").limit(50)).all()
+                reads += 1
+            except OperationalError:
+                locked += 1
+        with counts_lock:
+            counts["reads"] += reads
+            counts["locked"] += locked
+
+    threads = [threading.Thread(target=writer, args=(i,)) for i in range(args.writers)]
+    threads += [threading.Thread(target=reader, args=(i,)) for i in range(args.readers)]
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+    engine.dispose()
+
+    return {
+        "writes/s": counts["writes"] / elapsed,
+        "reads/s": counts["reads"] / elapsed,
+        "locked errors": counts["locked"],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--writers", type=int, default=32, help="Threads inserting tasks")
+    parser.add_argument("--readers", type=int, default=0, help="Threads listing tasks alongside the writers")
+    parser.add_argument("--duration", type=float, default=5.0, help="Seconds to run each profile")
+    args = parser.parse_args()
+    logging.disable(logging.CRITICAL)
+
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for profile in ("plain", "profile"):
+            results[profile] = run_profile(profile, f"sqlite:///{os.path.join(tmp_dir, profile + '.db')}", args)
+
+    print(f"\n{args.writers} writer and {args.readers} reader threads for {args.duration:g}s\n")
+    columns = ["writes/s", "reads/s", "locked errors"]
+    print(f"{'engine':<10}" + "".join(f"{column:>15}" for column in columns))
+    for profile, values in results.items():
+        print(f"{profile:<10}" + "".join(f"{values[column]:>15.1f}" for column in columns))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+"""
+Benchmark: bulk task import versus one create_task call per task.
+
+Imports a generated CSV of --rows tasks through ImportService (streamed parsing,
+chunked executemany in one transaction on SQLite) and compares it with the
+previous onboarding path, which called TaskService.create_task for every task
+(one INSERT, COMMIT and refresh each). The per-task path is timed on --legacy-rows
+tasks and extrapolated, since running it for 100k rows takes minutes.
+
+PostgreSQL imports use COPY instead of executemany; point --async-url at a
+postgresql+asyncpg:// database to measure that path.
+
+Usage:
+    python benchmarks/bench_task_import.py
+    python benchmarks/bench_task_import.py --rows 20000 --legacy-rows 500
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+# Settings are required at import time; the benchmark uses its own SQLite file
+for name in ("DATABASE_URL", "NEON_DB_URL"):
+    os.environ.setdefault(name, "sqlite://")
+for name in ("BETTER_AUTH_SECRET", "BETTER_AUTH_URL", "SECRET_KEY"):
+    os.environ.setdefault(name, "benchmark")
+
+from sqlalchemy import create_engine, func, select  # noqa: E402
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine  # noqa: E402
+from sqlalchemy.orm import Session  # noqa: E402
+from src.models.task import Task, TaskCreate  # noqa: E402
+from src.services.import_service import ImportService  # noqa: E402
+from src.services.task_service import TaskService  # noqa: E402
+
+
+USER_ID = "bench-user"
+PRIORITIES = ("low", "medium", "high")
+
+
+def build_csv(rows: int) -> bytes:
+    """Generate a CSV upload with a header and rows tasks."""
+    lines = ["title,description,completed,priority"]
+    for i in range(rows):
+        lines.append(f'Imported task {i},"Description for task {i}, from another tool",{i % 4 == 0},{PRIORITIES[i % 3]}')
+    return ("\n".join(lines) + "\n").encode()
+
+
+async def iter_chunks(body: bytes, chunk_size: int = 64 * 1024):
+    """Yield the body in request-sized chunks, as an ASGI server would."""
+    for start in range(0, len(body), chunk_size):
+        yield body[start:start + chunk_size]
+
+
+async def bulk_import(url: str, body: bytes):
+    """Import body through ImportService and return (elapsed seconds, response)."""
+    engine = create_async_engine(url)
+    try:
+        async with AsyncSession(engine, expire_on_commit=False) as db:
+            started = time.perf_counter()
+            response = await ImportService.import_tasks(USER_ID, iter_chunks(body), "csv", db)
+            return time.perf_counter() - started, response
+    finally:
+        await engine.dispose()
+
+
+def legacy_import(engine, rows: int) -> float:
+    """Create rows tasks one create_task call at a time and return the elapsed seconds."""
+    started = time.perf_counter()
+    with Session(engine) as db:
+        for i in range(rows):
+            TaskService.create_task(
+                TaskCreate(title=f"Legacy task {i}", description="From another tool", priority=PRIORITIES[i % 3], user_id=USER_ID),
+                db
+            )
+    return time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=100_000, help="Rows in the imported CSV")
+    parser.add_argument("--legacy-rows", type=int, default=2_000, help="Tasks created one by one for the baseline")
+    parser.add_argument("--async-url", help="Async database URL to import into (defaults to a temporary SQLite file)")
+    args = parser.parse_args()
+
+    # Keep log formatting out of the measurement
+    logging.disable(logging.CRITICAL)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        db_path = os.path.join(tmp_dir, "bench.db")
+        engine = create_engine(f"sqlite:///{db_path}")
+        Task.__table__.create(engine)
+
+        body = build_csv(args.rows)
+        print(f"Importing {args.rows:,} tasks ({len(body) / 1024 / 1024:.1f} MiB CSV)\n")
+
+        legacy_seconds = legacy_import(engine, args.legacy_rows)
+        legacy_rate = args.legacy_rows / legacy_seconds
+        print(f"{'create_task per row':<28} {legacy_rate:12,.0f} rows/s   "
+              f"(~{args.rows / legacy_rate:,.1f} s for {args.rows:,} rows, extrapolated from {args.legacy_rows:,})")
+
+        bulk_seconds, response = asyncio.run(bulk_import(args.async_url or f"sqlite+aiosqlite:///{db_path}", body))
+        bulk_rate = response.imported / bulk_seconds
+        print(f"{'streaming bulk import':<28} {bulk_rate:12,.0f} rows/s   "
+              f"({bulk_seconds:,.1f} s, {response.imported:,} imported, {response.failed} rejected)")
+
+        if not args.async_url:
+            with engine.connect() as conn:
+                stored = conn.execute(select(func.count()).select_from(Task.__table__)).scalar_one()
+            print(f"\nRows in tasks table: {stored:,}")
+        print(f"{bulk_rate / legacy_rate:.1f}x faster")
+
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,156 @@
+"""
+Benchmark: task query plans and latency before/after the task indexes.
+
+Seeds a throwaway SQLite database with tasks spread across many users, then runs
+the hot TaskService / MCP tool predicates twice: once with only the primary key,
+and once with the indexes declared on the Task model (see migration 0002).
+
+Usage:
+    python benchmarks/bench_task_indexes.py              # 1,000,000 tasks
+    python benchmarks/bench_task_indexes.py --tasks 100000 --users 1000
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+import uuid
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from sqlalchemy import create_engine, text  # noqa: E402
+from src.models.task import Task  # noqa: E402
+
+
+QUERIES = {
+    "list page (ORDER BY created_at, id)": (
+        "SELECT * FROM tasks WHERE user_id = :user_id ORDER BY created_at, id LIMIT 100"
+    ),
+    "keyset page (created_at, id) > cursor": (
+        "SELECT * FROM tasks WHERE user_id = :user_id AND (created_at, id) > (:created_at, :id) "
+        "ORDER BY created_at, id LIMIT 100"
+    ),
+    "pending tasks": (
+        "SELECT * FROM tasks WHERE user_id = :user_id AND completed = 0 ORDER BY created_at LIMIT 100"
+    ),
+    "completed filter": "SELECT * FROM tasks WHERE user_id = :user_id AND completed = 1",
+    "priority filter": "SELECT * FROM tasks WHERE user_id = :user_id AND priority = 'high'",
+    "get by id + user": "SELECT * FROM tasks WHERE id = :id AND user_id = :user_id",
+}
+
+
+def seed(engine, task_count: int, user_count: int):
+    """Create the tasks table and insert task_count rows across user_count users."""
+    Task.__table__.create(engine)
+    user_ids = [str(uuid.uuid4()) for _ in range(user_count)]
+    start = datetime(2025, 1, 1)
+    priorities = ["low", "medium", "high"]
+    rng = random.Random(42)
+
+    insert = text(
+        "INSERT INTO tasks (id, title, description, completed, priority, user_id, created_at, updated_at) "
+        "VALUES (:id, :title, NULL, :completed, :priority, :user_id, :created_at, :created_at)"
+    )
+    batch = []
+    with engine.begin() as conn:
+        for i in range(task_count):
+            created_at = start + timedelta(seconds=i)
+            batch.append({
+                "id": str(uuid.uuid4()),
+                "title": f"Task {i}",
+                "completed": rng.random() < 0.6,
+                "priority": rng.choice(priorities),
+                "user_id": rng.choice(user_ids),
+                "created_at": created_at,
+            })
+            if len(batch) == 10000:
+                conn.execute(insert, batch)
+                batch = []
+        if batch:
+            conn.execute(insert, batch)
+    return user_ids
+
+
+def drop_indexes(engine):
+    """Drop every secondary index on the tasks table."""
+    with engine.begin() as conn:
+        for index in Task.__table__.indexes:
+            conn.execute(text(f"DROP INDEX IF EXISTS {index.name}"))
+        conn.execute(text("ANALYZE"))
+
+
+def create_indexes(engine):
+    """Create the indexes declared on the Task model."""
+    for index in Task.__table__.indexes:
+        index.create(engine)
+    with engine.begin() as conn:
+        conn.execute(text("ANALYZE"))
+
+
+def sample_params(engine, user_ids, rng):
+    """Pick a user and one of their tasks to use as the cursor / lookup target."""
+    user_id = rng.choice(user_ids)
+    with engine.connect() as conn:
+        row = conn.execute(
+            text("SELECT id, created_at FROM tasks WHERE user_id = :user_id LIMIT 1"),
+            {"user_id": user_id}
+        ).first()
+    return {"user_id": user_id, "id": row.id, "created_at": row.created_at}
+
+
+def run_queries(engine, param_sets, label: str):
+    """Print the plan and the mean latency of every query."""
+    print(f"\n=== {label} ===")
+    results = {}
+    with engine.connect() as conn:
+        for name, sql in QUERIES.items():
+            plan = conn.execute(text(f"EXPLAIN QUERY PLAN {sql}"), param_sets[0]).fetchall()
+            started = time.perf_counter()
+            for params in param_sets:
+                conn.execute(text(sql), params).fetchall()
+            elapsed_ms = (time.perf_counter() - started) * 1000 / len(param_sets)
+            results[name] = elapsed_ms
+            print(f"{name:<42} {elapsed_ms:9.3f} ms")
+            for step in plan:
+                print(f"    plan: {step[-1]}")
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tasks", type=int, default=1_000_000, help="Number of tasks to seed")
+    parser.add_argument("--users", type=int, default=10_000, help="Number of users to spread tasks across")
+    parser.add_argument("--samples", type=int, default=50, help="Queries per predicate")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        engine = create_engine(f"sqlite:///{os.path.join(tmp_dir, 'bench.db')}")
+
+        print(f"Seeding {args.tasks:,} tasks across {args.users:,} users...")
+        started = time.perf_counter()
+        user_ids = seed(engine, args.tasks, args.users)
+        print(f"Seeded in {time.perf_counter() - started:.1f}s")
+
+        rng = random.Random(7)
+        param_sets = [sample_params(engine, user_ids, rng) for _ in range(args.samples)]
+
+        drop_indexes(engine)
+        before = run_queries(engine, param_sets, "Before: primary key only")
+
+        started = time.perf_counter()
+        create_indexes(engine)
+        print(f"\nIndexes built in {time.perf_counter() - started:.1f}s")
+        after = run_queries(engine, param_sets, "After: task query indexes")
+
+        print("\n=== Speedup ===")
+        for name in QUERIES:
+            print(f"{name:<42} {before[name] / max(after[name], 1e-9):9.1f}x")
+
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+"""
+Benchmark: per-mutation latency of TaskService update/toggle/delete.
+
+Compares the previous SELECT -> mutate -> COMMIT -> refresh pattern with the
+single-statement UPDATE/DELETE ... RETURNING paths in TaskService. SQLite is
+local, so a configurable delay is added to every statement and commit to stand in
+for the network round trip to a serverless Postgres such as Neon.
+
+Usage:
+    python benchmarks/bench_task_mutations.py
+    python benchmarks/bench_task_mutations.py --rtt-ms 20 --iterations 100
+"""
+
+import argparse
+import logging
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+# Settings are required at import time; the benchmark uses its own SQLite file
+for name in ("DATABASE_URL", "NEON_DB_URL"):
+    os.environ.setdefault(name, "sqlite://")
+for name in ("BETTER_AUTH_SECRET", "BETTER_AUTH_URL", "SECRET_KEY"):
+    os.environ.setdefault(name, "benchmark")
+
+from sqlalchemy import create_engine, event  # noqa: E402
+from sqlalchemy.orm import Session  # noqa: E402
+from src.models.task import Task, TaskCreate, TaskUpdate, TaskRead  # noqa: E402
+from src.services.task_service import TaskService  # noqa: E402
+
+
+USER_ID = "bench-user"
+
+
+class RoundTripCounter:
+    """Counts statements and commits, sleeping rtt seconds for each to simulate network latency."""
+
+    def __init__(self, engine, rtt: float):
+        self.rtt = rtt
+        self.count = 0
+        event.listen(engine, "before_cursor_execute", self._round_trip)
+        event.listen(engine, "commit", self._round_trip)
+
+    def _round_trip(self, *args, **kwargs):
+        self.count += 1
+        if self.rtt:
+            time.sleep(self.rtt)
+
+
+def legacy_update(task_id: str, task_update: TaskUpdate, db: Session) -> TaskRead:
+    """The previous update_task implementation: SELECT, mutate, COMMIT, refresh."""
+    db_task = db.query(Task).filter(Task.id == task_id, Task.user_id == USER_ID).first()
+    for field, value in task_update.model_dump(exclude_unset=True).items():
+        setattr(db_task, field, value)
+    db.commit()
+    db.refresh(db_task)
+    return TaskRead.model_validate(db_task, from_attributes=True)
+
+
+def legacy_toggle(task_id: str, db: Session) -> TaskRead:
+    """The previous toggle_task_completion implementation."""
+    db_task = db.query(Task).filter(Task.id == task_id, Task.user_id == USER_ID).first()
+    db_task.completed = not db_task.completed
+    db.commit()
+    db.refresh(db_task)
+    return TaskRead.model_validate(db_task, from_attributes=True)
+
+
+def legacy_delete(task_id: str, db: Session) -> bool:
+    """The previous delete_task implementation."""
+    db_task = db.query(Task).filter(Task.id == task_id, Task.user_id == USER_ID).first()
+    db.delete(db_task)
+    db.commit()
+    return True
+
+
+def measure(engine, counter, label: str, operation, task_ids):
+    """Run operation once per task ID in a fresh session and report mean latency and round trips."""
+    counter.count = 0
+    started = time.perf_counter()
+    for task_id in task_ids:
+        with Session(engine) as db:
+            operation(task_id, db)
+    elapsed_ms = (time.perf_counter() - started) * 1000 / len(task_ids)
+    round_trips = counter.count / len(task_ids)
+    print(f"{label:<32} {elapsed_ms:9.3f} ms/op   {round_trips:4.1f} round trips/op")
+    return elapsed_ms
+
+
+def seed(engine, count: int):
+    """Create count tasks and return their IDs."""
+    with Session(engine) as db:
+        return [
+            TaskService.create_task(TaskCreate(title=f"Task {i}", user_id=USER_ID), db).id
+            for i in range(count)
+        ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rtt-ms", type=float, default=5.0, help="Simulated round-trip time per statement/commit")
+    parser.add_argument("--iterations", type=int, default=200, help="Mutations per measurement")
+    args = parser.parse_args()
+
+    # Keep log formatting out of the measurement
+    logging.disable(logging.CRITICAL)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        engine = create_engine(f"sqlite:///{os.path.join(tmp_dir, 'bench.db')}")
+        Task.__table__.create(engine)
+        task_ids = seed(engine, args.iterations * 2)
+        legacy_ids, new_ids = task_ids[:args.iterations], task_ids[args.iterations:]
+
+        counter = RoundTripCounter(engine, args.rtt_ms / 1000)
+        print(f"Simulated round-trip time: {args.rtt_ms} ms, {args.iterations} mutations each\n")
+
+        rows = [
+            ("update", lambda t, db: legacy_update(t, TaskUpdate(title="Renamed"), db),
+             lambda t, db: TaskService.update_task(t, USER_ID, TaskUpdate(title="Renamed"), db)),
+            ("toggle", legacy_toggle,
+             lambda t, db: TaskService.toggle_task_completion(t, USER_ID, db)),
+            ("delete", legacy_delete,
+             lambda t, db: TaskService.delete_task(t, USER_ID, db)),
+        ]
+        for name, legacy_op, new_op in rows:
+            before = measure(engine, counter, f"{name}: select/commit/refresh", legacy_op, legacy_ids)
+            after = measure(engine, counter, f"{name}: single statement", new_op, new_ids)
+            print(f"{name}: {before / max(after, 1e-9):.2f}x faster\n")
+
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""
+Benchmark: loading and serializing a large task list.
+
+Compares the previous read path (ORM Task objects -> dict -> validated TaskRead ->
+response_model validation -> JSON) with the fast path used by the task list
+endpoint (Core SELECT of the TaskRead columns -> row mappings -> JSON bytes).
+
+Usage:
+    python benchmarks/bench_task_serialization.py
+    python benchmarks/bench_task_serialization.py --tasks 50000 --repeat 5
+"""
+
+import argparse
+import logging
+import os
+import sys
+import tempfile
+import time
+from typing import List
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+# Settings are required at import time; the benchmark uses its own SQLite file
+for name in ("DATABASE_URL", "NEON_DB_URL"):
+    os.environ.setdefault(name, "sqlite://")
+for name in ("BETTER_AUTH_SECRET", "BETTER_AUTH_URL", "SECRET_KEY"):
+    os.environ.setdefault(name, "benchmark")
+os.environ.setdefault("TASK_CACHE_ENABLED", "false")
+
+from pydantic import TypeAdapter  # noqa: E402
+from sqlalchemy import create_engine, insert  # noqa: E402
+from sqlalchemy.orm import Session  # noqa: E402
+from src.models.task import Task, TaskRead, get_current_time  # noqa: E402
+from src.services.task_service import TaskService  # noqa: E402
+
+
+USER_ID = "bench-user"
+RESPONSE_ADAPTER = TypeAdapter(List[TaskRead])
+
+
+def legacy_read(db: Session) -> bytes:
+    """The previous path: ORM load, copy to dict, TaskRead, then response_model validation."""
+    tasks = []
+    for db_task in db.query(Task).filter(Task.user_id == USER_ID).all():
+        tasks.append(TaskRead(**{
+            'id': db_task.id,
+            'title': db_task.title,
+            'description': db_task.description,
+            'completed': db_task.completed,
+            'priority': db_task.priority,
+            'user_id': db_task.user_id,
+            'created_at': db_task.created_at,
+            'updated_at': db_task.updated_at
+        }))
+    # FastAPI validates the returned objects against response_model, then serializes
+    validated = RESPONSE_ADAPTER.validate_python([task.model_dump() for task in tasks])
+    return RESPONSE_ADAPTER.dump_json(validated)
+
+
+def fast_read(db: Session) -> bytes:
+    """The fast path: Core row mappings straight to JSON bytes."""
+    return TaskService.serialize_task_rows(TaskService.get_task_rows(USER_ID, db, limit=None))
+
+
+def measure(engine, label: str, read, repeat: int) -> float:
+    """Run read repeat times and return the best wall time in milliseconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        with Session(engine) as db:
+            started = time.perf_counter()
+            payload = read(db)
+            best = min(best, (time.perf_counter() - started) * 1000)
+    print(f"{label:<38} {best:9.1f} ms   {len(payload) / 1024:8.0f} KiB")
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tasks", type=int, default=10_000, help="Number of tasks to serialize")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per path (best time is reported)")
+    args = parser.parse_args()
+
+    # Keep log formatting out of the measurement
+    logging.disable(logging.CRITICAL)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        engine = create_engine(f"sqlite:///{os.path.join(tmp_dir, 'bench.db')}")
+        Task.__table__.create(engine)
+        now = get_current_time()
+        with engine.begin() as conn:
+            conn.execute(insert(Task.__table__), [
+                {
+                    "id": f"task-{i:08d}",
+                    "title": f"Task {i}",
+                    "description": "Benchmark task description",
+                    "completed": i % 3 == 0,
+                    "priority": "medium",
+                    "user_id": USER_ID,
+                    "created_at": now,
+                    "updated_at": now
+                }
+                for i in range(args.tasks)
+            ])
+
+        print(f"Serializing {args.tasks:,} tasks (best of {args.repeat})\n")
+        before = measure(engine, "ORM + TaskRead + response_model", legacy_read, args.repeat)
+        after = measure(engine, "Core rows -> JSON bytes", fast_read, args.repeat)
+        print(f"\n{before / max(after, 1e-9):.2f}x faster")
+
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,18 @@
+import os
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+# Settings are read when src is first imported. Tests use TEST_DATABASE_URL or a throwaway
+# SQLite file, never the database configured in the environment or .env
+_database_url = os.environ.get("TEST_DATABASE_URL") or f"sqlite:///{os.path.join(tempfile.mkdtemp(prefix='todo-tests-'), 'test.db')}"
+for name in ("DATABASE_URL", "NEON_DB_URL"):
+    os.environ[name] = _database_url
+for name in ("NEON_ASYNC_DB_URL", "NEON_READ_DB_URL", "OPEN_ROUTER_API_KEY", "OPENAI_API_KEY"):
+    os.environ[name] = ""
+for name in ("BETTER_AUTH_SECRET", "BETTER_AUTH_URL", "SECRET_KEY"):
+    os.environ.setdefault(name, "test-secret-key-with-at-least-32-bytes")
+os.environ.setdefault("LOG_LEVEL", "WARNING")
+
+pytest_plugins = ["pytest_query_budget"]
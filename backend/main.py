@@ -1,20 +1,56 @@
+import asyncio
 import logging
-from fastapi import FastAPI
+from contextlib import asynccontextmanager
+from fastapi import Depends, FastAPI, Response, status
 from fastapi.middleware.cors import CORSMiddleware
 from src.api.v1.endpoints import tasks
+from src.api.v1.endpoints.export import router as export_router
 from src.api.v1.endpoints.auth import router as auth_router
 from src.api.chat_endpoint import router as chat_router
+from src.auth.dependencies import require_internal_access
 from src.config.settings import settings
-from src.database.connection import create_tables
+from src.database.connection import create_tables, dispose_engines, get_engine, get_pooled_engines, ping_database
+from src.database.pool import get_pool_stats
+from src.database.write_marker import WRITE_MARKER_HEADER, WriteMarkerMiddleware
+from src.services.task_cache import task_cache
 from src.utils.logging_config import get_logger
+from src.utils.metrics import MetricsMiddleware, install_metrics, register_pool_metrics, registry
 
 # Configure logging
 logger = get_logger(__name__)
 
-# Create tables on startup
-logger.info("Creating database tables on startup...")
-create_tables()
-logger.info("Database tables created successfully")
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Connect to the database when the server starts and release it when it stops.
+
+    Nothing here runs on import, so scripts, tests and workers that import the app
+    only pay for the database once it is actually served. The blocking engine work
+    runs in a thread to keep the event loop free.
+    """
+    app.state.ready = False
+    app.state.database_reachable = False
+
+    if settings.METRICS_ENABLED:
+        install_metrics()
+
+    logger.info("Connecting to the database on startup...")
+    await asyncio.to_thread(get_engine)
+    app.state.database_reachable = await asyncio.to_thread(ping_database)
+    if not app.state.database_reachable:
+        logger.warning("Warning: Could not establish database connection")
+    elif settings.CREATE_TABLES_ON_STARTUP:
+        logger.info("Creating database tables on startup...")
+        await asyncio.to_thread(create_tables)
+        logger.info("Database tables created successfully")
+
+    app.state.ready = True
+    yield
+
+    app.state.ready = False
+    await dispose_engines()
+
 
 # Create FastAPI app instance
 app = FastAPI(
@@ -23,7 +59,8 @@ app = FastAPI(
     version="1.0.0",
     openapi_url="/api/openapi.json",
     docs_url="/api/docs",
-    redoc_url="/api/redoc"
+    redoc_url="/api/redoc",
+    lifespan=lifespan
 )
 
 # Add CORS middleware
@@ -33,12 +70,24 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
-    # Expose authorization header to allow frontend to access JWT tokens
-    expose_headers=["Authorization"]
+    # Expose authorization header to allow frontend to access JWT tokens,
+    # the keyset pagination cursor for the task list, ETags for conditional GETs,
+    # the export file name and the read-your-writes marker
+    expose_headers=["Authorization", "X-Next-Cursor", "ETag", "Content-Disposition", WRITE_MARKER_HEADER]
 )
 
+# Carry each user's last write between requests, so any worker keeps their reads off a lagging replica
+app.add_middleware(WriteMarkerMiddleware)
+
+# Record per-route latency and SQL work for /metrics
+if settings.METRICS_ENABLED:
+    app.add_middleware(MetricsMiddleware)
+    register_pool_metrics(get_pooled_engines)
+
 # Include API routes
 app.include_router(tasks.router, prefix="/api/v1", tags=["tasks"])
+# Include data export routes
+app.include_router(export_router, prefix="/api/v1", tags=["export"])
 # Include authentication routes
 app.include_router(auth_router, prefix="/api/v1", tags=["authentication"])
 # Include chat routes
@@ -50,4 +99,37 @@ def read_root():
 
 @app.get("/health")
 def health_check():
-    return {"status": "healthy", "service": "todo-backend"}
\ No newline at end of file
+    return {"status": "healthy", "service": "todo-backend"}
+
+@app.get("/ready")
+def readiness_check(response: Response):
+    """
+    Report whether the app can serve traffic: startup has finished and the database is reachable.
+
+    The database is only pinged again while it was unreachable, so frequent probes
+    do not keep a scale-to-zero database awake.
+    """
+    if getattr(app.state, "ready", False) and not app.state.database_reachable:
+        app.state.database_reachable = ping_database()
+        if app.state.database_reachable and settings.CREATE_TABLES_ON_STARTUP:
+            create_tables()
+
+    if not (getattr(app.state, "ready", False) and app.state.database_reachable):
+        response.status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+        return {"status": "not ready", "database": getattr(app.state, "database_reachable", False)}
+    return {"status": "ready", "database": True}
+
+@app.get("/cache/stats", dependencies=[Depends(require_internal_access)])
+def cache_stats():
+    """Report task read cache hit ratio, evictions and size."""
+    return task_cache.stats()
+
+@app.get("/db/pool/stats", dependencies=[Depends(require_internal_access)])
+def pool_stats():
+    """Report connection pool occupancy, overflow and checkout wait times per engine."""
+    return {name: get_pool_stats(engine) for name, engine in get_pooled_engines().items()}
+
+@app.get("/metrics", include_in_schema=False, dependencies=[Depends(require_internal_access)])
+def metrics():
+    """Expose request, database, LLM and MCP tool metrics in the Prometheus text format."""
+    return Response(registry.render(), media_type=registry.content_type)
@@ -0,0 +1,203 @@
+"""
+pytest plugin: per-route SQL query budgets.
+
+Every SQL statement run while a request is handled is attributed to that request
+through SQLAlchemy engine events. At the end of each test that used the
+budget_client fixture, the statements and database time of each request are
+compared with the budget declared for its route in query_budgets.toml:
+
+    ["GET /api/v1/users/{user_id}/tasks"]
+    max_queries = 2
+    max_db_ms = 50      # optional; wall-clock budgets are noisier than counts
+
+Requests over budget fail the test and list the statements they ran, which makes
+N+1 patterns (the same SELECT repeated per row) easy to spot. Routes without a
+budget are not checked; pass --query-budget-report to print the worst case seen
+for every route, e.g. when adding a budget.
+
+Enabled from conftest.py with: pytest_plugins = ["pytest_query_budget"]
+"""
+
+import contextvars
+import os
+import time
+import tomllib
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+
+DEFAULT_BUDGETS_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "query_budgets.toml")
+
+
+@dataclass
+class QueryBudget:
+    """Limits for one route; None means unlimited."""
+    max_queries: Optional[int] = None
+    max_db_ms: Optional[float] = None
+
+
+@dataclass
+class RequestQueries:
+    """SQL statements run while handling one request."""
+    method: str
+    path: str
+    route: Optional[str] = None
+    statements: List[str] = field(default_factory=list)
+    seconds: float = 0.0
+
+    @property
+    def key(self) -> str:
+        return f"{self.method} {self.route or self.path}"
+
+
+# Set by QueryRecorder for the duration of a request; threadpool and greenlet
+# workers run in a copy of the request's context and so append to the same object
+_current_request: contextvars.ContextVar[Optional[RequestQueries]] = contextvars.ContextVar("query_budget_request", default=None)
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if _current_request.get() is not None:
+        conn.info.setdefault("query_budget_start", []).append(time.perf_counter())
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    request = _current_request.get()
+    if request is not None and conn.info.get("query_budget_start"):
+        request.seconds += time.perf_counter() - conn.info["query_budget_start"].pop()
+        request.statements.append(statement)
+
+
+@event.listens_for(Engine, "handle_error")
+def _handle_error(exception_context):
+    # A failed statement never reaches after_cursor_execute, so drop its start time
+    connection = exception_context.connection
+    if connection is not None and connection.info.get("query_budget_start"):
+        connection.info["query_budget_start"].pop()
+
+
+class QueryRecorder:
+    """ASGI middleware recording the SQL statements of each HTTP request."""
+
+    def __init__(self, app):
+        self.app = app
+        self.requests: List[RequestQueries] = []
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request = RequestQueries(method=scope["method"], path=scope["path"])
+        token = _current_request.set(request)
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            _current_request.reset(token)
+            # The router stores the matched route in the scope, so budgets use its template
+            request.route = getattr(scope.get("route"), "path", None)
+            self.requests.append(request)
+
+
+def load_budgets(path: str = DEFAULT_BUDGETS_FILE) -> Dict[str, QueryBudget]:
+    """
+    Read route budgets from a TOML file.
+
+    Args:
+        path (str): File with one table per "METHOD /route/{template}"
+
+    Returns:
+        Dict[str, QueryBudget]: Budgets by route key
+
+    Raises:
+        ValueError: If a table has keys other than max_queries and max_db_ms
+    """
+    with open(path, "rb") as f:
+        data = tomllib.load(f)
+    budgets = {}
+    for key, limits in data.items():
+        unknown = set(limits) - {"max_queries", "max_db_ms"}
+        if unknown:
+            raise ValueError(f"Unknown budget settings for {key}: {', '.join(sorted(unknown))}")
+        budgets[key] = QueryBudget(**limits)
+    return budgets
+
+
+def find_violations(requests: List[RequestQueries], budgets: Dict[str, QueryBudget]) -> List[str]:
+    """
+    Compare recorded requests with their route budgets.
+
+    Args:
+        requests (List[RequestQueries]): Recorded requests
+        budgets (Dict[str, QueryBudget]): Budgets by route key
+
+    Returns:
+        List[str]: One description per request over budget, including its statements
+    """
+    violations = []
+    for request in requests:
+        budget = budgets.get(request.key)
+        if budget is None:
+            continue
+        problems = []
+        if budget.max_queries is not None and len(request.statements) > budget.max_queries:
+            problems.append(f"{len(request.statements)} queries > budget {budget.max_queries}")
+        if budget.max_db_ms is not None and request.seconds * 1000 > budget.max_db_ms:
+            problems.append(f"{request.seconds * 1000:.1f} ms in the database > budget {budget.max_db_ms:g} ms")
+        if problems:
+            statements = "\n".join(f"    {i}. {' '.join(s.split())}" for i, s in enumerate(request.statements, 1))
+            violations.append(f"{request.key} ({request.path}): {'; '.join(problems)}\n{statements}")
+    return violations
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("query-budget")
+    group.addoption("--query-budgets", default=DEFAULT_BUDGETS_FILE, help="TOML file of per-route SQL query budgets")
+    group.addoption("--query-budget-report", action="store_true", help="Print the most queries and DB time seen per route")
+
+
+def pytest_configure(config):
+    config._query_budget_worst: Dict[str, RequestQueries] = {}
+
+
+@pytest.fixture(scope="session")
+def query_budgets(pytestconfig) -> Dict[str, QueryBudget]:
+    return load_budgets(pytestconfig.getoption("--query-budgets"))
+
+
+@pytest.fixture
+def budget_client(pytestconfig, query_budgets):
+    """TestClient for the app whose requests must stay within their query budgets."""
+    from fastapi.testclient import TestClient
+    import main
+
+    recorder = QueryRecorder(main.app)
+    with TestClient(recorder) as client:
+        client.recorder = recorder
+        yield client
+
+    worst = pytestconfig._query_budget_worst
+    for request in recorder.requests:
+        if request.key not in worst or len(request.statements) > len(worst[request.key].statements):
+            worst[request.key] = request
+
+    violations = find_violations(recorder.requests, query_budgets)
+    if violations:
+        pytest.fail("SQL query budget exceeded:\n" + "\n".join(violations), pytrace=False)
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    if not config.getoption("--query-budget-report") or not config._query_budget_worst:
+        return
+    budgets = load_budgets(config.getoption("--query-budgets"))
+    terminalreporter.section("SQL queries per route (worst request)")
+    for key in sorted(config._query_budget_worst):
+        request = config._query_budget_worst[key]
+        budget = budgets.get(key)
+        limit = f"budget {budget.max_queries}" if budget and budget.max_queries is not None else "no budget"
+        terminalreporter.write_line(f"{len(request.statements):>4} queries {request.seconds * 1000:>8.1f} ms  {key}  ({limit})")
@@ -3,7 +3,7 @@ Script to register MCP tools with the server
 """
 from src.mcp_server.server import mcp_server
 # Import tools to register them - they register themselves when imported
-from src.mcp_server.tools import add_task, list_tasks, complete_task, update_task, delete_task
+from src.mcp_server.tools import add_task, list_tasks, complete_task, update_task, delete_task, search_tasks, task_stats
 
 def register_all_tools():
     """Register all MCP tools with the server"""
@@ -1,12 +1,17 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, Header, HTTPException, Response
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlmodel import Session
 from typing import Optional
-from src.database.session import get_session
+from src.config.settings import settings
+from src.database.session import get_async_session, get_read_session, share_transaction
+from src.services.async_conversation_service import AsyncConversationService
 from src.services.conversation_service import ConversationService
 from src.services.ai_agent_service import AIAgentService
+from src.services.task_cache import task_cache
 from src.models.message import Message, MessageCreate
 from src.models.conversation import ConversationCreate
 from src.auth.dependencies import get_current_user_id
+from src.utils.helpers import make_weak_etag, etag_matches
 from pydantic import BaseModel
 import os
 from src.utils.logging_config import get_logger
@@ -32,12 +37,16 @@ class ChatResponse(BaseModel):
 async def chat_endpoint(
     user_id: str,
     request: ChatRequest,
-    db_session: Session = Depends(get_session),
+    db_session: AsyncSession = Depends(get_async_session),
     current_user_id: str = Depends(get_current_user_id)
 ):
     """
     Process a chat message and return AI response.
 
+    The turn is persisted in two transactions: the new conversation (if any) and
+    the user's message, then the assistant's message with its tool data. With
+    MCP_TOOLS_IN_PROCESS the tools' writes join the second transaction.
+
     Args:
         user_id: The authenticated user's ID (must match current_user)
         request: Contains the user's message and optional conversation_id
@@ -52,10 +61,10 @@ async def chat_endpoint(
         logger.warning(f"Unauthorized access attempt: path user_id={user_id}, authenticated user_id={current_user_id}")
         raise HTTPException(status_code=403, detail="Forbidden: User ID mismatch")
 
-    logger.debug(f"User authentication verified for user: {user_id}")
+    logger.debug("User authentication verified for user: %s", user_id)
 
     # Initialize services
-    conversation_service = ConversationService()
+    conversation_service = AsyncConversationService()
     ai_agent_service = AIAgentService(openrouter_api_key=os.getenv("OPEN_ROUTER_API_KEY"))
     ai_agent_service.initialize_agent_with_tools()  # Initialize with MCP tools
     logger.debug("AI agent service initialized with tools")
@@ -64,7 +73,7 @@ async def chat_endpoint(
     conversation = None
     if request.conversation_id:
         logger.info(f"Retrieving existing conversation: {request.conversation_id}")
-        conversation = conversation_service.get_conversation_by_id(request.conversation_id, db_session)
+        conversation = await conversation_service.get_conversation_by_id(request.conversation_id, db_session)
         if not conversation:
             logger.error(f"Conversation not found: {request.conversation_id}")
             raise HTTPException(status_code=404, detail="Conversation not found")
@@ -76,11 +85,12 @@ async def chat_endpoint(
         # Create new conversation
         logger.info(f"Creating new conversation for user: {user_id}")
         conversation_data = ConversationCreate(user_id=user_id)
-        conversation = conversation_service.create_conversation(conversation_data, db_session)
+        # Flushed for its ID; committed together with the user message below
+        conversation = await conversation_service.create_conversation(conversation_data, db_session, commit=False)
         logger.info(f"New conversation created: {conversation.id}")
 
     # Create and save user message
-    logger.debug(f"Saving user message to conversation: {conversation.id}")
+    logger.debug("Saving user message to conversation: %s", conversation.id)
     user_message = Message(
         conversation_id=conversation.id,
         sender='user',
@@ -89,20 +99,22 @@ async def chat_endpoint(
         tool_responses=None  # Explicitly set to None for user messages
     )
     db_session.add(user_message)
-    db_session.commit()
-    logger.debug(f"User message saved to conversation: {conversation.id}")
+    await db_session.commit()
+    logger.debug("User message saved to conversation: %s", conversation.id)
 
-    # Process the message with the AI agent
+    # Process the message with the AI agent; in-process tools write in this session's
+    # next transaction, which is only begun when the first tool runs a statement
     logger.info(f"Processing AI request for user: {user_id}, conversation: {conversation.id}")
-    result = await ai_agent_service.process_natural_language_request(
-        user_input=request.message,
-        user_id=user_id,
-        conversation_id=conversation.id
-    )
+    with share_transaction(db_session):
+        result = await ai_agent_service.process_natural_language_request(
+            user_input=request.message,
+            user_id=user_id,
+            conversation_id=conversation.id
+        )
     logger.info(f"AI processing completed for user: {user_id}, conversation: {conversation.id}")
 
-    # Create and save AI response message
-    logger.debug(f"Saving AI response to conversation: {conversation.id}")
+    # Create and save AI response message, committing the tools' writes with it
+    logger.debug("Saving AI response to conversation: %s", conversation.id)
     ai_message = Message(
         conversation_id=conversation.id,
         sender='assistant',
@@ -111,8 +123,12 @@ async def chat_endpoint(
         tool_responses=result.get("tool_responses") if result.get("tool_responses") else None
     )
     db_session.add(ai_message)
-    db_session.commit()
-    logger.debug(f"AI response saved to conversation: {conversation.id}")
+    await db_session.commit()
+    if settings.MCP_TOOLS_IN_PROCESS and result.get("tool_calls"):
+        # The tools invalidated the cache before their writes were committed, so a
+        # read in between may have cached the old rows
+        task_cache.invalidate(user_id)
+    logger.debug("AI response saved to conversation: %s", conversation.id)
 
     logger.info(f"Chat endpoint completed for user: {user_id}, conversation: {conversation.id}")
     return ChatResponse(
@@ -128,11 +144,17 @@ async def chat_endpoint(
 def get_conversation(
     user_id: str,
     conversation_id: int,
-    db_session: Session = Depends(get_session),
+    response: Response,
+    if_none_match: Optional[str] = Header(default=None),
+    db_session: Session = Depends(get_read_session),
     current_user_id: str = Depends(get_current_user_id)
 ):
     """
     Retrieve a specific conversation with its messages.
+
+    Supports conditional GETs: the weak ETag is derived from the conversation row
+    and its message count and latest timestamp, and a matching If-None-Match
+    returns 304 Not Modified without serializing the conversation.
     """
     logger.info(f"Retrieving conversation {conversation_id} for user: {user_id}")
 
@@ -152,5 +174,13 @@ def get_conversation(
         logger.warning(f"Access denied: Conversation {conversation_id} does not belong to user {user_id}")
         raise HTTPException(status_code=403, detail="Access denied: Conversation does not belong to user")
 
+    message_count, last_message_at = conversation_service.get_conversation_fingerprint(conversation_id, db_session)
+    etag = make_weak_etag(conversation.id, conversation.title, conversation.updated_at, message_count, last_message_at)
+    if etag_matches(if_none_match, etag):
+        logger.debug("Conversation %s not modified for user: %s", conversation_id, user_id)
+        return Response(status_code=304, headers={"ETag": etag})
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = "private, no-cache"
+
     logger.info(f"Conversation {conversation_id} retrieved successfully for user: {user_id}")
     return conversation
\ No newline at end of file
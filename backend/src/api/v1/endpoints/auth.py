@@ -4,7 +4,7 @@ from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.orm import Session
 from ....models.user import UserCreate, UserResponse, UserLogin
 from ....services.user_service import UserService
-from ....database.session import get_session
+from ....database.session import get_read_db_session, get_session
 from ....auth.jwt_handler import create_access_token
 from ....config.settings import settings
 from ....utils.logging_config import get_logger
@@ -50,7 +50,7 @@ def register_user(
         access_token = create_access_token(
             data=token_data, expires_delta=access_token_expires
         )
-        logger.debug(f"JWT token generated for user: {user.id}")
+        logger.debug("JWT token generated for user: %s", user.id)
 
         # Return user data with token
         logger.info(f"User registration completed successfully for: {user.email}")
@@ -112,7 +112,7 @@ def login_user(
         access_token = create_access_token(
             data=token_data, expires_delta=access_token_expires
         )
-        logger.debug(f"JWT token generated for user: {user.id}")
+        logger.debug("JWT token generated for user: %s", user.id)
 
         # Return user data with token
         logger.info(f"Login completed successfully for: {user.email}")
@@ -148,15 +148,16 @@ def logout_user():
 
 @router.get("/profile", response_model=UserResponse)
 def get_profile(
-    credentials: HTTPAuthorizationCredentials = Depends(security),
-    db: Session = Depends(get_session)
+    credentials: HTTPAuthorizationCredentials = Depends(security)
 ):
     """
     Get current user profile.
 
+    The user is read from the replica, or from the primary right after the user
+    registered or changed, so the session is opened once the token is verified.
+
     Args:
         credentials (HTTPAuthorizationCredentials): Bearer token from Authorization header
-        db (Session): Database session
 
     Returns:
         UserResponse: Current user data
@@ -176,9 +177,10 @@ def get_profile(
             detail="Could not validate credentials"
         )
 
-    logger.debug(f"Token validated for user ID: {user_id}")
+    logger.debug("Token validated for user ID: %s", user_id)
 
-    user = UserService.get_user_by_id(user_id, db)
+    with get_read_db_session(user_id) as db:
+        user = UserService.get_user_by_id(user_id, db)
     if not user:
         logger.error(f"User not found for ID: {user_id}")
         raise HTTPException(
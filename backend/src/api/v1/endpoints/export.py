@@ -0,0 +1,52 @@
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
+from ....services.export_service import ExportService
+from ....auth.dependencies import get_current_user_id
+from ....utils.logging_config import get_logger
+
+
+router = APIRouter()
+logger = get_logger(__name__)
+
+
+@router.get("/users/{user_id}/export")
+def export_user_data(
+    user_id: str,
+    gzip: bool = Query(default=False, description="Compress the export as .ndjson.gz"),
+    current_user_id: str = Depends(get_current_user_id)
+):
+    """
+    Stream the authenticated user's tasks, conversations and messages as NDJSON.
+
+    The response is produced while rows are read from the database, so memory
+    stays flat regardless of how much data the user has.
+
+    Args:
+        user_id (str): User ID from the URL path
+        gzip (bool): Whether to gzip the stream
+        current_user_id (str): User ID from JWT token (via dependency)
+
+    Returns:
+        StreamingResponse: One JSON object per line, each with a "type" field
+    """
+    # Validate that the user_id in the path matches the authenticated user
+    if user_id != current_user_id:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Not authorized to access this user's data"
+        )
+
+    logger.info(f"Starting export for user: {user_id}, gzip: {gzip}")
+    content = ExportService.iter_export_lines(user_id)
+    filename = "export.ndjson"
+    media_type = "application/x-ndjson"
+    if gzip:
+        content = ExportService.gzip_chunks(content)
+        filename += ".gz"
+        media_type = "application/gzip"
+
+    return StreamingResponse(
+        content,
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'}
+    )
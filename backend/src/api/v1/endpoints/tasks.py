@@ -1,10 +1,15 @@
-from typing import List
-from fastapi import APIRouter, Depends, HTTPException, status
+from typing import List, Optional
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request, Response, status
+from pydantic_core import to_json
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from ....models.task import TaskCreate, TaskRead, TaskUpdate
+from ....models.task import TaskCreate, TaskRead, TaskUpdate, PriorityEnum
+from ....schemas.task_schemas import BatchOperationRequest, BatchOperationResponse, TaskChangesResponse, TaskImportResponse, TaskStatsResponse
+from ....services.import_service import ImportService
 from ....services.task_service import TaskService
 from ....auth.dependencies import get_current_user_id, validate_user_id_in_path
-from ....database.session import get_session
+from ....database.session import get_async_session, get_read_session, get_session
+from ....utils.helpers import make_weak_etag, etag_matches
 from ....utils.logging_config import get_logger
 
 
@@ -53,12 +58,240 @@ def create_task(
         )
 
 
+@router.post("/users/{user_id}/tasks/batch", response_model=BatchOperationResponse)
+def batch_task_operations(
+    user_id: str,
+    batch: BatchOperationRequest,
+    current_user_id: str = Depends(get_current_user_id),
+    db: Session = Depends(get_session)
+):
+    """
+    Apply several create/update/delete/toggle operations in a single transaction.
+
+    Args:
+        user_id (str): User ID from the URL path
+        batch (BatchOperationRequest): Operations to apply, in order
+        current_user_id (str): User ID from JWT token (via dependency)
+        db (Session): Database session
+
+    Returns:
+        BatchOperationResponse: Counts and per-item results
+    """
+    # Validate that the user_id in the path matches the authenticated user
+    if user_id != current_user_id:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Not authorized to access this user's data"
+        )
+
+    try:
+        return TaskService.batch_operations(user_id, batch.operations, db)
+    except HTTPException:
+        # Re-raise HTTP exceptions from the service
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error applying batch operations: {str(e)}"
+        )
+
+
+# Content types accepted by the import endpoint when ?format= is not given
+IMPORT_CONTENT_TYPES = {
+    "text/csv": "csv",
+    "application/x-ndjson": "ndjson",
+    "application/ndjson": "ndjson",
+    "application/jsonl": "ndjson",
+}
+
+
+@router.post("/users/{user_id}/tasks/import", response_model=TaskImportResponse)
+async def import_tasks(
+    user_id: str,
+    request: Request,
+    import_format: Optional[str] = Query(default=None, alias="format"),
+    current_user_id: str = Depends(get_current_user_id),
+    db: AsyncSession = Depends(get_async_session)
+):
+    """
+    Bulk-import tasks from a CSV or NDJSON request body.
+
+    The body is read, parsed and validated as it streams in. CSV needs a header row;
+    both formats use the fields title, description, completed and priority. Valid
+    rows are imported in one transaction; invalid rows are skipped and reported.
+
+    Args:
+        user_id (str): User ID from the URL path
+        request (Request): Incoming request whose body holds the tasks
+        import_format (Optional[str]): 'csv' or 'ndjson', from ?format=; defaults to the Content-Type
+        current_user_id (str): User ID from JWT token (via dependency)
+        db (AsyncSession): Async database session
+
+    Returns:
+        TaskImportResponse: Imported and failed row counts and the first errors
+    """
+    # Validate that the user_id in the path matches the authenticated user
+    if user_id != current_user_id:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Not authorized to access this user's data"
+        )
+
+    if import_format is None:
+        content_type = request.headers.get("content-type", "").split(";")[0].strip().lower()
+        import_format = IMPORT_CONTENT_TYPES.get(content_type)
+        if import_format is None:
+            raise HTTPException(
+                status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+                detail="Send text/csv or application/x-ndjson, or pass ?format=csv|ndjson"
+            )
+
+    try:
+        return await ImportService.import_tasks(user_id, request.stream(), import_format, db)
+    except HTTPException:
+        # Re-raise HTTP exceptions from the service
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error importing tasks: {str(e)}"
+        )
+
+
+@router.get("/users/{user_id}/tasks/changes", response_model=TaskChangesResponse)
+def get_task_changes(
+    user_id: str,
+    since: Optional[str] = None,
+    current_user_id: str = Depends(get_current_user_id),
+    db: Session = Depends(get_read_session)
+):
+    """
+    Delta sync: tasks created or updated, and IDs of tasks deleted, since a sync token.
+
+    Call without since for a full sync, then pass the returned next_token as
+    since on every following call to receive what changed in between. Changes
+    made shortly before the token (TASK_SYNC_OVERLAP_SECONDS) are sent again, so
+    clients apply tasks by id, skipping ones not newer than their copy.
+
+    Args:
+        user_id (str): User ID from the URL path
+        since (Optional[str]): Sync token returned by the previous call
+        current_user_id (str): User ID from JWT token (via dependency)
+        db (Session): Database session
+
+    Returns:
+        TaskChangesResponse: Changed tasks, deleted task IDs and the next sync token
+    """
+    # Validate that the user_id in the path matches the authenticated user
+    if user_id != current_user_id:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Not authorized to access this user's data"
+        )
+
+    try:
+        changes = TaskService.get_task_changes(user_id, db, since=since)
+        return Response(content=to_json(changes), media_type="application/json")
+    except HTTPException:
+        # Re-raise HTTP exceptions from the service
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error retrieving task changes: {str(e)}"
+        )
+
+
+@router.get("/users/{user_id}/tasks/search", response_model=List[TaskRead])
+def search_tasks(
+    user_id: str,
+    q: str = Query(min_length=1, max_length=200),
+    skip: int = Query(default=0, ge=0),
+    limit: int = Query(default=20, ge=1, le=100),
+    current_user_id: str = Depends(get_current_user_id),
+    db: Session = Depends(get_read_session)
+):
+    """
+    Full-text search over the authenticated user's task titles and descriptions.
+
+    Results are ranked by relevance, best match first.
+
+    Args:
+        user_id (str): User ID from the URL path
+        q (str): Search text
+        skip (int): Number of results to skip (for pagination)
+        limit (int): Maximum number of results to return (for pagination)
+        current_user_id (str): User ID from JWT token (via dependency)
+        db (Session): Database session
+
+    Returns:
+        List[TaskRead]: Matching tasks
+    """
+    # Validate that the user_id in the path matches the authenticated user
+    if user_id != current_user_id:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Not authorized to access this user's data"
+        )
+
+    try:
+        rows = TaskService.search_task_rows(user_id, q, db, skip=skip, limit=limit)
+        return Response(content=TaskService.serialize_task_rows(rows), media_type="application/json")
+    except HTTPException:
+        # Re-raise HTTP exceptions from the service
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error searching tasks: {str(e)}"
+        )
+
+
+@router.get("/users/{user_id}/tasks/stats", response_model=TaskStatsResponse)
+def get_task_stats(
+    user_id: str,
+    current_user_id: str = Depends(get_current_user_id),
+    db: Session = Depends(get_read_session)
+):
+    """
+    Summarise the authenticated user's tasks.
+
+    Counts by completion status and priority, plus the oldest pending task, are
+    computed in the database with one aggregate query.
+
+    Args:
+        user_id (str): User ID from the URL path
+        current_user_id (str): User ID from JWT token (via dependency)
+        db (Session): Database session
+
+    Returns:
+        TaskStatsResponse: Task counts and the oldest pending task
+    """
+    # Validate that the user_id in the path matches the authenticated user
+    if user_id != current_user_id:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Not authorized to access this user's data"
+        )
+
+    try:
+        return TaskService.get_task_stats(user_id, db)
+    except HTTPException:
+        # Re-raise HTTP exceptions from the service
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error retrieving task statistics: {str(e)}"
+        )
+
+
 @router.get("/users/{user_id}/tasks/{task_id}", response_model=TaskRead)
 def get_task(
     task_id: str,
     user_id: str,
     current_user_id: str = Depends(get_current_user_id),
-    db: Session = Depends(get_session)
+    db: Session = Depends(get_read_session)
 ):
     """
     Retrieve a specific task by ID for the authenticated user.
@@ -95,18 +328,41 @@ def get_task(
 def get_tasks(
     user_id: str,
     current_user_id: str = Depends(get_current_user_id),
-    skip: int = 0,
-    limit: int = 100,
-    db: Session = Depends(get_session)
+    skip: int = Query(default=0, ge=0),
+    limit: int = Query(default=100, ge=1, le=100),
+    cursor: Optional[str] = None,
+    status_filter: Optional[str] = Query(default=None, alias="status"),
+    priority: Optional[PriorityEnum] = None,
+    sort_by: str = "created_at",
+    sort_order: str = "asc",
+    if_none_match: Optional[str] = Header(default=None),
+    db: Session = Depends(get_read_session)
 ):
     """
     Retrieve all tasks for the authenticated user.
 
+    Filtering by status and priority and ordering are applied in the database.
+
+    Responses carry a weak ETag derived from the matching row count, the latest
+    updated_at and the query parameters, so it is the same on every worker. If the
+    If-None-Match header still matches, 304 Not Modified is returned without loading
+    or serializing tasks.
+
+    When more tasks may follow, the cursor for the next page is returned in the
+    X-Next-Cursor response header. Passing it back as ?cursor= switches to keyset
+    pagination, which stays fast and stable on deep pages.
+
     Args:
         user_id (str): User ID from the URL path
         current_user_id (str): User ID from JWT token (via dependency)
-        skip (int): Number of records to skip (for pagination)
-        limit (int): Maximum number of records to return (for pagination)
+        skip (int): Number of records to skip (for offset pagination)
+        limit (int): Maximum number of records to return (1-100, for pagination)
+        cursor (Optional[str]): Opaque cursor from a previous page (for keyset pagination)
+        status_filter (Optional[str]): 'all', 'pending' (or 'active') or 'completed', from ?status=
+        priority (Optional[PriorityEnum]): Only return tasks with this priority
+        sort_by (str): One of 'created_at', 'updated_at', 'priority', 'title'
+        sort_order (str): 'asc' or 'desc'
+        if_none_match (Optional[str]): ETag of the client's cached copy
         db (Session): Database session
 
     Returns:
@@ -120,7 +376,39 @@ def get_tasks(
         )
 
     try:
-        return TaskService.get_tasks(user_id, db, skip=skip, limit=limit)
+        completed = TaskService.parse_status(status_filter)
+
+        # Conditional GET: compare the client's ETag before loading any tasks
+        count, last_updated_at = TaskService.get_tasks_fingerprint(user_id, db, completed=completed, priority=priority)
+        # Only database values go into the ETag, so every worker gives unchanged data the same one
+        etag = make_weak_etag(count, last_updated_at, (skip, limit, cursor, completed, priority, sort_by, sort_order))
+        if etag_matches(if_none_match, etag):
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+        headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+
+        rows = TaskService.get_task_rows(
+            user_id,
+            db,
+            skip=skip,
+            limit=limit,
+            cursor=cursor,
+            completed=completed,
+            priority=priority,
+            sort_by=sort_by,
+            sort_order=sort_order,
+            # Cached rows are only served if they match the fingerprint the ETag was built from
+            fingerprint=(count, last_updated_at)
+        )
+        next_cursor = TaskService.get_next_cursor(rows, limit)
+        if next_cursor and sort_by == "created_at":
+            headers["X-Next-Cursor"] = next_cursor
+
+        # Rows come straight from the database, so skip response_model re-validation
+        return Response(
+            content=TaskService.serialize_task_rows(rows),
+            media_type="application/json",
+            headers=headers
+        )
     except HTTPException:
         # Re-raise HTTP exceptions from the service
         raise
@@ -1,14 +1,17 @@
+import hmac
 from fastapi import Depends, HTTPException, status, Request
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.orm import Session
 from typing import Generator
 from .jwt_handler import verify_token, get_current_user
+from ..config.settings import settings
 from ..database.session import get_session
 from ..models.task import Task
 from ..utils.logging_config import get_logger
 
 
 security = HTTPBearer()
+internal_security = HTTPBearer(auto_error=False)
 logger = get_logger(__name__)
 
 
@@ -37,7 +40,7 @@ def get_current_user_id(credentials: HTTPAuthorizationCredentials = Depends(secu
             detail="Could not validate credentials"
         )
 
-    logger.debug(f"User ID extracted from token: {user_id}")
+    logger.debug("User ID extracted from token: %s", user_id)
     return user_id
 
 
@@ -64,7 +67,7 @@ def verify_user_owns_task(
         logger.debug("No task ID provided, skipping ownership verification")
         return True
 
-    logger.debug(f"Verifying task ownership: user_id={user_id}, task_id={task_id}")
+    logger.debug("Verifying task ownership: user_id=%s, task_id=%s", user_id, task_id)
 
     # Query the task by ID
     task = db.get(Task, task_id)
@@ -83,7 +86,7 @@ def verify_user_owns_task(
             detail="Not authorized to access this task"
         )
 
-    logger.debug(f"Task ownership verified: user_id={user_id}, task_id={task_id}")
+    logger.debug("Task ownership verified: user_id=%s, task_id=%s", user_id, task_id)
     return True
 
 
@@ -97,7 +100,7 @@ def get_user_tasks_query(user_id: str = Depends(get_current_user_id)):
     Returns:
         Callable: Function that returns a filtered query
     """
-    logger.debug(f"Getting tasks query for user: {user_id}")
+    logger.debug("Getting tasks query for user: %s", user_id)
 
     def _get_filtered_query(db: Session = Depends(get_session)):
         return db.query(Task).filter(Task.user_id == user_id)
@@ -119,7 +122,7 @@ def validate_user_id_in_path(request: Request, current_user_id: str = Depends(ge
     Raises:
         HTTPException: If user IDs don't match
     """
-    logger.debug(f"Validating user ID in path against token: token_user_id={current_user_id}")
+    logger.debug("Validating user ID in path against token: token_user_id=%s", current_user_id)
 
     # Extract user_id from path
     path_user_id = request.path_params.get('user_id')
@@ -138,5 +141,32 @@ def validate_user_id_in_path(request: Request, current_user_id: str = Depends(ge
             detail="Not authorized to access this user's data"
         )
 
-    logger.debug(f"User ID validation passed: {current_user_id}")
-    return current_user_id
\ No newline at end of file
+    logger.debug("User ID validation passed: %s", current_user_id)
+    return current_user_id
+
+def require_internal_access(credentials: HTTPAuthorizationCredentials = Depends(internal_security)) -> None:
+    """
+    Dependency guarding the internal monitoring endpoints.
+
+    The endpoints answer 404 unless INTERNAL_ENDPOINTS_ENABLED is set, so public
+    deployments do not expose them. When INTERNAL_ENDPOINTS_TOKEN is set the request
+    must also carry it as a Bearer token.
+
+    Args:
+        credentials (HTTPAuthorizationCredentials): Optional Bearer token from Authorization header
+
+    Raises:
+        HTTPException: If the endpoints are disabled or the token is missing or wrong
+    """
+    if not settings.INTERNAL_ENDPOINTS_ENABLED:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not Found")
+
+    expected = settings.INTERNAL_ENDPOINTS_TOKEN
+    if expected and (
+        credentials is None or not hmac.compare_digest(credentials.credentials.encode(), expected.encode())
+    ):
+        logger.warning("Rejected request to an internal endpoint: missing or invalid token")
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Could not validate credentials"
+        )
@@ -58,7 +58,7 @@ def verify_token(token: str) -> dict:
                 detail="Token has expired"
             )
 
-        logger.debug(f"Token verified successfully for user: {user_id}")
+        logger.debug("Token verified successfully for user: %s", user_id)
         return payload
 
     except jwt.ExpiredSignatureError:
@@ -122,7 +122,7 @@ async def get_current_user(request: Request) -> str:
 
     # Return user ID
     user_id = payload.get("sub")
-    logger.debug(f"Current user extracted from token: {user_id}")
+    logger.debug("Current user extracted from token: %s", user_id)
     return user_id
 
 
@@ -137,7 +137,7 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
     Returns:
         str: Encoded JWT token
     """
-    logger.debug(f"Creating access token for data: {data}")
+    logger.debug("Creating access token for data: %s", data)
     to_encode = data.copy()
 
     # Set expiration
@@ -147,7 +147,7 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
         expire = datetime.now() + timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
 
     to_encode.update({"exp": expire.timestamp()})
-    logger.debug(f"Token will expire at: {expire}")
+    logger.debug("Token will expire at: %s", expire)
 
     # Encode the token
     encoded_jwt = jwt.encode(
@@ -180,7 +180,7 @@ def extract_user_id_from_token(token: str) -> str:
             options={"verify_signature": False, "verify_exp": False}
         )
         user_id = payload.get("sub")
-        logger.debug(f"User ID extracted from token: {user_id}")
+        logger.debug("User ID extracted from token: %s", user_id)
         return user_id
     except jwt.InvalidTokenError:
         logger.debug("Failed to extract user ID from token: Invalid token")
@@ -26,6 +26,46 @@ class Settings(BaseSettings):
 
     # Neon PostgreSQL settings
     NEON_DB_URL: str
+    # Optional explicit URL for the async engine; derived from NEON_DB_URL when unset
+    NEON_ASYNC_DB_URL: Optional[str] = None
+    # Optional read replica for read-only endpoints; reads go to the primary when unset
+    NEON_READ_DB_URL: Optional[str] = None
+    # A user's reads stay on the primary this long after their last write (replica lag allowance);
+    # responses to writes carry a signed marker (last_write cookie, X-Last-Write header) for other workers
+    READ_YOUR_WRITES_SECONDS: float = 5.0
+
+    # Connection pool settings (PostgreSQL engines)
+    DB_POOL_MODE: str = "queue"  # "queue" keeps connections open, "null" opens one per checkout
+    DB_POOL_SIZE: int = 5  # Connections kept open by the queue pool
+    DB_MAX_OVERFLOW: int = 10  # Extra connections allowed under load
+    DB_POOL_TIMEOUT: float = 30.0  # Seconds to wait for a free connection before failing
+    DB_POOL_RECYCLE: int = 300  # Replace connections older than this many seconds
+    DB_POOL_PRE_PING: bool = True  # Test each connection on checkout (one extra round trip)
+    DB_POOL_USE_LIFO: bool = True  # Reuse the most recently returned connection first
+    DB_CONNECT_TIMEOUT: int = 10  # Seconds allowed to establish a connection
+    # Transaction-pooling PgBouncer (Neon's "-pooler" endpoints); None detects it from the host
+    DB_PGBOUNCER: Optional[bool] = None
+
+    # SQLite profile, applied to every connection when NEON_DB_URL is a sqlite:// URL
+    SQLITE_WAL: bool = True  # journal_mode=WAL with SQLITE_SYNCHRONOUS
+    SQLITE_SYNCHRONOUS: str = "NORMAL"
+    SQLITE_BUSY_TIMEOUT_MS: int = 5000  # Wait this long for a write lock instead of failing with "database is locked"
+    SQLITE_CACHE_SIZE: int = -65536  # Page cache per connection; negative values are KiB (64 MiB)
+    SQLITE_MMAP_SIZE: int = 268435456  # Bytes of the database file read through mmap (256 MiB)
+
+    # Slow query log (opt-in): statements over the threshold are logged with their
+    # parameter shape and calling function, and a sample get an EXPLAIN written to a file
+    SLOW_QUERY_LOG_ENABLED: bool = False
+    SLOW_QUERY_THRESHOLD_MS: float = 200.0
+    SLOW_QUERY_EXPLAIN_SAMPLE_RATE: float = 0.1  # Fraction of slow statements to EXPLAIN; 0 disables plan capture
+    SLOW_QUERY_EXPLAIN_ANALYZE: bool = False  # EXPLAIN ANALYZE sampled SELECTs on Postgres; runs them a second time
+    SLOW_QUERY_PLAN_FILE: str = "logs/slow_query_plans.log"
+    SLOW_QUERY_PLAN_FILE_MAX_BYTES: int = 10 * 1024 * 1024
+    SLOW_QUERY_PLAN_FILE_BACKUP_COUNT: int = 5
+
+    # Run the agent's MCP tools in this process instead of calling the MCP server over HTTP.
+    # Their writes then join the chat turn's transaction and commit with the assistant message.
+    MCP_TOOLS_IN_PROCESS: bool = False
 
     # OpenRouter API settings
     OPEN_ROUTER_API_KEY: Optional[str] = None
@@ -33,6 +73,37 @@ class Settings(BaseSettings):
     # OpenAI API settings
     OPENAI_API_KEY: Optional[str] = None
 
+    # Task read cache settings (per-process LRU of per-user task lists)
+    TASK_CACHE_ENABLED: bool = True
+    TASK_CACHE_MAX_TASKS: int = 10000  # Total cached task rows across all entries
+    TASK_CACHE_TTL_SECONDS: float = 30.0
+    # Check cached task lists against a COUNT/MAX(updated_at) query before serving them, so
+    # writes from other processes (other workers, the MCP server) are seen at once. Only
+    # disable when this process is the only writer; task stats are then cached as well.
+    TASK_CACHE_VALIDATE: bool = True
+
+    # Delta sync re-reads this many seconds before the client's token, so writes that commit
+    # up to this long after their updated_at timestamp are not skipped
+    TASK_SYNC_OVERLAP_SECONDS: float = 30.0
+
+    # Logging settings; production: LOG_FORMAT=json, LOG_LEVEL=INFO, LOG_QUEUE=true
+    LOG_FORMAT: str = "rich"  # "rich" console output or "json" lines
+    LOG_LEVEL: str = "DEBUG"  # Minimum level for application loggers
+    LOG_QUEUE: bool = False  # Write log records from a background thread
+    LOG_DEBUG_SAMPLE_RATE: float = 1.0  # Fraction of DEBUG records kept
+
+    # Create missing tables when the server starts; disable once Alembic manages the schema
+    CREATE_TABLES_ON_STARTUP: bool = True
+
+    # Metrics settings: request, SQL, pool, LLM and MCP tool metrics served at /metrics
+    # (an internal endpoint, see INTERNAL_ENDPOINTS_ENABLED)
+    METRICS_ENABLED: bool = True
+
+    # Internal endpoints (/cache/stats, /db/pool/stats, /metrics) are not served unless
+    # enabled; with a token set they also require "Authorization: Bearer <token>"
+    INTERNAL_ENDPOINTS_ENABLED: bool = False
+    INTERNAL_ENDPOINTS_TOKEN: Optional[str] = None
+
     class Config:
         env_file = ".env"
         extra = "allow"  # Allow extra fields to prevent validation errors
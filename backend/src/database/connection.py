@@ -1,11 +1,17 @@
-from sqlalchemy import create_engine
-from sqlalchemy.pool import QueuePool
+import threading
+from typing import Optional
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
 from ..config.settings import settings
+from .pool import get_asyncpg_pgbouncer_options, get_pool_options, uses_pgbouncer
+from .slow_query import install_slow_query_log
+from .sqlite import apply_sqlite_pragmas, get_sqlite_engine_options, get_sqlite_pragmas
 from sqlmodel import create_engine as sqlmodel_create_engine
 from ..utils.logging_config import get_logger
 
 # Import models to ensure they are registered with SQLModel's metadata
 from ..models import task  # noqa: F401
+from ..models import task_tombstone  # noqa: F401
 from ..models import user  # noqa: F401
 from ..models import conversation, message  # noqa: F401
 
@@ -14,68 +20,230 @@ from ..models import conversation, message  # noqa: F401
 logger = get_logger(__name__)
 
 
-def create_db_engine():
+def create_db_engine(database_url: Optional[str] = None):
     """
     Create and configure the database engine with appropriate settings for Neon Serverless PostgreSQL.
 
+    Args:
+        database_url (Optional[str]): Database to connect to; defaults to NEON_DB_URL
+
     Returns:
         Engine: SQLAlchemy engine instance configured for the database
     """
-    logger.info(f"Creating database engine for: {'SQLite' if settings.NEON_DB_URL.startswith('sqlite') else 'PostgreSQL'}")
+    database_url = database_url or settings.NEON_DB_URL
+    logger.info(f"Creating database engine for: {'SQLite' if database_url.startswith('sqlite') else 'PostgreSQL'}")
 
     # Check if we're using SQLite (for local development) or PostgreSQL
-    if settings.NEON_DB_URL.startswith("sqlite"):
-        logger.debug("Configuring SQLite engine (no connection pooling)")
-        # SQLite doesn't support connect_timeout or connection pooling
+    if database_url.startswith("sqlite"):
+        url = make_url(database_url)
+        pragmas = get_sqlite_pragmas()
+        logger.debug("Configuring SQLite engine with pragmas %s", pragmas)
         engine = sqlmodel_create_engine(
-            settings.NEON_DB_URL,
+            url,
             echo=False,  # Set to True for SQL query logging (useful for debugging)
+            **get_sqlite_engine_options(url)
         )
+        apply_sqlite_pragmas(engine, pragmas)
     else:
-        logger.debug("Configuring PostgreSQL engine with connection pooling")
-        # Use SQLModel's create_engine which is compatible with both SQLAlchemy and SQLModel
-        # with connection pooling for PostgreSQL
+        pool_options = get_pool_options()
+        logger.debug(
+            "Configuring PostgreSQL engine with %s (pgbouncer=%s)",
+            pool_options["poolclass"].__name__, uses_pgbouncer(make_url(database_url))
+        )
+        # psycopg2 never creates server-side prepared statements, so the sync engine
+        # needs no changes for PgBouncer's transaction pooling
         engine = sqlmodel_create_engine(
-            settings.NEON_DB_URL,
-            # Connection pool settings optimized for serverless environments
-            poolclass=QueuePool,
-            pool_size=5,  # Number of connections to maintain in the pool
-            max_overflow=10,  # Additional connections beyond pool_size
-            pool_pre_ping=True,  # Verify connections before use
-            pool_recycle=300,  # Recycle connections after 5 minutes
+            database_url,
             echo=False,  # Set to True for SQL query logging (useful for debugging)
             connect_args={
                 # Additional connection arguments specific to PostgreSQL
-                "connect_timeout": 10,  # Timeout for establishing connection
-            }
+                "connect_timeout": settings.DB_CONNECT_TIMEOUT,  # Timeout for establishing connection
+            },
+            **pool_options
         )
 
+    if settings.SLOW_QUERY_LOG_ENABLED:
+        install_slow_query_log(engine)
+
     logger.info("Database engine created successfully")
     return engine
 
 
-# Create the global engine instance
-engine = create_db_engine()
+# The engine is created on first use, so importing this module opens no connections
+_engine = None
+_engine_lock = threading.Lock()
 
 
 def get_engine():
     """
-    Get the database engine instance.
+    Get the database engine instance, creating it on first use.
 
     Returns:
         Engine: The configured database engine
     """
-    logger.debug("Retrieving database engine instance")
+    global _engine
+    if _engine is None:
+        with _engine_lock:
+            if _engine is None:
+                _engine = create_db_engine()
+    return _engine
+
+
+def __getattr__(name):
+    # Keeps `from src.database.connection import engine` working without an import-time engine
+    if name == "engine":
+        return get_engine()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def get_async_database_url(database_url: Optional[str] = None):
+    """
+    Derive the async driver URL from the configured database URL.
+
+    postgresql:// URLs use asyncpg and sqlite:// URLs use aiosqlite. asyncpg does not
+    understand libpq query parameters such as sslmode or channel_binding, so they are
+    removed from the URL and SSL is requested through connect_args instead.
+
+    Args:
+        database_url (Optional[str]): Database URL; defaults to NEON_ASYNC_DB_URL or NEON_DB_URL
+
+    Returns:
+        Tuple[URL, dict]: Async database URL and the connect_args to pass to the engine
+    """
+    url = make_url(database_url or settings.NEON_ASYNC_DB_URL or settings.NEON_DB_URL)
+    connect_args = {}
+
+    if url.get_backend_name() == "sqlite":
+        return url.set(drivername="sqlite+aiosqlite"), connect_args
+
+    if url.get_backend_name() == "postgresql":
+        sslmode = url.query.get("sslmode")
+        if sslmode and sslmode != "disable":
+            connect_args["ssl"] = "require"
+        url = url.difference_update_query(["sslmode", "channel_binding"]).set(drivername="postgresql+asyncpg")
+
+    return url, connect_args
+
+
+def create_async_db_engine(database_url: Optional[str] = None) -> AsyncEngine:
+    """
+    Create the async database engine used by the async services.
+
+    Args:
+        database_url (Optional[str]): Database URL; defaults to NEON_ASYNC_DB_URL or NEON_DB_URL
+
+    Returns:
+        AsyncEngine: SQLAlchemy async engine configured like the sync engine
+    """
+    url, connect_args = get_async_database_url(database_url)
+    logger.info(f"Creating async database engine with driver: {url.drivername}")
+
+    if url.get_backend_name() == "sqlite":
+        engine = create_async_engine(url, echo=False)
+        apply_sqlite_pragmas(engine.sync_engine, get_sqlite_pragmas())
+    else:
+        if uses_pgbouncer(url):
+            url, pgbouncer_connect_args = get_asyncpg_pgbouncer_options(url)
+            connect_args.update(pgbouncer_connect_args)
+
+        engine = create_async_engine(
+            url,
+            echo=False,
+            # asyncpg takes the connect timeout in seconds as "timeout"
+            connect_args={**connect_args, "timeout": settings.DB_CONNECT_TIMEOUT},
+            **get_pool_options(is_async=True)
+        )
+
+    if settings.SLOW_QUERY_LOG_ENABLED:
+        # Events are registered on the sync engine that the async engine proxies
+        install_slow_query_log(engine.sync_engine)
     return engine
 
 
+# The async engine is created on first use so sync-only processes never import the async drivers
+async_engine = None
+
+
+def get_async_engine() -> AsyncEngine:
+    """
+    Get the async database engine instance, creating it on first use.
+
+    Returns:
+        AsyncEngine: The configured async database engine
+    """
+    global async_engine
+    if async_engine is None:
+        with _engine_lock:
+            if async_engine is None:
+                async_engine = create_async_db_engine()
+    return async_engine
+
+
+# Read replica engines, created on first use when NEON_READ_DB_URL is set
+_read_engine = None
+async_read_engine = None
+
+
+def get_read_engine():
+    """
+    Get the read replica engine, or the primary engine when no replica is configured.
+
+    Returns:
+        Engine: Engine for NEON_READ_DB_URL, falling back to get_engine()
+    """
+    global _read_engine
+    if not settings.NEON_READ_DB_URL:
+        return get_engine()
+    if _read_engine is None:
+        with _engine_lock:
+            if _read_engine is None:
+                _read_engine = create_db_engine(settings.NEON_READ_DB_URL)
+    return _read_engine
+
+
+def get_async_read_engine() -> AsyncEngine:
+    """
+    Get the async read replica engine, or the async primary engine when no replica is configured.
+
+    Returns:
+        AsyncEngine: Async engine for NEON_READ_DB_URL, falling back to get_async_engine()
+    """
+    global async_read_engine
+    if not settings.NEON_READ_DB_URL:
+        return get_async_engine()
+    if async_read_engine is None:
+        with _engine_lock:
+            if async_read_engine is None:
+                async_read_engine = create_async_db_engine(settings.NEON_READ_DB_URL)
+    return async_read_engine
+
+
+def get_pooled_engines():
+    """
+    Get the engines created so far, for pool monitoring.
+
+    Returns:
+        Dict[str, Engine]: Engines by role; the async engine's pool lives on its sync_engine
+    """
+    engines = {}
+    if _engine is not None:
+        engines["sync"] = _engine
+    if async_engine is not None:
+        engines["async"] = async_engine.sync_engine
+    if _read_engine is not None:
+        engines["read"] = _read_engine
+    if async_read_engine is not None:
+        engines["async_read"] = async_read_engine.sync_engine
+    return engines
+
+
 def create_tables():
     """
     Create all database tables based on the registered models.
     """
     logger.info("Creating database tables...")
     from sqlmodel import SQLModel
-    SQLModel.metadata.create_all(engine)
+    SQLModel.metadata.create_all(get_engine())
     logger.info("Database tables created successfully")
 
 
@@ -89,7 +257,7 @@ def ping_database():
     logger.debug("Testing database connection...")
     from sqlalchemy import text
     try:
-        with engine.connect() as conn:
+        with get_engine().connect() as conn:
             # Execute a simple query to test the connection
             result = conn.execute(text("SELECT 1"))
             logger.debug("Database ping successful")
@@ -99,10 +267,19 @@ def ping_database():
         return False
 
 
-# Test the connection when the module is loaded
-if __name__ != "__main__":
-    logger.info("Testing database connection on startup...")
-    if not ping_database():
-        logger.warning("Warning: Could not establish database connection")
-    else:
-        logger.info("Database connection established successfully")
\ No newline at end of file
+
+async def dispose_engines():
+    """
+    Close every pooled connection of the engines created so far.
+
+    Called on application shutdown; the engines are created again if used afterwards.
+    """
+    global _engine, async_engine, _read_engine, async_read_engine
+    for engine in (async_engine, async_read_engine):
+        if engine is not None:
+            await engine.dispose()
+    for engine in (_engine, _read_engine):
+        if engine is not None:
+            engine.dispose()
+    _engine = async_engine = _read_engine = async_read_engine = None
+    logger.info("Database engines disposed")
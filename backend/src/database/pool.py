@@ -0,0 +1,185 @@
+import threading
+import time
+import uuid
+from typing import Any, Dict, Optional
+from sqlalchemy.engine import Engine, URL
+from sqlalchemy.pool import AsyncAdaptedQueuePool, NullPool, QueuePool
+from ..config.settings import settings
+
+
+# Pool modes accepted by DB_POOL_MODE
+POOL_MODES = ("queue", "null")
+
+
+class PoolWaitStats:
+    """Checkouts served by a pool and the time callers spent waiting for them."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.checkouts = 0
+        self.failures = 0
+        self.wait_seconds_total = 0.0
+        self.wait_seconds_max = 0.0
+
+    def record(self, seconds: float, failed: bool = False):
+        with self._lock:
+            if failed:
+                self.failures += 1
+            else:
+                self.checkouts += 1
+            self.wait_seconds_total += seconds
+            self.wait_seconds_max = max(self.wait_seconds_max, seconds)
+
+    def as_dict(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "checkouts": self.checkouts,
+                "failures": self.failures,
+                "wait_seconds_total": round(self.wait_seconds_total, 6),
+                "wait_seconds_avg": round(self.wait_seconds_total / self.checkouts, 6) if self.checkouts else 0.0,
+                "wait_seconds_max": round(self.wait_seconds_max, 6),
+            }
+
+
+class WaitTrackingMixin:
+    """
+    Time every checkout from the underlying pool.
+
+    The wait covers queueing for a free connection and, when the pool has to open
+    one (overflow, or every checkout for NullPool), establishing it.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.wait_stats = PoolWaitStats()
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except Exception:
+            self.wait_stats.record(time.perf_counter() - started, failed=True)
+            raise
+        self.wait_stats.record(time.perf_counter() - started)
+        return connection
+
+
+class WaitTrackingQueuePool(WaitTrackingMixin, QueuePool):
+    pass
+
+
+class WaitTrackingAsyncAdaptedQueuePool(WaitTrackingMixin, AsyncAdaptedQueuePool):
+    pass
+
+
+class WaitTrackingNullPool(WaitTrackingMixin, NullPool):
+    pass
+
+
+def uses_pgbouncer(url: URL) -> bool:
+    """
+    Decide whether connections go through PgBouncer in transaction pooling mode.
+
+    DB_PGBOUNCER wins when set; otherwise Neon's pooled endpoints are recognised by
+    the "-pooler" suffix of their host name.
+
+    Args:
+        url (URL): Database URL
+
+    Returns:
+        bool: True if the URL points at a transaction-pooling PgBouncer
+    """
+    if settings.DB_PGBOUNCER is not None:
+        return settings.DB_PGBOUNCER
+    return "-pooler" in (url.host or "")
+
+
+def get_pool_options(is_async: bool = False) -> Dict[str, Any]:
+    """
+    Build the create_engine pool arguments from Settings.
+
+    DB_POOL_MODE=queue keeps up to DB_POOL_SIZE + DB_MAX_OVERFLOW connections open.
+    DB_POOL_MODE=null opens a connection per checkout and closes it on return,
+    leaving pooling entirely to PgBouncer.
+
+    Args:
+        is_async (bool): Whether the options are for the async engine
+
+    Returns:
+        Dict[str, Any]: Keyword arguments for create_engine / create_async_engine
+
+    Raises:
+        ValueError: If DB_POOL_MODE is unknown
+    """
+    if settings.DB_POOL_MODE not in POOL_MODES:
+        raise ValueError(f"Unknown DB_POOL_MODE: {settings.DB_POOL_MODE}")
+
+    if settings.DB_POOL_MODE == "null":
+        return {"poolclass": WaitTrackingNullPool}
+
+    return {
+        "poolclass": WaitTrackingAsyncAdaptedQueuePool if is_async else WaitTrackingQueuePool,
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+        # Each pre-ping is an extra round trip per checkout
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+        # LIFO reuses the most recently returned connections, so idle extras age out at pool_recycle
+        "pool_use_lifo": settings.DB_POOL_USE_LIFO,
+    }
+
+
+def get_asyncpg_pgbouncer_options(url: URL):
+    """
+    Adapt an asyncpg URL and connect_args for PgBouncer transaction pooling.
+
+    Consecutive transactions may run on different server connections, so named
+    prepared statements cannot be reused: asyncpg's statement cache and
+    SQLAlchemy's prepared statement cache are disabled and every statement gets a
+    unique name.
+
+    Args:
+        url (URL): postgresql+asyncpg URL
+
+    Returns:
+        Tuple[URL, dict]: URL and extra connect_args
+    """
+    url = url.update_query_dict({"prepared_statement_cache_size": "0"})
+    connect_args = {
+        "statement_cache_size": 0,
+        "prepared_statement_name_func": lambda: f"__asyncpg_{uuid.uuid4()}__",
+    }
+    return url, connect_args
+
+
+def get_pool_stats(engine: Engine) -> Dict[str, Any]:
+    """
+    Describe an engine's pool: its class, occupancy and checkout wait times.
+
+    Args:
+        engine (Engine): Sync engine (use AsyncEngine.sync_engine for async ones)
+
+    Returns:
+        Dict[str, Any]: Pool statistics; occupancy fields are None for pools that do not keep connections
+    """
+    pool = engine.pool
+    stats: Dict[str, Any] = {
+        "pool": type(pool).__name__,
+        "size": None,
+        "checked_out": None,
+        "checked_in": None,
+        "overflow": None,
+    }
+    if isinstance(pool, QueuePool):
+        stats.update({
+            "size": pool.size(),
+            "checked_out": pool.checkedout(),
+            "checked_in": pool.checkedin(),
+            "overflow": pool.overflow(),
+            "max_overflow": pool._max_overflow,
+            "timeout": pool.timeout(),
+        })
+    wait_stats: Optional[PoolWaitStats] = getattr(pool, "wait_stats", None)
+    stats.update(wait_stats.as_dict() if wait_stats else PoolWaitStats().as_dict())
+    return stats
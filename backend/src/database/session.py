@@ -1,27 +1,241 @@
-from contextlib import contextmanager
+import contextvars
+import itertools
+import threading
+import time
+from collections import OrderedDict
+from contextlib import asynccontextmanager, contextmanager
+from fastapi import Request
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 from sqlalchemy.orm import Session, sessionmaker
-from typing import Generator
-from .connection import engine
+from typing import AsyncGenerator, Generator, Optional
+from .connection import get_async_engine, get_async_read_engine, get_engine, get_read_engine
+from .write_marker import record_request_write, request_wrote_recently
+from ..config.settings import settings
+from ..models.user import User
 from ..utils.logging_config import get_logger
 
 
 # Configure logging
 logger = get_logger(__name__)
 
-# Create a session factory bound to the engine
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
-logger.debug("Database session factory created")
+# Session.info keys: the user a session acts for, and the users whose rows it has written
+SESSION_USER_KEY = "user_id"
+WRITTEN_USERS_KEY = "written_user_ids"
 
 
-def get_session() -> Generator[Session, None, None]:
+class RecentWriters:
+    """
+    Users who committed a write in this process within the last window seconds.
+
+    Their reads are routed to the primary until the replica has had time to catch
+    up. Tracking is per process, like the task cache; writes made by other workers
+    or the MCP server are known from the write marker the request carries (see
+    write_marker).
+    """
+
+    def __init__(self, window: float, max_users: int = 10000):
+        self.window = window
+        self.max_users = max_users
+        self._writes: "OrderedDict[str, float]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def record(self, user_id: str):
+        with self._lock:
+            self._writes[user_id] = time.monotonic()
+            self._writes.move_to_end(user_id)
+            while len(self._writes) > self.max_users:
+                self._writes.popitem(last=False)
+
+    def is_recent(self, user_id: str) -> bool:
+        with self._lock:
+            written_at = self._writes.get(user_id)
+            if written_at is None:
+                return False
+            if time.monotonic() - written_at < self.window:
+                return True
+            del self._writes[user_id]
+            return False
+
+    def clear(self):
+        with self._lock:
+            self._writes.clear()
+
+
+recent_writers = RecentWriters(settings.READ_YOUR_WRITES_SECONDS)
+
+
+class PrimarySession(Session):
+    """Session on the primary database; committed writes mark their users in recent_writers."""
+
+
+@event.listens_for(PrimarySession, "after_flush")
+def _track_flushed_writes(session, flush_context):
+    written = session.info.setdefault(WRITTEN_USERS_KEY, set())
+    for obj in itertools.chain(session.new, session.dirty, session.deleted):
+        owner = obj.id if isinstance(obj, User) else getattr(obj, "user_id", None)
+        if owner:
+            written.add(owner)
+    if session.info.get(SESSION_USER_KEY):
+        written.add(session.info[SESSION_USER_KEY])
+
+
+@event.listens_for(PrimarySession, "do_orm_execute")
+def _track_statement_writes(orm_execute_state):
+    # Bulk INSERT/UPDATE/DELETE statements skip the flush, so attribute them to the session's user
+    session = orm_execute_state.session
+    if (orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete) \
+            and session.info.get(SESSION_USER_KEY):
+        session.info.setdefault(WRITTEN_USERS_KEY, set()).add(session.info[SESSION_USER_KEY])
+
+
+@event.listens_for(PrimarySession, "after_commit")
+def _record_committed_writes(session):
+    for user_id in session.info.pop(WRITTEN_USERS_KEY, ()):
+        recent_writers.record(user_id)
+        record_request_write(user_id)
+
+
+@event.listens_for(PrimarySession, "after_rollback")
+def _discard_rolled_back_writes(session):
+    session.info.pop(WRITTEN_USERS_KEY, None)
+
+
+def mark_written(db: Session, user_id: str):
+    """
+    Attribute a write the session cannot see itself, such as raw SQL, to user_id.
+
+    Args:
+        db (Session): Session the write was made in; recorded when it commits
+        user_id (str): User whose reads must stay on the primary for a while
+    """
+    db.info.setdefault(WRITTEN_USERS_KEY, set()).add(user_id)
+
+
+# Session factory; like the async one, sessions are bound to the engine when opened
+SessionLocal = sessionmaker(class_=PrimarySession, autocommit=False, autoflush=False)
+
+# Async session factory; the engine is bound per session so it is only created when first needed.
+# Objects are not expired on commit because async sessions cannot lazy-load them afterwards.
+AsyncSessionLocal = async_sessionmaker(
+    class_=AsyncSession, sync_session_class=PrimarySession, autoflush=False, expire_on_commit=False
+)
+
+# Read replica session factories
+ReadSessionLocal = sessionmaker(autocommit=False, autoflush=False)
+AsyncReadSessionLocal = async_sessionmaker(class_=AsyncSession, autoflush=False, expire_on_commit=False)
+
+# Session whose transaction the async context managers below join instead of opening their own
+_shared_session: contextvars.ContextVar[Optional[AsyncSession]] = contextvars.ContextVar("shared_session", default=None)
+
+
+@contextmanager
+def share_transaction(db: AsyncSession):
+    """
+    Make get_async_db_session and get_async_read_db_session join db's transaction inside the block.
+
+    Sessions opened in the block (e.g. by MCP tools running in-process) use db's
+    connection, and their commits and rollbacks only release or roll back a
+    savepoint. Nothing they write is committed until db commits. db's connection
+    is only checked out when the first joined session runs a statement.
+
+    Args:
+        db (AsyncSession): Session owning the transaction, committed by the caller
+
+    Yields:
+        AsyncSession: db
+    """
+    token = _shared_session.set(db)
+    try:
+        yield db
+    finally:
+        _shared_session.reset(token)
+
+
+@asynccontextmanager
+async def _join_shared_session(shared: AsyncSession, user_id: Optional[str], read_only: bool = False):
+    # Writers get a savepoint so a failed tool only undoes its own writes; readers
+    # never commit or roll back, so they skip the SAVEPOINT/RELEASE round trips
+    connection = await shared.connection()
+    logger.debug("Joining the shared transaction for user %s", user_id)
+    async with AsyncSessionLocal(
+        bind=connection,
+        join_transaction_mode="rollback_only" if read_only else "create_savepoint",
+        info={SESSION_USER_KEY: user_id}
+    ) as db:
+        yield db
+
+
+def use_primary_for_reads(user_id: Optional[str]) -> bool:
+    """
+    Decide whether a read for user_id must go to the primary.
+
+    Recent writes are known from this process's recent_writers or from the write
+    marker of the current request, so the decision never queries a database.
+
+    Args:
+        user_id (Optional[str]): User the read is for
+
+    Returns:
+        bool: True without a replica, without a user, or while the user's last write may not have replicated
+    """
+    return (
+        not settings.NEON_READ_DB_URL
+        or not user_id
+        or recent_writers.is_recent(user_id)
+        or request_wrote_recently(user_id)
+    )
+
+
+def open_read_session(user_id: Optional[str]) -> Session:
+    """
+    Open a session for read-only work, routed to the replica when it is safe.
+
+    Args:
+        user_id (Optional[str]): User the reads are for
+
+    Returns:
+        Session: Session on the replica, or on the primary after the user's recent write
+    """
+    if use_primary_for_reads(user_id):
+        logger.debug("Routing reads for user %s to the primary", user_id)
+        return SessionLocal(bind=get_engine(), info={SESSION_USER_KEY: user_id})
+    logger.debug("Routing reads for user %s to the replica", user_id)
+    return ReadSessionLocal(bind=get_read_engine(), info={SESSION_USER_KEY: user_id})
+
+
+def open_async_read_session(user_id: Optional[str]) -> AsyncSession:
+    """
+    Open an async session for read-only work, routed like open_read_session.
+
+    Args:
+        user_id (Optional[str]): User the reads are for
+
+    Returns:
+        AsyncSession: Async session on the replica or the primary
+    """
+    if use_primary_for_reads(user_id):
+        logger.debug("Routing async reads for user %s to the primary", user_id)
+        return AsyncSessionLocal(bind=get_async_engine(), info={SESSION_USER_KEY: user_id})
+    logger.debug("Routing async reads for user %s to the replica", user_id)
+    return AsyncReadSessionLocal(bind=get_async_read_engine(), info={SESSION_USER_KEY: user_id})
+
+
+def get_session(request: Request) -> Generator[Session, None, None]:
     """
     Dependency to get database session for FastAPI endpoints.
 
+    Writes committed through it mark the {user_id} path parameter's user as a
+    recent writer, so that user's following reads see them.
+
+    Args:
+        request (Request): Current request, for its {user_id} path parameter
+
     Yields:
         Session: SQLAlchemy database session
     """
     logger.debug("Creating new database session for FastAPI endpoint")
-    db = SessionLocal()
+    db = SessionLocal(bind=get_engine(), info={SESSION_USER_KEY: request.path_params.get("user_id")})
     try:
         yield db
     finally:
@@ -29,16 +243,55 @@ def get_session() -> Generator[Session, None, None]:
         db.close()
 
 
+def get_read_session(request: Request) -> Generator[Session, None, None]:
+    """
+    Dependency to get a read-only database session for FastAPI endpoints.
+
+    Uses the read replica unless the {user_id} path parameter's user wrote recently.
+
+    Args:
+        request (Request): Current request, for its {user_id} path parameter
+
+    Yields:
+        Session: SQLAlchemy database session on the replica or the primary
+    """
+    db = open_read_session(request.path_params.get("user_id"))
+    try:
+        yield db
+    finally:
+        logger.debug("Closing read session for FastAPI endpoint")
+        db.close()
+
+
+async def get_async_session(request: Request) -> AsyncGenerator[AsyncSession, None]:
+    """
+    Dependency to get an async database session for async FastAPI endpoints.
+
+    Args:
+        request (Request): Current request, for its {user_id} path parameter
+
+    Yields:
+        AsyncSession: SQLAlchemy async database session
+    """
+    logger.debug("Creating new async database session for FastAPI endpoint")
+    async with AsyncSessionLocal(bind=get_async_engine(), info={SESSION_USER_KEY: request.path_params.get("user_id")}) as db:
+        yield db
+    logger.debug("Closed async database session for FastAPI endpoint")
+
+
 @contextmanager
-def get_db_session():
+def get_db_session(user_id: Optional[str] = None):
     """
     Context manager to get database session for use outside of FastAPI endpoints.
 
+    Args:
+        user_id (Optional[str]): User the session writes for, marked as a recent writer on commit
+
     Yields:
         Session: SQLAlchemy database session
     """
     logger.debug("Creating new database session via context manager")
-    db = SessionLocal()
+    db = SessionLocal(bind=get_engine(), info={SESSION_USER_KEY: user_id})
     try:
         yield db
     finally:
@@ -46,6 +299,75 @@ def get_db_session():
         db.close()
 
 
+@contextmanager
+def get_read_db_session(user_id: Optional[str]):
+    """
+    Context manager to get a read-only session, routed like get_read_session.
+
+    Args:
+        user_id (Optional[str]): User the reads are for
+
+    Yields:
+        Session: SQLAlchemy database session on the replica or the primary
+    """
+    db = open_read_session(user_id)
+    try:
+        yield db
+    finally:
+        logger.debug("Closing read session via context manager")
+        db.close()
+
+
+@asynccontextmanager
+async def get_async_db_session(user_id: Optional[str] = None):
+    """
+    Async context manager to get a database session outside of FastAPI endpoints (e.g. MCP tools).
+
+    Inside share_transaction the session joins the shared session's transaction.
+
+    Args:
+        user_id (Optional[str]): User the session writes for, marked as a recent writer on commit
+
+    Yields:
+        AsyncSession: SQLAlchemy async database session
+    """
+    shared = _shared_session.get()
+    if shared is not None:
+        async with _join_shared_session(shared, user_id) as db:
+            yield db
+        return
+
+    logger.debug("Creating new async database session via context manager")
+    async with AsyncSessionLocal(bind=get_async_engine(), info={SESSION_USER_KEY: user_id}) as db:
+        yield db
+    logger.debug("Closed async database session via context manager")
+
+
+@asynccontextmanager
+async def get_async_read_db_session(user_id: Optional[str]):
+    """
+    Async context manager to get a read-only session, routed like get_read_session (e.g. list_tasks).
+
+    Inside share_transaction the session joins the shared session's transaction,
+    so it sees the writes made earlier in it.
+
+    Args:
+        user_id (Optional[str]): User the reads are for
+
+    Yields:
+        AsyncSession: SQLAlchemy async database session on the replica or the primary
+    """
+    shared = _shared_session.get()
+    if shared is not None:
+        async with _join_shared_session(shared, user_id, read_only=True) as db:
+            yield db
+        return
+
+    async with open_async_read_session(user_id) as db:
+        yield db
+    logger.debug("Closed async read session via context manager")
+
+
 def get_session_sync() -> Session:
     """
     Synchronous function to get database session.
@@ -54,7 +376,7 @@ def get_session_sync() -> Session:
         Session: SQLAlchemy database session (remember to close it manually)
     """
     logger.debug("Creating synchronous database session")
-    return SessionLocal()
+    return SessionLocal(bind=get_engine())
 
 
 def close_session(db: Session):
@@ -81,9 +403,9 @@ def run_db_operation(operation_func, *args, **kwargs):
     Returns:
         Result of the operation function
     """
-    logger.debug(f"Running database operation: {operation_func.__name__}")
+    logger.debug("Running database operation: %s", operation_func.__name__)
     with get_db_session() as db:
         kwargs['db'] = db
         result = operation_func(*args, **kwargs)
-        logger.debug(f"Database operation completed: {operation_func.__name__}")
+        logger.debug("Database operation completed: %s", operation_func.__name__)
         return result
\ No newline at end of file
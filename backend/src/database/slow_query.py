@@ -0,0 +1,221 @@
+import logging
+import os
+import random
+import sys
+import time
+from logging.handlers import RotatingFileHandler
+from typing import Any, Optional
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from ..config.settings import settings
+from ..utils.logging_config import get_logger
+
+
+logger = get_logger(__name__)
+
+# Plans go to their own rotating file, not the application log
+plan_logger = logging.getLogger(f"{__name__}.plans")
+plan_logger.propagate = False
+
+# Innermost frame in one of these packages is reported as the statement's caller
+CALLER_PREFIXES = ("src.services.", "src.mcp_server.", "src.api.", "src.auth.")
+STATEMENT_PREVIEW_LENGTH = 500
+
+
+def parameter_shape(parameters: Any, executemany: bool = False) -> str:
+    """
+    Describe bound parameters by name and type, never by value.
+
+    Args:
+        parameters: DBAPI parameters (a dict, a sequence, or for executemany a list of either)
+        executemany (bool): Whether parameters holds one set per row
+
+    Returns:
+        str: e.g. "{user_id: str, limit: int}" or "25 x (str, int)"
+    """
+    if executemany:
+        parameters = list(parameters)
+        return f"{len(parameters)} x {parameter_shape(parameters[0])}" if parameters else "[]"
+    if isinstance(parameters, dict):
+        return "{" + ", ".join(f"{name}: {type(value).__name__}" for name, value in parameters.items()) + "}"
+    if isinstance(parameters, (list, tuple)):
+        return "(" + ", ".join(type(value).__name__ for value in parameters) + ")"
+    return type(parameters).__name__
+
+
+def find_caller() -> Optional[str]:
+    """
+    Find the application function that issued the current statement.
+
+    Async sessions run statements in a greenlet, so when the current stack holds no
+    application frame the suspended parent greenlets (where the awaiting service
+    method is) are searched as well.
+
+    Returns:
+        Optional[str]: "module.Qualified.name:line", or None if no application frame is found
+    """
+    frames = [sys._getframe(1)]
+    greenlet_module = sys.modules.get("greenlet")
+    if greenlet_module is not None:
+        current = greenlet_module.getcurrent().parent
+        while current is not None:
+            frames.append(current.gr_frame)
+            current = current.parent
+
+    for frame in frames:
+        while frame is not None:
+            module = frame.f_globals.get("__name__", "")
+            if module.startswith(CALLER_PREFIXES):
+                return f"{module}.{frame.f_code.co_qualname}:{frame.f_lineno}"
+            frame = frame.f_back
+    return None
+
+
+def get_explain_prefix(dialect_name: str, statement: str, analyze: bool = False) -> Optional[str]:
+    """
+    Choose the EXPLAIN form for a statement.
+
+    Plain EXPLAIN only plans the statement, so capturing it costs the request
+    little. EXPLAIN ANALYZE executes the statement again; when enabled it is only
+    used for plain SELECTs, since a WITH may hold a data-modifying statement.
+
+    Args:
+        dialect_name (str): Engine dialect
+        statement (str): SQL statement
+        analyze (bool): Use EXPLAIN (ANALYZE, BUFFERS) for plain SELECTs on Postgres
+
+    Returns:
+        Optional[str]: Prefix to put before the statement, or None if it cannot be explained
+    """
+    keyword = statement.lstrip().split(None, 1)[0].upper() if statement.strip() else ""
+    if dialect_name == "postgresql":
+        if analyze and keyword == "SELECT":
+            return "EXPLAIN (ANALYZE, BUFFERS) "
+        if keyword in ("SELECT", "WITH", "INSERT", "UPDATE", "DELETE"):
+            return "EXPLAIN "
+    elif dialect_name == "sqlite" and keyword in ("SELECT", "WITH", "INSERT", "UPDATE", "DELETE"):
+        return "EXPLAIN QUERY PLAN "
+    return None
+
+
+def capture_plan(conn, statement: str, parameters: Any) -> Optional[str]:
+    """
+    Run EXPLAIN for a statement on the connection that just executed it.
+
+    The EXPLAIN runs inside a savepoint on Postgres that is always rolled back, so
+    neither a failure nor anything an EXPLAIN ANALYZE executed reaches the
+    caller's transaction.
+
+    Args:
+        conn: SQLAlchemy connection that executed the statement
+        statement (str): SQL statement as sent to the driver
+        parameters: Parameters as sent to the driver
+
+    Returns:
+        Optional[str]: Plan text, or None if the statement cannot be explained
+    """
+    dialect_name = conn.dialect.name
+    prefix = get_explain_prefix(dialect_name, statement, analyze=settings.SLOW_QUERY_EXPLAIN_ANALYZE)
+    if prefix is None:
+        return None
+
+    use_savepoint = dialect_name == "postgresql"
+    cursor = conn.connection.cursor()
+    try:
+        if use_savepoint:
+            cursor.execute("SAVEPOINT slow_query_explain")
+        try:
+            cursor.execute(prefix + statement, parameters)
+            rows = cursor.fetchall()
+        finally:
+            if use_savepoint:
+                cursor.execute("ROLLBACK TO SAVEPOINT slow_query_explain")
+                cursor.execute("RELEASE SAVEPOINT slow_query_explain")
+    finally:
+        cursor.close()
+    return "\n".join(" | ".join(str(column) for column in row) if len(row) > 1 else str(row[0]) for row in rows)
+
+
+def configure_plan_file(path: str):
+    """Send captured plans to a rotating file at path, replacing any previous file handler."""
+    for handler in list(plan_logger.handlers):
+        plan_logger.removeHandler(handler)
+        handler.close()
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    handler = RotatingFileHandler(
+        path,
+        maxBytes=settings.SLOW_QUERY_PLAN_FILE_MAX_BYTES,
+        backupCount=settings.SLOW_QUERY_PLAN_FILE_BACKUP_COUNT,
+        encoding="utf-8"
+    )
+    handler.setFormatter(logging.Formatter("%(asctime)s %(message)s\n"))
+    plan_logger.addHandler(handler)
+    plan_logger.setLevel(logging.INFO)
+
+
+def install_slow_query_log(
+    engine: Engine,
+    threshold_ms: Optional[float] = None,
+    explain_sample_rate: Optional[float] = None
+):
+    """
+    Log statements slower than a threshold and sample their plans.
+
+    Every statement on the engine is timed; those over threshold_ms are logged as
+    warnings with their duration, parameter shape and calling application
+    function. A sample of them also gets an EXPLAIN (EXPLAIN (ANALYZE, BUFFERS)
+    for Postgres SELECTs with SLOW_QUERY_EXPLAIN_ANALYZE), written to the
+    SLOW_QUERY_PLAN_FILE rotating file.
+
+    Args:
+        engine (Engine): Sync engine (use AsyncEngine.sync_engine for async ones)
+        threshold_ms (Optional[float]): Slow statement threshold; defaults to SLOW_QUERY_THRESHOLD_MS
+        explain_sample_rate (Optional[float]): Fraction of slow statements to EXPLAIN; defaults to SLOW_QUERY_EXPLAIN_SAMPLE_RATE
+    """
+    threshold = (settings.SLOW_QUERY_THRESHOLD_MS if threshold_ms is None else threshold_ms) / 1000
+    sample_rate = settings.SLOW_QUERY_EXPLAIN_SAMPLE_RATE if explain_sample_rate is None else explain_sample_rate
+    if sample_rate > 0 and not plan_logger.handlers:
+        configure_plan_file(settings.SLOW_QUERY_PLAN_FILE)
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def start_timer(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("slow_query_start", []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def log_if_slow(conn, cursor, statement, parameters, context, executemany):
+        elapsed = time.perf_counter() - conn.info["slow_query_start"].pop()
+        if elapsed < threshold:
+            return
+
+        duration_ms = round(elapsed * 1000, 1)
+        caller = find_caller()
+        shape = parameter_shape(parameters, executemany)
+        preview = " ".join(statement.split())[:STATEMENT_PREVIEW_LENGTH]
+        logger.warning(
+            "Slow query: %.1f ms in %s: %s params=%s", duration_ms, caller, preview, shape,
+            extra={"duration_ms": duration_ms, "caller": caller, "statement": preview, "parameter_shape": shape}
+        )
+
+        if executemany or random.random() >= sample_rate:
+            return
+        try:
+            plan = capture_plan(conn, statement, parameters)
+        except Exception as e:
+            logger.debug("Could not capture plan for slow query: %s", e)
+            return
+        if plan is not None:
+            plan_logger.info(
+                "%.1f ms in %s\nparams=%s\n%s\n%s", duration_ms, caller, shape, statement.strip(), plan
+            )
+
+    @event.listens_for(engine, "handle_error")
+    def discard_timer(exception_context):
+        connection = exception_context.connection
+        if connection is not None and connection.info.get("slow_query_start"):
+            connection.info["slow_query_start"].pop()
+
+    logger.info(
+        "Slow query log enabled: threshold %.0f ms, EXPLAIN sample rate %.2f", threshold * 1000, sample_rate
+    )
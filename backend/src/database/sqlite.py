@@ -0,0 +1,85 @@
+from typing import Any, Dict
+from sqlalchemy import event
+from sqlalchemy.engine import Engine, URL
+from ..config.settings import settings
+from .pool import WaitTrackingQueuePool
+
+
+def is_memory_database(url: URL) -> bool:
+    """
+    Check whether a SQLite URL names an in-memory database.
+
+    Args:
+        url (URL): SQLite database URL
+
+    Returns:
+        bool: True for sqlite://, sqlite:///:memory: and mode=memory URIs
+    """
+    return url.database in (None, "", ":memory:") or url.query.get("mode") == "memory"
+
+
+def get_sqlite_pragmas() -> Dict[str, Any]:
+    """
+    Build the PRAGMAs run on every new SQLite connection from Settings.
+
+    Returns:
+        Dict[str, Any]: PRAGMA name to value, in the order they are applied
+    """
+    pragmas: Dict[str, Any] = {}
+    if settings.SQLITE_WAL:
+        # Readers no longer block the writer (or each other); persists in the database file
+        pragmas["journal_mode"] = "WAL"
+        # NORMAL only syncs at checkpoints in WAL mode, which stays corruption-safe
+        pragmas["synchronous"] = settings.SQLITE_SYNCHRONOUS
+    pragmas["busy_timeout"] = settings.SQLITE_BUSY_TIMEOUT_MS
+    pragmas["cache_size"] = settings.SQLITE_CACHE_SIZE
+    pragmas["mmap_size"] = settings.SQLITE_MMAP_SIZE
+    pragmas["foreign_keys"] = "ON"
+    return pragmas
+
+
+def apply_sqlite_pragmas(engine: Engine, pragmas: Dict[str, Any]):
+    """
+    Run the given PRAGMAs on every connection the engine opens.
+
+    Args:
+        engine (Engine): Sync engine (use AsyncEngine.sync_engine for async ones)
+        pragmas (Dict[str, Any]): PRAGMA name to value
+    """
+    @event.listens_for(engine, "connect")
+    def set_sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            for name, value in pragmas.items():
+                cursor.execute(f"PRAGMA {name}={value}")
+        finally:
+            cursor.close()
+
+
+def get_sqlite_engine_options(url: URL) -> Dict[str, Any]:
+    """
+    Build the create_engine arguments for a SQLite database.
+
+    File databases get a queue pool sized from DB_POOL_SIZE / DB_MAX_OVERFLOW with
+    connections shared across the request threadpool, so check_same_thread is off.
+    In-memory databases keep SQLAlchemy's default pool, since each new connection
+    would open a separate empty database.
+
+    Args:
+        url (URL): SQLite database URL
+
+    Returns:
+        Dict[str, Any]: Keyword arguments for create_engine
+    """
+    if is_memory_database(url):
+        return {}
+    return {
+        "poolclass": WaitTrackingQueuePool,
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        # Local connections cannot go stale, so neither pings nor recycling are needed
+        "pool_pre_ping": False,
+        "pool_use_lifo": True,
+        "connect_args": {"check_same_thread": False},
+    }
@@ -0,0 +1,168 @@
+"""
+Read-your-writes markers carried by the client.
+
+A request that commits a write for a user answers with a signed marker holding
+the user and the time of the write, as the last_write cookie and the
+X-Last-Write header. The client sends it back (the browser returns the cookie,
+API clients echo the header), so whichever worker or MCP server handles the
+next request knows the user wrote recently without asking the primary.
+"""
+
+import contextvars
+import hashlib
+import hmac
+import math
+import time
+from dataclasses import dataclass, field
+from http.cookies import SimpleCookie
+from typing import Dict, Optional, Tuple
+from ..config.settings import settings
+
+WRITE_MARKER_COOKIE = "last_write"
+WRITE_MARKER_HEADER = "X-Last-Write"
+
+
+@dataclass
+class RequestWrites:
+    """The marker a request arrived with and the users it committed writes for."""
+    marker: Optional[Tuple[str, float]] = None
+    written: Dict[str, float] = field(default_factory=dict)
+
+
+# Set by WriteMarkerMiddleware for the duration of a request; threadpool and greenlet
+# workers run in a copy of the request's context and so update the same object
+_request_writes: contextvars.ContextVar[Optional[RequestWrites]] = contextvars.ContextVar("request_writes", default=None)
+
+
+def _signature(payload: str) -> str:
+    return hmac.new(settings.SECRET_KEY.encode(), payload.encode(), hashlib.sha256).hexdigest()
+
+
+def encode_write_marker(user_id: str, written_at: float) -> str:
+    """
+    Sign a marker for a write made by user_id at written_at.
+
+    Args:
+        user_id (str): User who wrote
+        written_at (float): Time of the write, in seconds since the epoch
+
+    Returns:
+        str: "<user_id>.<milliseconds>.<signature>"
+    """
+    payload = f"{user_id}.{int(written_at * 1000)}"
+    return f"{payload}.{_signature(payload)}"
+
+
+def decode_write_marker(value: Optional[str]) -> Optional[Tuple[str, float]]:
+    """
+    Verify a marker made by encode_write_marker.
+
+    Args:
+        value (Optional[str]): Marker from the cookie or header
+
+    Returns:
+        Optional[Tuple[str, float]]: (user_id, written_at), or None if missing or not signed by this app
+    """
+    if not value:
+        return None
+    payload, _, signature = value.rpartition(".")
+    if not payload or not hmac.compare_digest(signature, _signature(payload)):
+        return None
+    user_id, _, written_ms = payload.rpartition(".")
+    try:
+        return user_id, int(written_ms) / 1000
+    except ValueError:
+        return None
+
+
+def record_request_write(user_id: str):
+    """Note that the current request committed a write for user_id, so its response carries a marker."""
+    writes = _request_writes.get()
+    if writes is not None:
+        writes.written[user_id] = time.time()
+
+
+def request_wrote_recently(user_id: str) -> bool:
+    """
+    Check the current request's marker for a write by user_id within READ_YOUR_WRITES_SECONDS.
+
+    Args:
+        user_id (str): User the read is for
+
+    Returns:
+        bool: True if the marker is for user_id and its write may not have replicated yet
+    """
+    writes = _request_writes.get()
+    if writes is None or writes.marker is None:
+        return False
+    marker_user_id, written_at = writes.marker
+    return marker_user_id == user_id and time.time() - written_at < settings.READ_YOUR_WRITES_SECONDS
+
+
+def current_write_marker() -> Optional[str]:
+    """
+    Get the marker to pass on to another service called while handling this request.
+
+    Returns:
+        Optional[str]: Marker for the latest write of this request, else the marker it arrived with
+    """
+    writes = _request_writes.get()
+    if writes is None:
+        return None
+    if writes.written:
+        user_id, written_at = max(writes.written.items(), key=lambda item: item[1])
+        return encode_write_marker(user_id, written_at)
+    if writes.marker is not None:
+        return encode_write_marker(*writes.marker)
+    return None
+
+
+def _marker_from_headers(headers) -> Optional[Tuple[str, float]]:
+    for name, value in headers:
+        if name == WRITE_MARKER_HEADER.lower().encode():
+            return decode_write_marker(value.decode("latin-1"))
+    for name, value in headers:
+        if name == b"cookie":
+            cookie = SimpleCookie()
+            cookie.load(value.decode("latin-1"))
+            if WRITE_MARKER_COOKIE in cookie:
+                return decode_write_marker(cookie[WRITE_MARKER_COOKIE].value)
+    return None
+
+
+class WriteMarkerMiddleware:
+    """
+    ASGI middleware that reads the request's write marker and sets a new one after writes.
+
+    Markers are only set while a read replica is configured; without one every
+    read goes to the primary anyway.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        writes = RequestWrites(marker=_marker_from_headers(scope["headers"]))
+        token = _request_writes.set(writes)
+
+        async def send_with_marker(message):
+            if message["type"] == "http.response.start" and writes.written and settings.NEON_READ_DB_URL:
+                marker = current_write_marker()
+                max_age = math.ceil(settings.READ_YOUR_WRITES_SECONDS)
+                headers = list(message.get("headers", []))
+                headers.append((WRITE_MARKER_HEADER.lower().encode(), marker.encode()))
+                headers.append((
+                    b"set-cookie",
+                    f"{WRITE_MARKER_COOKIE}={marker}; Max-Age={max_age}; Path=/; HttpOnly; SameSite=Lax".encode()
+                ))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_marker)
+        finally:
+            _request_writes.reset(token)
@@ -5,13 +5,17 @@ task operations as tools for the AI agent.
 """
 
 import asyncio
+import importlib
+import pkgutil
 import json
 from typing import Dict, Any, List
 from pydantic import BaseModel
 import uvicorn
 from fastapi import FastAPI, HTTPException
 from starlette.middleware.cors import CORSMiddleware
+from ..database.write_marker import WriteMarkerMiddleware
 from ..utils.logging_config import get_logger
+from ..utils.metrics import instrument_tool
 
 
 # Global configuration
@@ -45,6 +49,8 @@ class MCPServer:
             allow_methods=["*"],
             allow_headers=["*"],
         )
+        # Reads of a user who just wrote stay on the primary, whichever process made the write
+        self.app.add_middleware(WriteMarkerMiddleware)
 
         self._setup_routes()
 
@@ -79,11 +85,12 @@ class MCPServer:
             return {"tools": list(self.tools.keys())}
 
     def register_tool(self, name: str):
-        """Register a function as an MCP tool. This is a decorator factory."""
+        """Register a function as an MCP tool, timed in mcp_tool_duration_seconds. This is a decorator factory."""
         def decorator(func):
             self.logger.info(f"Registering tool: {name}")
-            self.tools[name] = func
-            return func
+            tool = instrument_tool(name, func)
+            self.tools[name] = tool
+            return tool
         return decorator
 
     def start(self, host: str = "localhost", port: int = 8001):
@@ -102,6 +109,14 @@ def get_mcp_server():
     return mcp_server
 
 
+def load_tools():
+    """Import every module in src.mcp_server.tools so its tools register on mcp_server."""
+    from . import tools
+    for module in pkgutil.iter_modules(tools.__path__):
+        importlib.import_module(f"{tools.__name__}.{module.name}")
+    return mcp_server.tools
+
+
 # Example of how to register a tool (this would be done in the tool files)
 # @mcp_server.register_tool("example_tool")
 # async def example_tool(arg1: str, arg2: int):
@@ -7,6 +7,7 @@ from typing import Dict, Any
 from ..server import mcp_server
 from sqlmodel import Session, select
 from ...models.task import Task, TaskCreate, PriorityEnum
+from ...services.task_cache import task_cache
 from contextlib import contextmanager
 from ...utils.logging_config import get_logger
 
@@ -43,9 +44,8 @@ async def add_task(user_id: str, title: str, description: str = "", priority: st
 
     try:
         # Import database session here to avoid circular imports
-        from sqlmodel import Session
-        from src.database.connection import engine
-        from src.services.task_service import TaskService
+        from src.database.session import get_async_db_session
+        from src.services.async_task_service import AsyncTaskService
         from src.models.task import TaskCreate
 
         # Validate inputs
@@ -58,10 +58,10 @@ async def add_task(user_id: str, title: str, description: str = "", priority: st
 
         # Validate and convert priority
         validated_priority = get_valid_priority(priority)
-        logger.debug(f"Validated priority: {validated_priority}")
+        logger.debug("Validated priority: %s", validated_priority)
 
         # Create database session
-        with Session(engine) as db_session:
+        async with get_async_db_session(user_id) as db_session:
             logger.debug("Creating database session for add_task")
 
             # Create task using the TaskService
@@ -73,8 +73,8 @@ async def add_task(user_id: str, title: str, description: str = "", priority: st
                 completed=False
             )
 
-            task_service = TaskService()
-            created_task = task_service.create_task(task_create, db_session)
+            task_service = AsyncTaskService()
+            created_task = await task_service.create_task(task_create, db_session)
 
             # Convert to dict for response
             task_dict = {
@@ -129,7 +129,7 @@ def add_task_with_db_session(user_id: str, title: str, description: str = "", pr
 
         # Validate and convert priority
         validated_priority = get_valid_priority(priority)
-        logger.debug(f"Validated priority: {validated_priority}")
+        logger.debug("Validated priority: %s", validated_priority)
 
         # Create the task object using the Task model from Phase II
         task_create = TaskCreate(
@@ -145,6 +145,7 @@ def add_task_with_db_session(user_id: str, title: str, description: str = "", pr
         # Add to database
         db_session.add(task)
         db_session.commit()
+        task_cache.invalidate(user_id)
         db_session.refresh(task)
 
         # Convert to dictionary for response
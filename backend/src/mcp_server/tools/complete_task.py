@@ -7,6 +7,7 @@ from typing import Dict, Any
 from ..server import mcp_server
 from sqlmodel import Session, select
 from ...models.task import Task
+from ...services.task_cache import task_cache
 
 
 @mcp_server.register_tool("complete_task")
@@ -23,9 +24,8 @@ async def complete_task(user_id: str, task_id: str) -> Dict[str, Any]:
     """
     try:
         # Import database session here to avoid circular imports
-        from sqlmodel import Session
-        from src.database.connection import engine
-        from src.services.task_service import TaskService
+        from src.database.session import get_async_db_session
+        from src.services.async_task_service import AsyncTaskService
         from src.models.task import TaskUpdate
 
         # Validate inputs
@@ -36,12 +36,12 @@ async def complete_task(user_id: str, task_id: str) -> Dict[str, Any]:
             }
 
         # Create database session
-        with Session(engine) as db_session:
-            task_service = TaskService()
+        async with get_async_db_session(user_id) as db_session:
+            task_service = AsyncTaskService()
 
             # Update the task to mark as completed
             task_update = TaskUpdate(completed=True)
-            updated_task = task_service.update_task(
+            updated_task = await task_service.update_task(
                 task_id=task_id,
                 user_id=user_id,
                 task_update=task_update,
@@ -107,6 +107,7 @@ def complete_task_with_db_session(user_id: str, task_id: str, db_session: Sessio
         task.completed = True
         db_session.add(task)
         db_session.commit()
+        task_cache.invalidate(user_id)
         db_session.refresh(task)
 
         # Convert to dictionary for response
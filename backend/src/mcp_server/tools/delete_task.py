@@ -7,6 +7,8 @@ from typing import Dict, Any
 from ..server import mcp_server
 from sqlmodel import Session, select, delete
 from ...models.task import Task
+from ...models.task_tombstone import TaskTombstone
+from ...services.task_cache import task_cache
 
 
 @mcp_server.register_tool("delete_task")
@@ -23,9 +25,8 @@ async def delete_task(user_id: str, task_id: str) -> Dict[str, Any]:
     """
     try:
         # Import database session here to avoid circular imports
-        from sqlmodel import Session
-        from src.database.connection import engine
-        from src.services.task_service import TaskService
+        from src.database.session import get_async_db_session
+        from src.services.async_task_service import AsyncTaskService
 
         # Validate inputs
         if not user_id or not task_id:
@@ -35,11 +36,11 @@ async def delete_task(user_id: str, task_id: str) -> Dict[str, Any]:
             }
 
         # Create database session
-        with Session(engine) as db_session:
-            task_service = TaskService()
+        async with get_async_db_session(user_id) as db_session:
+            task_service = AsyncTaskService()
 
             # Delete the task
-            success = task_service.delete_task(
+            success = await task_service.delete_task(
                 task_id=task_id,
                 user_id=user_id,
                 db=db_session
@@ -94,9 +95,11 @@ def delete_task_with_db_session(user_id: str, task_id: str, db_session: Session
                 "error": "Task not found or does not belong to user"
             }
 
-        # Delete the task from the database
+        # Delete the task from the database, leaving a tombstone for delta sync clients
         db_session.delete(task)
+        db_session.add(TaskTombstone(task_id=task_id, user_id=user_id))
         db_session.commit()
+        task_cache.invalidate(user_id)
 
         return {
             "success": True,
@@ -4,63 +4,72 @@ This tool allows the AI agent to retrieve all tasks for a user.
 """
 
 from typing import Dict, Any, List
+from pydantic_core import to_jsonable_python
 from ..server import mcp_server
 from sqlmodel import Session, select
 from ...models.task import Task
+from .add_task import get_valid_priority
+
+# Every listed task is sent to the LLM, so results are capped to keep token cost bounded
+DEFAULT_LIST_LIMIT = 50
+MAX_LIST_LIMIT = 100
 
 
 @mcp_server.register_tool("list_tasks")
-async def list_tasks(user_id: str, status: str = "all") -> Dict[str, Any]:
+async def list_tasks(user_id: str, status: str = "all", priority: str = None, sort_by: str = "created_at", sort_order: str = "asc", limit: int = DEFAULT_LIST_LIMIT) -> Dict[str, Any]:
     """
     Retrieve tasks for the specified user.
 
     Args:
         user_id: The ID of the user whose tasks to retrieve
         status: Filter by status ('all', 'pending', 'completed') - defaults to 'all'
+        priority: Filter by priority ('low', 'medium', 'high') - optional
+        sort_by: Sort field ('created_at', 'updated_at', 'priority', 'title') - defaults to 'created_at'
+        sort_order: Sort direction ('asc', 'desc') - defaults to 'asc'
+        limit: Maximum number of tasks to return - defaults to 50, at most 100
 
     Returns:
-        Dictionary containing a list of tasks
+        Dictionary containing a list of tasks; "truncated" is True when more tasks matched
     """
     try:
         # Import database session here to avoid circular imports
-        from sqlmodel import Session
-        from src.database.connection import engine
-        from src.services.task_service import TaskService
+        from src.database.session import get_async_read_db_session
+        from src.services.async_task_service import AsyncTaskService
+
+        limit = min(max(limit or DEFAULT_LIST_LIMIT, 1), MAX_LIST_LIMIT)
 
         # Create database session
-        with Session(engine) as db_session:
-            task_service = TaskService()
-
-            # Get all tasks for the user
-            tasks = task_service.get_tasks(user_id=user_id, db=db_session)
-
-            # Filter by status if specified
-            if status == "pending":
-                filtered_tasks = [task for task in tasks if not task.completed]
-            elif status == "completed":
-                filtered_tasks = [task for task in tasks if task.completed]
-            else:  # all
-                filtered_tasks = tasks
-
-            # Convert to dict for response
-            tasks_list = []
-            for task in filtered_tasks:
-                task_dict = {
-                    "id": task.id,
-                    "user_id": task.user_id,
-                    "title": task.title,
-                    "description": task.description,
-                    "completed": task.completed,
-                    "priority": task.priority.value if hasattr(task.priority, 'value') else task.priority,
-                    "created_at": task.created_at.isoformat() if hasattr(task.created_at, 'isoformat') else str(task.created_at),
-                    "updated_at": task.updated_at.isoformat() if hasattr(task.updated_at, 'isoformat') else str(task.updated_at)
-                }
-                tasks_list.append(task_dict)
-
-            return {
+        async with get_async_read_db_session(user_id) as db_session:
+            task_service = AsyncTaskService()
+
+            # Get the user's task rows, filtered and ordered in the database; one extra
+            # row tells whether the list was cut off without a separate count
+            rows = await task_service.get_task_rows(
+                user_id=user_id,
+                db=db_session,
+                limit=limit + 1,
+                completed=task_service.parse_status(status),
+                priority=get_valid_priority(priority) if priority else None,
+                sort_by=sort_by,
+                sort_order=sort_order
+            )
+
+            truncated = len(rows) > limit
+
+            # Convert rows to JSON-compatible dicts (ISO timestamps, enum values) in one pass
+            tasks_list = to_jsonable_python(rows[:limit])
+
+            result = {
                 "success": True,
-                "tasks": tasks_list
+                "tasks": tasks_list,
+                "truncated": truncated
             }
+            if truncated:
+                result["message"] = (
+                    f"Showing the first {limit} matching tasks; more exist. "
+                    "Narrow the list with status or priority filters, or use search_tasks."
+                )
+            return result
     except Exception as e:
         return {
             "success": False,
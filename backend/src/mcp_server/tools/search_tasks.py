@@ -0,0 +1,40 @@
+"""
+MCP Tool: search_tasks
+This tool allows the AI agent to find a user's tasks by words in their title or description.
+"""
+
+from typing import Dict, Any
+from pydantic_core import to_jsonable_python
+from ..server import mcp_server
+
+
+@mcp_server.register_tool("search_tasks")
+async def search_tasks(user_id: str, query: str, limit: int = 10) -> Dict[str, Any]:
+    """
+    Search the specified user's tasks, best match first.
+
+    Args:
+        user_id: The ID of the user whose tasks to search
+        query: Words to look for in task titles and descriptions
+        limit: Maximum number of tasks to return - defaults to 10
+
+    Returns:
+        Dictionary containing the matching tasks
+    """
+    try:
+        # Import database session here to avoid circular imports
+        from src.database.session import get_async_read_db_session
+        from src.services.async_task_service import AsyncTaskService
+
+        async with get_async_read_db_session(user_id) as db_session:
+            rows = await AsyncTaskService.search_task_rows(user_id, query, db_session, limit=limit)
+
+            return {
+                "success": True,
+                "tasks": to_jsonable_python(rows)
+            }
+    except Exception as e:
+        return {
+            "success": False,
+            "error": f"Failed to search tasks: {str(e)}"
+        }
@@ -0,0 +1,38 @@
+"""
+MCP Tool: task_stats
+This tool allows the AI agent to get a summary of a user's tasks without listing them.
+"""
+
+from typing import Dict, Any
+from pydantic_core import to_jsonable_python
+from ..server import mcp_server
+
+
+@mcp_server.register_tool("task_stats")
+async def task_stats(user_id: str) -> Dict[str, Any]:
+    """
+    Summarise the specified user's tasks.
+
+    Args:
+        user_id: The ID of the user whose tasks to summarise
+
+    Returns:
+        Dictionary containing task counts by status and priority and the oldest pending task
+    """
+    try:
+        # Import database session here to avoid circular imports
+        from src.database.session import get_async_read_db_session
+        from src.services.async_task_service import AsyncTaskService
+
+        async with get_async_read_db_session(user_id) as db_session:
+            stats = await AsyncTaskService.get_task_stats(user_id, db_session)
+
+            return {
+                "success": True,
+                "stats": to_jsonable_python(stats)
+            }
+    except Exception as e:
+        return {
+            "success": False,
+            "error": f"Failed to get task statistics: {str(e)}"
+        }
@@ -7,6 +7,7 @@ from typing import Dict, Any
 from ..server import mcp_server
 from sqlmodel import Session, select
 from ...models.task import Task, PriorityEnum
+from ...services.task_cache import task_cache
 from .add_task import get_valid_priority
 
 
@@ -28,9 +29,8 @@ async def update_task(user_id: str, task_id: str, title: str = None, description
     """
     try:
         # Import database session here to avoid circular imports
-        from sqlmodel import Session
-        from src.database.connection import engine
-        from src.services.task_service import TaskService
+        from src.database.session import get_async_db_session
+        from src.services.async_task_service import AsyncTaskService
         from src.models.task import TaskUpdate
 
         # Validate inputs
@@ -41,8 +41,8 @@ async def update_task(user_id: str, task_id: str, title: str = None, description
             }
 
         # Create database session
-        with Session(engine) as db_session:
-            task_service = TaskService()
+        async with get_async_db_session(user_id) as db_session:
+            task_service = AsyncTaskService()
 
             # Prepare update data
             update_data = {}
@@ -60,7 +60,7 @@ async def update_task(user_id: str, task_id: str, title: str = None, description
             task_update = TaskUpdate(**update_data)
 
             # Update the task
-            updated_task = task_service.update_task(
+            updated_task = await task_service.update_task(
                 task_id=task_id,
                 user_id=user_id,
                 task_update=task_update,
@@ -140,6 +140,7 @@ def update_task_with_db_session(user_id: str, task_id: str, title: str = None, d
         # Add to database and commit
         db_session.add(task)
         db_session.commit()
+        task_cache.invalidate(user_id)
         db_session.refresh(task)
 
         # Convert to dictionary for response
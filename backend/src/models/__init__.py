@@ -1,3 +1,4 @@
 # Import all models to register them with SQLModel
 from .task import Task, TaskCreate, TaskRead, TaskUpdate  # noqa: F401
+from .task_tombstone import TaskTombstone  # noqa: F401
 from .user import User, UserCreate, UserUpdate, UserLogin, UserResponse  # noqa: F401
\ No newline at end of file
@@ -1,9 +1,81 @@
 from sqlmodel import SQLModel
 from datetime import datetime
 from typing import Optional
+import os
+import threading
+import time
 import uuid
+from sqlalchemy import String
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.types import TypeDecorator
 
 
 class Base(SQLModel):
     """Base model with common fields for all entities."""
-    pass
\ No newline at end of file
+    pass
+
+
+_uuid7_lock = threading.Lock()
+_uuid7_last_ms = 0
+_uuid7_counter = 0
+
+
+def uuid7() -> uuid.UUID:
+    """
+    Generate a time-ordered UUID version 7 (RFC 9562).
+
+    The first 48 bits are the Unix time in milliseconds, so new keys land at the
+    right-hand edge of a B-tree index instead of on random pages. The 12-bit rand_a
+    field is a counter seeded randomly each millisecond, which keeps IDs generated
+    in the same millisecond by this process in increasing order.
+
+    Returns:
+        uuid.UUID: A version 7 UUID
+    """
+    global _uuid7_last_ms, _uuid7_counter
+    with _uuid7_lock:
+        timestamp_ms = time.time_ns() // 1_000_000
+        if timestamp_ms > _uuid7_last_ms:
+            _uuid7_last_ms = timestamp_ms
+            _uuid7_counter = int.from_bytes(os.urandom(2)) & 0x7FF
+        else:
+            # Same millisecond (or the clock stepped back): keep counting from the last ID
+            timestamp_ms = _uuid7_last_ms
+            _uuid7_counter += 1
+            if _uuid7_counter > 0xFFF:
+                _uuid7_last_ms = timestamp_ms = timestamp_ms + 1
+                _uuid7_counter = 0
+        counter = _uuid7_counter
+
+    rand_b = int.from_bytes(os.urandom(8)) & 0x3FFF_FFFF_FFFF_FFFF
+    value = (timestamp_ms & 0xFFFF_FFFF_FFFF) << 80 | 0x7 << 76 | counter << 64 | 0b10 << 62 | rand_b
+    return uuid.UUID(int=value)
+
+
+class UUIDString(TypeDecorator):
+    """
+    UUID key exposed to Python as a string, for user and task IDs and the columns referencing them.
+
+    Stored as the native 16-byte uuid type on PostgreSQL and as the canonical
+    36-character string elsewhere, so SQLite databases keep their existing values.
+    On PostgreSQL a value that is not a UUID binds as NULL, which matches no row,
+    so looking up a malformed ID finds nothing instead of raising a database error.
+    """
+    impl = String
+    cache_ok = True
+
+    def load_dialect_impl(self, dialect):
+        if dialect.name == "postgresql":
+            return dialect.type_descriptor(postgresql.UUID(as_uuid=False))
+        return dialect.type_descriptor(String())
+
+    def process_bind_param(self, value, dialect):
+        if value is None or dialect.name != "postgresql":
+            return value
+        try:
+            return str(uuid.UUID(str(value)))
+        except ValueError:
+            return None
+
+    def process_result_value(self, value, dialect):
+        return None if value is None else str(value)
@@ -1,6 +1,8 @@
 from sqlmodel import SQLModel, Field, Relationship
 from datetime import datetime
 from typing import TYPE_CHECKING, Optional
+from sqlalchemy import Column
+from .base import UUIDString
 
 if TYPE_CHECKING:
     from src.models.message import Message
@@ -16,6 +18,7 @@ class Conversation(ConversationBase, table=True):
     Represents a single conversation thread between user and AI assistant.
     """
     id: int = Field(primary_key=True)
+    user_id: str = Field(sa_column=Column(UUIDString, index=True, nullable=False))
     created_at: datetime = Field(default_factory=datetime.utcnow)
     updated_at: datetime = Field(default_factory=datetime.utcnow)
 
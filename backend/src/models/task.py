@@ -1,8 +1,7 @@
 from sqlmodel import Field, SQLModel
 from datetime import datetime
 from typing import Optional
-import uuid
-from .base import Base
+from .base import Base, UUIDString, uuid7
 from enum import Enum
 
 class PriorityEnum(str, Enum):
@@ -22,19 +21,59 @@ def get_current_time():
 
 
 def get_uuid():
-    return str(uuid.uuid4())
+    return str(uuid7())
 
 
-from sqlalchemy import Column, String, DateTime, Boolean
+from sqlalchemy import Column, DateTime, Boolean, DDL, Index, event, text
 from sqlalchemy.sql import func
 
 
+# Full-text search document; the Postgres GIN index and the search query must use the same expression
+TASK_SEARCH_DOCUMENT = "to_tsvector('english', title || ' ' || coalesce(description, ''))"
+
+# SQLite searches an external-content FTS5 table over tasks, kept in sync by triggers.
+# tasks has no INTEGER PRIMARY KEY, so after a VACUUM run: INSERT INTO tasks_fts(tasks_fts) VALUES ('rebuild')
+TASK_SEARCH_SQLITE_DDL = (
+    "CREATE VIRTUAL TABLE IF NOT EXISTS tasks_fts USING fts5("
+    "title, description, content='tasks', tokenize='porter unicode61')",
+    "CREATE TRIGGER IF NOT EXISTS tasks_fts_insert AFTER INSERT ON tasks BEGIN "
+    "INSERT INTO tasks_fts(rowid, title, description) VALUES (new.rowid, new.title, new.description); "
+    "END",
+    "CREATE TRIGGER IF NOT EXISTS tasks_fts_delete AFTER DELETE ON tasks BEGIN "
+    "INSERT INTO tasks_fts(tasks_fts, rowid, title, description) VALUES ('delete', old.rowid, old.title, old.description); "
+    "END",
+    "CREATE TRIGGER IF NOT EXISTS tasks_fts_update AFTER UPDATE OF title, description ON tasks BEGIN "
+    "INSERT INTO tasks_fts(tasks_fts, rowid, title, description) VALUES ('delete', old.rowid, old.title, old.description); "
+    "INSERT INTO tasks_fts(rowid, title, description) VALUES (new.rowid, new.title, new.description); "
+    "END",
+)
+
+
 class Task(TaskBaseFields, Base, table=True):
     """Task model representing a user's todo item."""
     __tablename__ = "tasks"
+    __table_args__ = (
+        # Keyset pagination index: matches ORDER BY created_at, id within a user
+        Index("ix_tasks_user_id_created_at_id", "user_id", "created_at", "id"),
+        # Status and priority filters within a user
+        Index("ix_tasks_user_id_completed", "user_id", "completed"),
+        Index("ix_tasks_user_id_priority", "user_id", "priority"),
+        # Delta sync: WHERE user_id = ? AND updated_at > ?
+        Index("ix_tasks_user_id_updated_at", "user_id", "updated_at"),
+        # Partial index covering only pending tasks (the common "what's left?" query)
+        Index(
+            "ix_tasks_user_id_pending",
+            "user_id",
+            "created_at",
+            postgresql_where=text("completed = false"),
+            sqlite_where=text("completed = 0"),
+        ),
+        # Full-text search over title and description (SQLite uses tasks_fts instead)
+        Index("ix_tasks_search", text(TASK_SEARCH_DOCUMENT), postgresql_using="gin").ddl_if(dialect="postgresql"),
+    )
 
-    id: str = Field(default=get_uuid, sa_column=Column(String, primary_key=True))
-    user_id: str = Field(nullable=False)  # Foreign key to user
+    id: str = Field(default=get_uuid, sa_column=Column(UUIDString, primary_key=True))
+    user_id: str = Field(sa_column=Column(UUIDString, nullable=False))  # Foreign key to user
     created_at: datetime = Field(default=get_current_time, sa_column=Column(DateTime(timezone=True), server_default=func.now()))
     updated_at: datetime = Field(default=get_current_time, sa_column=Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now()))
 
@@ -49,6 +88,10 @@ class Task(TaskBaseFields, Base, table=True):
             kwargs['updated_at'] = get_current_time()
         super().__init__(**kwargs)
 
+for statement in TASK_SEARCH_SQLITE_DDL:
+    event.listen(Task.__table__, "after_create", DDL(statement).execute_if(dialect="sqlite"))
+event.listen(Task.__table__, "before_drop", DDL("DROP TABLE IF EXISTS tasks_fts").execute_if(dialect="sqlite"))
+
 class TaskRead(TaskBaseFields, Base):
     """Schema for reading task data."""
     id: str
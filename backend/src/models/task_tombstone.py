@@ -0,0 +1,18 @@
+from sqlmodel import Field
+from datetime import datetime
+from sqlalchemy import Column, DateTime, Index, String
+from .base import Base, UUIDString
+from .task import get_current_time
+
+
+class TaskTombstone(Base, table=True):
+    """Marker left behind by a deleted task so delta sync clients learn about the deletion."""
+    __tablename__ = "task_tombstones"
+    __table_args__ = (
+        # Delta sync: WHERE user_id = ? AND deleted_at > ?
+        Index("ix_task_tombstones_user_id_deleted_at", "user_id", "deleted_at"),
+    )
+
+    task_id: str = Field(sa_column=Column(String, primary_key=True))
+    user_id: str = Field(sa_column=Column(UUIDString, nullable=False))
+    deleted_at: datetime = Field(default_factory=get_current_time, sa_column=Column(DateTime(timezone=True), nullable=False))
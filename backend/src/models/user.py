@@ -1,8 +1,8 @@
 from sqlmodel import SQLModel, Field, Column, DateTime
 from typing import Optional
 from datetime import datetime
-import uuid
 from pydantic import BaseModel, EmailStr
+from .base import UUIDString, uuid7
 
 
 def get_current_time():
@@ -10,7 +10,7 @@ def get_current_time():
 
 
 def get_uuid():
-    return str(uuid.uuid4())
+    return str(uuid7())
 
 
 class UserBase(SQLModel):
@@ -20,7 +20,7 @@ class UserBase(SQLModel):
 
 class User(UserBase, table=True):
     __tablename__ = "users"  # Use 'users' instead of 'user' to avoid PostgreSQL reserved keyword
-    id: str = Field(default_factory=get_uuid, primary_key=True)
+    id: str = Field(default_factory=get_uuid, sa_column=Column(UUIDString, primary_key=True))
     hashed_password: str = Field(nullable=False)
     created_at: datetime = Field(default_factory=get_current_time)
     updated_at: datetime = Field(default_factory=get_current_time)
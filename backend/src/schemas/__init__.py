@@ -21,7 +21,15 @@ from .task_schemas import (
     TokenData,
     TokenResponse,
     PaginationParams,
-    BatchOperationResponse
+    BatchOperationType,
+    BatchOperation,
+    BatchOperationRequest,
+    BatchOperationResult,
+    BatchOperationResponse,
+    TaskStatsResponse,
+    TaskImportError,
+    TaskImportResponse,
+    TaskChangesResponse
 )
 
 __all__ = [
@@ -39,5 +47,13 @@ __all__ = [
     "TokenData",
     "TokenResponse",
     "PaginationParams",
-    "BatchOperationResponse"
+    "BatchOperationType",
+    "BatchOperation",
+    "BatchOperationRequest",
+    "BatchOperationResult",
+    "BatchOperationResponse",
+    "TaskStatsResponse",
+    "TaskImportError",
+    "TaskImportResponse",
+    "TaskChangesResponse"
 ]
\ No newline at end of file
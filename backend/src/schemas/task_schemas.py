@@ -1,5 +1,5 @@
 from pydantic import BaseModel, Field
-from typing import Optional
+from typing import Any, Dict, List, Optional
 from datetime import datetime
 from enum import Enum
 
@@ -100,9 +100,72 @@ class PaginationParams(BaseModel):
     limit: int = Field(default=100, ge=1, le=1000, description="Maximum number of records to return")
 
 
+class BatchOperationType(str, Enum):
+    """Enum for batch operation types."""
+    CREATE = "create"
+    UPDATE = "update"
+    DELETE = "delete"
+    TOGGLE = "toggle"
+
+
+class BatchOperation(BaseModel):
+    """Schema for a single operation inside a batch request."""
+    op: BatchOperationType
+    task_id: Optional[str] = Field(None, description="Target task ID (required for update, delete and toggle)")
+    title: Optional[str] = Field(None, min_length=1, max_length=200, description="Task title (required for create)")
+    description: Optional[str] = Field(None, max_length=1000, description="Task description")
+    completed: Optional[bool] = Field(None, description="Completion status")
+    priority: Optional[str] = Field(None, pattern="^(low|medium|high)$", description="Priority level (low, medium, high)")
+
+
+class BatchOperationRequest(BaseModel):
+    """Schema for a batch of task operations executed in one transaction."""
+    operations: List[BatchOperation] = Field(..., min_length=1, max_length=500)
+
+
+class BatchOperationResult(BaseModel):
+    """Schema for the outcome of a single batch operation."""
+    index: int
+    op: BatchOperationType
+    task_id: Optional[str] = None
+    success: bool
+    error: Optional[str] = None
+    task: Optional[Dict[str, Any]] = None
+
+
 class BatchOperationResponse(BaseModel):
     """Schema for batch operation responses."""
     success_count: int
     failure_count: int
     total_count: int
-    message: str
\ No newline at end of file
+    message: str
+    results: List[BatchOperationResult] = []
+
+class TaskStatsResponse(BaseModel):
+    """Schema for a user's task statistics."""
+    total: int
+    completed: int
+    pending: int
+    by_priority: Dict[str, int] = Field(..., description="Task counts keyed by priority (low, medium, high)")
+    pending_by_priority: Dict[str, int] = Field(..., description="Pending task counts keyed by priority")
+    oldest_pending_task: Optional[Dict[str, Any]] = Field(None, description="The pending task created first, if any")
+
+
+class TaskImportError(BaseModel):
+    """Schema for a row rejected during a bulk import."""
+    line: int = Field(..., description="1-based line number in the uploaded file")
+    error: str
+
+
+class TaskImportResponse(BaseModel):
+    """Schema for bulk import responses."""
+    imported: int
+    failed: int
+    errors: List[TaskImportError] = Field(default=[], description="The first rejected rows (capped)")
+
+
+class TaskChangesResponse(BaseModel):
+    """Schema for delta sync responses."""
+    tasks: List[Dict[str, Any]] = Field(..., description="Tasks created or updated since the sync token; changes just before it may repeat, so apply them by id and updated_at")
+    deleted: List[str] = Field(..., description="IDs of tasks deleted since the sync token; may repeat like tasks")
+    next_token: str = Field(..., description="Token to pass as since on the next sync")
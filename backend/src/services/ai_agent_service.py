@@ -1,11 +1,15 @@
 import asyncio
+import time
 from typing import Dict, Any, Optional
-from openai import OpenAI
-from src.mcp_server.server import mcp_server
+from openai import AsyncOpenAI
+from src.config.settings import settings
+from src.database.write_marker import WRITE_MARKER_HEADER, current_write_marker
+from src.mcp_server.server import load_tools, mcp_server
 import json
-import requests
+import httpx
 import re
 from src.utils.logging_config import get_logger
+from src.utils.metrics import LLM_REQUEST_DURATION, MCP_TOOL_CALL_DURATION, observe_duration, track_duration
 
 
 class AIAgentService:
@@ -17,7 +21,7 @@ class AIAgentService:
         # Configure OpenAI client for OpenRouter, but only if API key exists
         if openrouter_api_key and openrouter_api_key.strip():
             try:
-                self.client = OpenAI(
+                self.client = AsyncOpenAI(
                     api_key=openrouter_api_key,
                     base_url="https://openrouter.ai/api/v1"
                 )
@@ -34,7 +38,7 @@ class AIAgentService:
         self.mcp_server = mcp_server
         # Hardcode the backend URL
         self.mcp_server_url = "https://muhammedsuhaib-raheel.hf.space"
-        self.logger.debug(f"MCP server URL set to: {self.mcp_server_url}")
+        self.logger.debug("MCP server URL set to: %s", self.mcp_server_url)
 
     def initialize_agent_with_tools(self):
         """
@@ -42,9 +46,12 @@ class AIAgentService:
         """
         self.logger.info("Initializing AI agent with MCP tools")
 
+        if settings.MCP_TOOLS_IN_PROCESS:
+            load_tools()
+
         # Get the list of available tools from the MCP server
         self.available_tools = list(self.mcp_server.tools.keys())
-        self.logger.debug(f"Available tools: {self.available_tools}")
+        self.logger.debug("Available tools: %s", self.available_tools)
 
         # Create tool definitions for OpenAI
         self.openai_tools = []
@@ -80,12 +87,28 @@ class AIAgentService:
 
             elif tool_name == "list_tasks":
                 # list_tasks only needs user_id which is already included
-                # Add optional status parameter
-                tool_def["function"]["parameters"]["properties"]["status"] = {
-                    "type": "string",
-                    "description": "Filter by status ('all', 'pending', 'completed') - defaults to 'all'"
-                }
-                pass
+                # Add optional filter and sort parameters
+                tool_def["function"]["parameters"]["properties"].update({
+                    "status": {"type": "string", "description": "Filter by status ('all', 'pending', 'completed') - defaults to 'all'"},
+                    "priority": {"type": "string", "description": "Filter by priority (low, medium, high) - optional"},
+                    "sort_by": {"type": "string", "description": "Sort by 'created_at', 'updated_at', 'priority' or 'title' - defaults to 'created_at'"},
+                    "sort_order": {"type": "string", "description": "Sort direction ('asc', 'desc') - defaults to 'asc'"},
+                    "limit": {"type": "integer", "description": "Maximum number of tasks to return - defaults to 50, at most 100; the result says when it was truncated"}
+                })
+
+            elif tool_name == "search_tasks":
+                tool_def["function"]["parameters"]["properties"].update({
+                    "query": {"type": "string", "description": "Words to look for in task titles and descriptions"},
+                    "limit": {"type": "integer", "description": "Maximum number of tasks to return - defaults to 10"}
+                })
+                tool_def["function"]["parameters"]["required"].append("query")
+
+            elif tool_name == "task_stats":
+                # task_stats only needs user_id; it returns counts instead of every task
+                tool_def["function"]["description"] = (
+                    "Get a summary of the user's tasks: total, completed and pending counts, "
+                    "counts by priority and the oldest pending task"
+                )
 
             elif tool_name == "complete_task":
                 tool_def["function"]["parameters"]["properties"]["task_id"] = {
@@ -112,7 +135,7 @@ class AIAgentService:
                 tool_def["function"]["parameters"]["required"].append("task_id")
 
             self.openai_tools.append(tool_def)
-            self.logger.debug(f"Added tool definition for: {tool_name}")
+            self.logger.debug("Added tool definition for: %s", tool_name)
 
         self.logger.info(f"AI agent initialized with {len(self.openai_tools)} tools")
         return self
@@ -129,7 +152,7 @@ class AIAgentService:
             Dictionary containing the AI response and any tool calls made
         """
         self.logger.info(f"Processing user input: {user_input[:50]}...")
-        self.logger.debug(f"Conversation history length: {len(conversation_history) if conversation_history else 0}")
+        self.logger.debug("Conversation history length: %s", len(conversation_history) if conversation_history else 0)
 
         # If we have a client (OpenRouter is properly configured), use it
         if self.client:
@@ -144,14 +167,16 @@ class AIAgentService:
             try:
                 # Call OpenRouter API with tools
                 self.logger.debug("Calling OpenRouter API with tools")
-                response = self.client.chat.completions.create(
-                    model="openai/gpt-oss-120b:free",  # Using the specified OpenRouter free model
-                    messages=messages,
-                    tools=self.openai_tools,
-                    tool_choice="auto",
-                    max_tokens=1000,
-                    temperature=0.7
-                )
+                model = "openai/gpt-oss-120b:free"  # Using the specified OpenRouter free model
+                with track_duration(LLM_REQUEST_DURATION, model=model):
+                    response = await self.client.chat.completions.create(
+                        model=model,
+                        messages=messages,
+                        tools=self.openai_tools,
+                        tool_choice="auto",
+                        max_tokens=1000,
+                        temperature=0.7
+                    )
 
                 # Process the response
                 choice = response.choices[0]
@@ -365,9 +390,9 @@ class AIAgentService:
             "tool_responses": []
         }
 
-    def execute_tool_call(self, tool_name: str, tool_arguments: Dict[str, Any], user_id: str) -> Dict[str, Any]:
+    async def execute_tool_call(self, tool_name: str, tool_arguments: Dict[str, Any], user_id: str) -> Dict[str, Any]:
         """
-        Execute an MCP tool call.
+        Execute an MCP tool call on the MCP server, without blocking the event loop.
 
         Args:
             tool_name: Name of the tool to call
@@ -378,7 +403,7 @@ class AIAgentService:
             Result of the tool execution
         """
         self.logger.info(f"Executing tool call: {tool_name} for user: {user_id}")
-        self.logger.debug(f"Tool arguments: {tool_arguments}")
+        self.logger.debug("Tool arguments: %s", tool_arguments)
 
         # Add user_id to arguments to ensure proper scoping
         tool_arguments['user_id'] = user_id
@@ -386,19 +411,23 @@ class AIAgentService:
         # Make a request to the MCP server to execute the tool
         try:
             # Add timeout to prevent hanging requests
-            self.logger.debug(f"Making request to MCP server: {self.mcp_server_url}/execute")
-            response = requests.post(
-                f"{self.mcp_server_url}/execute",
-                json={
-                    "name": tool_name,
-                    "arguments": tool_arguments
-                },
-                timeout=30  # 30 second timeout
-            )
+            self.logger.debug("Making request to MCP server: %s/execute", self.mcp_server_url)
+            # Pass on the user's write marker so the MCP server keeps their reads off a lagging replica
+            write_marker = current_write_marker()
+            headers = {WRITE_MARKER_HEADER: write_marker} if write_marker else {}
+            async with httpx.AsyncClient(timeout=30) as client:  # 30 second timeout
+                response = await client.post(
+                    f"{self.mcp_server_url}/execute",
+                    json={
+                        "name": tool_name,
+                        "arguments": tool_arguments
+                    },
+                    headers=headers
+                )
 
             if response.status_code == 200:
                 result = response.json()
-                self.logger.debug(f"MCP server response: {result}")
+                self.logger.debug("MCP server response: %s", result)
 
                 # The MCP server returns a response in the format:
                 # {"success": true/false, "result": actual_tool_result, "error": error_message}
@@ -432,13 +461,13 @@ class AIAgentService:
                     "error": f"Tool execution failed with status {response.status_code}",
                     "details": response.text
                 }
-        except requests.exceptions.ConnectionError:
+        except httpx.ConnectError:
             self.logger.error(f"Cannot connect to MCP server at {self.mcp_server_url}")
             return {
                 "error": f"Cannot connect to MCP server at {self.mcp_server_url}. Please ensure the MCP server is running.",
                 "details": "Connection error"
             }
-        except requests.exceptions.Timeout:
+        except httpx.TimeoutException:
             self.logger.error("Tool execution timed out")
             return {
                 "error": "Tool execution timed out. The MCP server may be busy or unresponsive.",
@@ -451,6 +480,43 @@ class AIAgentService:
                 "details": str(type(e).__name__)
             }
 
+    async def execute_tool_call_in_process(self, tool_name: str, tool_arguments: Dict[str, Any], user_id: str) -> Dict[str, Any]:
+        """
+        Execute an MCP tool registered in this process, without the HTTP round trip.
+
+        Tools open their sessions with get_async_db_session, so inside the chat
+        endpoint's share_transaction their writes join the turn's transaction.
+
+        Args:
+            tool_name: Name of the tool to call
+            tool_arguments: Arguments for the tool
+            user_id: ID of the authenticated user
+
+        Returns:
+            Result of the tool execution, or an error dictionary like execute_tool_call
+        """
+        self.logger.info(f"Executing tool call in process: {tool_name} for user: {user_id}")
+        tool_arguments['user_id'] = user_id
+
+        tool = self.mcp_server.tools.get(tool_name)
+        if tool is None:
+            self.logger.error(f"Tool {tool_name} not found")
+            return {"error": f"Tool {tool_name} not found", "details": "Unknown tool"}
+
+        try:
+            result = await tool(**tool_arguments)
+        except Exception as e:
+            self.logger.error(f"Failed to execute tool {tool_name}: {str(e)}")
+            return {"error": f"Failed to execute tool: {str(e)}", "details": str(type(e).__name__)}
+
+        if isinstance(result, dict) and result.get("success") is False:
+            error_msg = result.get('error', 'Unknown error from tool execution')
+            self.logger.error(f"Tool execution failed: {error_msg}")
+            return {"error": f"Tool execution failed: {error_msg}", "details": result}
+
+        self.logger.info(f"Tool call {tool_name} executed successfully")
+        return result
+
     async def process_natural_language_request(
         self,
         user_input: str,
@@ -469,13 +535,13 @@ class AIAgentService:
             Dictionary with the final response and execution details
         """
         self.logger.info(f"Processing natural language request for user: {user_id}, conversation: {conversation_id}")
-        self.logger.debug(f"User input: {user_input}")
+        self.logger.debug("User input: %s", user_input)
 
         # Get conversation history if available
         conversation_history = []
         if conversation_id:
             # In a real implementation, we'd fetch the conversation history
-            self.logger.debug(f"Using conversation history for context: {conversation_id}")
+            self.logger.debug("Using conversation history for context: %s", conversation_id)
             pass
 
         try:
@@ -487,12 +553,26 @@ class AIAgentService:
             if result.get('tool_calls'):
                 self.logger.info(f"Executing {len(result['tool_calls'])} tool calls")
                 for tool_call in result['tool_calls']:
-                    self.logger.debug(f"Executing tool call: {tool_call['name']} with args: {tool_call['arguments']}")
-
-                    tool_result = self.execute_tool_call(
-                        tool_call['name'],
-                        tool_call['arguments'],
-                        user_id
+                    self.logger.debug("Executing tool call: %s with args: %s", tool_call['name'], tool_call['arguments'])
+
+                    tool_started = time.perf_counter()
+                    if settings.MCP_TOOLS_IN_PROCESS:
+                        tool_result = await self.execute_tool_call_in_process(
+                            tool_call['name'],
+                            tool_call['arguments'],
+                            user_id
+                        )
+                    else:
+                        tool_result = await self.execute_tool_call(
+                            tool_call['name'],
+                            tool_call['arguments'],
+                            user_id
+                        )
+                    observe_duration(
+                        MCP_TOOL_CALL_DURATION,
+                        tool_started,
+                        tool=tool_call['name'],
+                        outcome="error" if isinstance(tool_result, dict) and 'error' in tool_result else "success"
                     )
 
                     # Add tool result to the response
@@ -527,6 +607,9 @@ class AIAgentService:
                                     task_list_str += f"    Description: {task.get('description')}\n"
                                 task_list_str += f"    Priority: {task.get('priority', 'medium')}\n\n"
 
+                            if result['tool_results'][0].get('truncated'):
+                                task_list_str += f"Showing your first {len(tasks)} tasks; filter by status or priority, or search, to see others.\n"
+
                             result['response'] = task_list_str.strip()
                             self.logger.info(f"Formatted {len(tasks)} tasks for user display")
                         else:
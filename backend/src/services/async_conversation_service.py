@@ -0,0 +1,110 @@
+from datetime import datetime
+from typing import List, Optional, Tuple
+from sqlalchemy import delete, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.models.conversation import Conversation, ConversationCreate
+from src.models.message import Message
+from src.utils.logging_config import get_logger
+
+
+class AsyncConversationService:
+    """
+    Async counterpart of ConversationService.
+
+    Relationships are never lazy-loaded here (that would need a sync round trip);
+    messages are always fetched with explicit SELECTs.
+    """
+    logger = get_logger(__name__)
+
+    async def create_conversation(self, conversation_data: ConversationCreate, db_session: AsyncSession, commit: bool = True) -> Conversation:
+        """Create a new conversation; with commit=False it is only flushed, to be committed with the caller's other writes."""
+        self.logger.info(f"Creating conversation for user: {conversation_data.user_id}")
+        conversation = Conversation(
+            user_id=conversation_data.user_id,
+            title=conversation_data.title
+        )
+        db_session.add(conversation)
+        if commit:
+            await db_session.commit()
+        else:
+            await db_session.flush()
+        self.logger.info(f"Conversation created successfully with ID: {conversation.id}")
+        return conversation
+
+    async def get_conversation_by_id(self, conversation_id: int, db_session: AsyncSession) -> Optional[Conversation]:
+        """Retrieve a conversation by its ID."""
+        self.logger.debug("Retrieving conversation by ID: %s", conversation_id)
+        conversation = await db_session.get(Conversation, conversation_id)
+        if conversation:
+            self.logger.debug("Conversation found with ID: %s", conversation_id)
+        else:
+            self.logger.warning(f"Conversation not found with ID: {conversation_id}")
+        return conversation
+
+    async def get_conversation_fingerprint(self, conversation_id: int, db_session: AsyncSession) -> Tuple[int, Optional[datetime]]:
+        """Return the message count and latest message timestamp of a conversation without loading messages."""
+        statement = select(func.count(Message.id), func.max(Message.timestamp)).where(
+            Message.conversation_id == conversation_id
+        )
+        result = await db_session.execute(statement)
+        count, last_timestamp = result.one()
+        return count, last_timestamp
+
+    async def get_user_conversations(self, user_id: str, db_session: AsyncSession) -> List[Conversation]:
+        """Retrieve all conversations for a specific user."""
+        self.logger.info(f"Retrieving conversations for user: {user_id}")
+        result = await db_session.execute(select(Conversation).where(Conversation.user_id == user_id))
+        conversations = result.scalars().all()
+        self.logger.info(f"Retrieved {len(conversations)} conversations for user: {user_id}")
+        return conversations
+
+    async def update_conversation_title(self, conversation_id: int, title: str, db_session: AsyncSession) -> Optional[Conversation]:
+        """Update the title of a conversation."""
+        self.logger.info(f"Updating conversation {conversation_id} title to: {title}")
+        conversation = await db_session.get(Conversation, conversation_id)
+        if conversation:
+            conversation.title = title
+            conversation.updated_at = datetime.utcnow()
+            await db_session.commit()
+            self.logger.info(f"Conversation {conversation_id} title updated successfully")
+        else:
+            self.logger.warning(f"Conversation not found for update: {conversation_id}")
+        return conversation
+
+    async def add_message_to_conversation(self, conversation_id: int, message: Message, db_session: AsyncSession) -> Optional[Message]:
+        """Add a message to a conversation."""
+        self.logger.debug("Adding message to conversation: %s", conversation_id)
+        conversation = await db_session.get(Conversation, conversation_id)
+        if conversation:
+            conversation.updated_at = datetime.utcnow()
+            db_session.add(message)
+            await db_session.commit()
+            self.logger.debug("Message added to conversation: %s", conversation_id)
+            return message
+        self.logger.warning(f"Conversation not found to add message: {conversation_id}")
+        return None
+
+    async def get_conversation_messages(self, conversation_id: int, db_session: AsyncSession) -> List[Message]:
+        """Retrieve all messages for a specific conversation, oldest first."""
+        self.logger.debug("Retrieving messages for conversation: %s", conversation_id)
+        result = await db_session.execute(
+            select(Message)
+            .where(Message.conversation_id == conversation_id)
+            .order_by(Message.timestamp, Message.id)
+        )
+        messages = result.scalars().all()
+        self.logger.debug("Retrieved %s messages for conversation: %s", len(messages), conversation_id)
+        return messages
+
+    async def delete_conversation(self, conversation_id: int, db_session: AsyncSession) -> bool:
+        """Delete a conversation and its messages."""
+        self.logger.info(f"Deleting conversation: {conversation_id}")
+        await db_session.execute(delete(Message).where(Message.conversation_id == conversation_id))
+        result = await db_session.execute(delete(Conversation).where(Conversation.id == conversation_id))
+        if result.rowcount > 0:
+            await db_session.commit()
+            self.logger.info(f"Conversation deleted successfully: {conversation_id}")
+            return True
+        await db_session.rollback()
+        self.logger.warning(f"Conversation not found for deletion: {conversation_id}")
+        return False
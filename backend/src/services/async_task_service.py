@@ -0,0 +1,542 @@
+from typing import Any, Dict, List, Optional, Tuple
+from sqlalchemy import delete, insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.exc import IntegrityError
+from fastapi import HTTPException, status
+from ..models.task import Task, TaskCreate, TaskUpdate, TaskRead, PriorityEnum, get_current_time
+from ..models.task_tombstone import TaskTombstone
+from datetime import datetime
+from .task_cache import task_cache
+from ..config.settings import settings
+from .task_service import TASK_READ_COLUMNS, TaskService
+from ..utils.logging_config import get_logger
+
+
+class AsyncTaskService:
+    """
+    Async counterpart of TaskService for use from async endpoints and MCP tools.
+
+    Every database round trip is awaited on an AsyncSession, so the event loop keeps
+    serving other requests while a query is in flight. Statements, validation and
+    cache handling are shared with TaskService, so both services return the same data.
+    """
+    logger = get_logger(__name__)
+
+    # Pure helpers are shared with the sync service
+    parse_status = staticmethod(TaskService.parse_status)
+    serialize_task_rows = staticmethod(TaskService.serialize_task_rows)
+    get_next_cursor = staticmethod(TaskService.get_next_cursor)
+
+    @staticmethod
+    async def create_task(task_data: TaskCreate, db: AsyncSession) -> TaskRead:
+        """
+        Create a new task.
+
+        Args:
+            task_data (TaskCreate): Task data to create
+            db (AsyncSession): Async database session
+
+        Returns:
+            TaskRead: Created task data
+
+        Raises:
+            HTTPException: If there's an error creating the task
+        """
+        AsyncTaskService.logger.info(f"Creating task for user: {task_data.user_id}")
+
+        try:
+            db_task = Task(
+                title=task_data.title,
+                description=task_data.description,
+                completed=task_data.completed,
+                priority=task_data.priority,
+                user_id=task_data.user_id
+            )
+            # Every column is set client-side, so the result is built without a refresh round trip
+            created_task = TaskRead(
+                id=db_task.id,
+                title=db_task.title,
+                description=db_task.description,
+                completed=db_task.completed,
+                priority=db_task.priority,
+                user_id=db_task.user_id,
+                created_at=db_task.created_at,
+                updated_at=db_task.updated_at
+            )
+
+            db.add(db_task)
+            await db.commit()
+            task_cache.invalidate(task_data.user_id)
+
+            AsyncTaskService.logger.info(f"Task created successfully with ID: {created_task.id}")
+            return created_task
+        except IntegrityError as e:
+            AsyncTaskService.logger.error(f"Integrity error creating task for user {task_data.user_id}: {str(e)}")
+            await db.rollback()
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Error creating task"
+            )
+        except Exception as e:
+            AsyncTaskService.logger.error(f"Unexpected error creating task for user {task_data.user_id}: {str(e)}")
+            await db.rollback()
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Unexpected error occurred: {str(e)}"
+            )
+
+    @staticmethod
+    async def get_task(task_id: str, user_id: str, db: AsyncSession) -> TaskRead:
+        """
+        Retrieve a specific task by ID for a specific user.
+
+        Args:
+            task_id (str): ID of the task to retrieve
+            user_id (str): ID of the user who owns the task
+            db (AsyncSession): Async database session
+
+        Returns:
+            TaskRead: Retrieved task data
+
+        Raises:
+            HTTPException: If task is not found or doesn't belong to user
+        """
+        AsyncTaskService.logger.info(f"Retrieving task {task_id} for user: {user_id}")
+
+        try:
+            result = await db.execute(
+                select(*TASK_READ_COLUMNS).where(Task.id == task_id, Task.user_id == user_id)
+            )
+            row = result.mappings().first()
+
+            if not row:
+                AsyncTaskService.logger.warning(f"Task {task_id} not found for user: {user_id}")
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail="Task not found or does not belong to user"
+                )
+
+            AsyncTaskService.logger.info(f"Task {task_id} retrieved successfully for user: {user_id}")
+            return TaskRead(**row)
+        except HTTPException:
+            # Re-raise HTTP exceptions
+            raise
+        except Exception as e:
+            AsyncTaskService.logger.error(f"Unexpected error retrieving task {task_id} for user {user_id}: {str(e)}")
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Unexpected error occurred: {str(e)}"
+            )
+
+    @staticmethod
+    async def get_task_rows(
+        user_id: str,
+        db: AsyncSession,
+        skip: int = 0,
+        limit: Optional[int] = 100,
+        cursor: Optional[str] = None,
+        completed: Optional[bool] = None,
+        priority: Optional[PriorityEnum] = None,
+        sort_by: str = "created_at",
+        sort_order: str = "asc",
+        fingerprint: Optional[Tuple[int, Optional[datetime]]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Retrieve tasks for a specific user as plain row mappings.
+
+        Same query, ordering, pagination and caching as TaskService.get_task_rows.
+
+        Args:
+            user_id (str): ID of the user whose tasks to retrieve
+            db (AsyncSession): Async database session
+            skip (int): Number of records to skip (for offset pagination)
+            limit (Optional[int]): Maximum number of records to return, None for no limit
+            cursor (Optional[str]): Opaque cursor from a previous page (for keyset pagination)
+            completed (Optional[bool]): Only return tasks with this completion status
+            priority (Optional[PriorityEnum]): Only return tasks with this priority
+            sort_by (str): One of 'created_at', 'updated_at', 'priority', 'title'
+            sort_order (str): 'asc' or 'desc'
+            fingerprint (Optional[Tuple[int, Optional[datetime]]]): get_tasks_fingerprint result for
+                the same filters, if the caller already has it; used to validate the cached rows
+
+        Returns:
+            List[Dict[str, Any]]: Task rows keyed by TaskRead field name; rows may be
+            shared with the task cache and must not be mutated
+
+        Raises:
+            HTTPException: If the cursor or sort parameters are invalid
+        """
+        AsyncTaskService.logger.info(
+            f"Retrieving tasks for user: {user_id}, skip: {skip}, limit: {limit}, cursor: {cursor}, "
+            f"completed: {completed}, priority: {priority}, sort: {sort_by} {sort_order}"
+        )
+
+        cache_key = ("list", skip, limit, cursor, completed, priority, sort_by, sort_order)
+        cache_version = task_cache.get_version(user_id)
+        if fingerprint is None and task_cache.enabled and settings.TASK_CACHE_VALIDATE:
+            # Writes from other processes do not invalidate this cache, so check the rows' fingerprint
+            fingerprint = await AsyncTaskService.get_tasks_fingerprint(user_id, db, completed=completed, priority=priority)
+        cached_rows = task_cache.get(user_id, cache_key, validator=fingerprint)
+        if cached_rows is not None:
+            AsyncTaskService.logger.debug("Task cache hit for user: %s", user_id)
+            return list(cached_rows)
+
+        query = TaskService.build_task_rows_query(
+            user_id,
+            skip=skip,
+            limit=limit,
+            cursor=cursor,
+            completed=completed,
+            priority=priority,
+            sort_by=sort_by,
+            sort_order=sort_order
+        )
+
+        try:
+            result = await db.execute(query)
+            rows = [dict(row) for row in result.mappings()]
+
+            AsyncTaskService.logger.info(f"Retrieved {len(rows)} tasks for user: {user_id}")
+            task_cache.set(user_id, cache_key, tuple(rows), weight=len(rows), version=cache_version, validator=fingerprint)
+            return rows
+        except Exception as e:
+            AsyncTaskService.logger.error(f"Unexpected error retrieving tasks for user {user_id}: {str(e)}")
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Unexpected error occurred: {str(e)}"
+            )
+
+    @staticmethod
+    async def get_tasks(user_id: str, db: AsyncSession, **filters) -> List[TaskRead]:
+        """
+        Retrieve tasks for a specific user as TaskRead objects.
+
+        Args:
+            user_id (str): ID of the user whose tasks to retrieve
+            db (AsyncSession): Async database session
+            **filters: skip, limit, cursor, completed, priority, sort_by, sort_order
+
+        Returns:
+            List[TaskRead]: List of user's tasks
+        """
+        rows = await AsyncTaskService.get_task_rows(user_id, db, **filters)
+        return [TaskRead.model_construct(**row) for row in rows]
+
+    @staticmethod
+    async def search_task_rows(user_id: str, query: str, db: AsyncSession, skip: int = 0, limit: int = 20) -> List[Dict[str, Any]]:
+        """
+        Full-text search over a user's task titles and descriptions.
+
+        Args:
+            user_id (str): ID of the user whose tasks to search
+            query (str): Search text entered by the user
+            db (AsyncSession): Async database session
+            skip (int): Number of results to skip
+            limit (int): Maximum number of results to return
+
+        Returns:
+            List[Dict[str, Any]]: Matching task rows keyed by TaskRead field name, best match first
+
+        Raises:
+            HTTPException: If the query is empty or the search fails
+        """
+        AsyncTaskService.logger.info(f"Searching tasks for user: {user_id}, query: {query!r}, skip: {skip}, limit: {limit}")
+
+        statement = TaskService.build_search_query(user_id, query, db.get_bind().dialect.name, skip=skip, limit=limit)
+        try:
+            result = await db.execute(statement)
+            rows = [dict(row) for row in result.mappings()]
+            AsyncTaskService.logger.info(f"Found {len(rows)} tasks for user: {user_id}")
+            return rows
+        except Exception as e:
+            AsyncTaskService.logger.error(f"Unexpected error searching tasks for user {user_id}: {str(e)}")
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Unexpected error occurred: {str(e)}"
+            )
+
+    @staticmethod
+    async def get_task_stats(user_id: str, db: AsyncSession) -> Dict[str, Any]:
+        """
+        Summarise a user's tasks without loading them.
+
+        Args:
+            user_id (str): ID of the user whose tasks to summarise
+            db (AsyncSession): Async database session
+
+        Returns:
+            Dict[str, Any]: Counts by status and priority plus the oldest pending task
+
+        Raises:
+            HTTPException: If the statistics cannot be computed
+        """
+        AsyncTaskService.logger.info(f"Computing task statistics for user: {user_id}")
+
+        # Validating would cost as much as the stats aggregate, so stats are only
+        # cached when this process is the only writer
+        use_cache = not settings.TASK_CACHE_VALIDATE
+        cache_version = task_cache.get_version(user_id)
+        cached_stats = task_cache.get(user_id, ("stats",)) if use_cache else None
+        if cached_stats is not None:
+            AsyncTaskService.logger.debug("Task cache hit for user: %s", user_id)
+            return cached_stats
+
+        try:
+            result = await db.execute(TaskService.build_stats_query(user_id))
+            stats = TaskService.summarize_task_stats(result.mappings().all())
+            if use_cache:
+                task_cache.set(user_id, ("stats",), stats, version=cache_version)
+            return stats
+        except Exception as e:
+            AsyncTaskService.logger.error(f"Unexpected error computing task statistics for user {user_id}: {str(e)}")
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Unexpected error occurred: {str(e)}"
+            )
+
+    @staticmethod
+    async def get_task_changes(user_id: str, db: AsyncSession, since: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Return the tasks created or updated, and the IDs of tasks deleted, since a sync token.
+
+        Args:
+            user_id (str): ID of the user whose changes to read
+            db (AsyncSession): Async database session
+            since (Optional[str]): Sync token from the previous sync, None for a full sync
+
+        Returns:
+            Dict[str, Any]: tasks (TaskRead rows), deleted (task IDs) and next_token
+
+        Raises:
+            HTTPException: If the sync token is malformed
+        """
+        AsyncTaskService.logger.info(f"Reading task changes for user: {user_id}, since: {since}")
+        tasks_query, tombstones_query, since_at = TaskService.build_changes_queries(user_id, since)
+
+        try:
+            result = await db.execute(tasks_query)
+            rows = [dict(row) for row in result.mappings()]
+            tombstones = (await db.execute(tombstones_query)).all() if tombstones_query is not None else []
+            return TaskService.build_changes_response(rows, tombstones, since_at)
+        except Exception as e:
+            AsyncTaskService.logger.error(f"Unexpected error reading task changes for user {user_id}: {str(e)}")
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Unexpected error occurred: {str(e)}"
+            )
+
+    @staticmethod
+    async def get_tasks_fingerprint(
+        user_id: str,
+        db: AsyncSession,
+        completed: Optional[bool] = None,
+        priority: Optional[PriorityEnum] = None
+    ) -> Tuple[int, Optional[datetime]]:
+        """
+        Summarise a user's (filtered) task set without loading it.
+
+        Args:
+            user_id (str): ID of the user whose tasks to summarise
+            db (AsyncSession): Async database session
+            completed (Optional[bool]): Only count tasks with this completion status
+            priority (Optional[PriorityEnum]): Only count tasks with this priority
+
+        Returns:
+            Tuple[int, Optional[datetime]]: Row count and latest updated_at
+        """
+        statement = TaskService.build_tasks_fingerprint_query(user_id, completed=completed, priority=priority)
+        result = await db.execute(statement)
+        count, last_updated_at = result.one()
+        return count, last_updated_at
+
+    @staticmethod
+    async def _update_returning(statement, task_id: str, user_id: str, db: AsyncSession):
+        """
+        Execute a single-task UPDATE and return the updated row.
+
+        Args:
+            statement: UPDATE statement already filtered by task_id and user_id
+            task_id (str): ID of the task being updated
+            user_id (str): ID of the user who owns the task
+            db (AsyncSession): Async database session
+
+        Returns:
+            Optional[RowMapping]: The updated row, or None if no task matched
+        """
+        statement = statement.execution_options(synchronize_session=False)
+        if db.get_bind().dialect.update_returning:
+            result = await db.execute(statement.returning(*Task.__table__.c))
+            return result.mappings().first()
+
+        result = await db.execute(statement)
+        if result.rowcount == 0:
+            return None
+        result = await db.execute(
+            select(*Task.__table__.c).where(Task.id == task_id, Task.user_id == user_id)
+        )
+        return result.mappings().first()
+
+    @staticmethod
+    async def update_task(task_id: str, user_id: str, task_update: TaskUpdate, db: AsyncSession) -> TaskRead:
+        """
+        Update an existing task.
+
+        Args:
+            task_id (str): ID of the task to update
+            user_id (str): ID of the user who owns the task
+            task_update (TaskUpdate): Updated task data
+            db (AsyncSession): Async database session
+
+        Returns:
+            TaskRead: Updated task data
+
+        Raises:
+            HTTPException: If task is not found or doesn't belong to user
+        """
+        AsyncTaskService.logger.info(f"Updating task {task_id} for user: {user_id}")
+
+        try:
+            statement = (
+                update(Task)
+                .where(Task.id == task_id, Task.user_id == user_id)
+                .values(**task_update.model_dump(exclude_unset=True), updated_at=get_current_time())
+            )
+            row = await AsyncTaskService._update_returning(statement, task_id, user_id, db)
+
+            if not row:
+                AsyncTaskService.logger.warning(f"Task {task_id} not found for user: {user_id}")
+                await db.rollback()
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail="Task not found or does not belong to user"
+                )
+
+            await db.commit()
+            task_cache.invalidate(user_id)
+
+            AsyncTaskService.logger.info(f"Task {task_id} updated successfully for user: {user_id}")
+            return TaskRead(**row)
+        except IntegrityError as e:
+            AsyncTaskService.logger.error(f"Integrity error updating task {task_id} for user {user_id}: {str(e)}")
+            await db.rollback()
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Error updating task"
+            )
+        except HTTPException:
+            # Re-raise HTTP exceptions
+            raise
+        except Exception as e:
+            AsyncTaskService.logger.error(f"Unexpected error updating task {task_id} for user {user_id}: {str(e)}")
+            await db.rollback()
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Unexpected error occurred: {str(e)}"
+            )
+
+    @staticmethod
+    async def delete_task(task_id: str, user_id: str, db: AsyncSession) -> bool:
+        """
+        Delete a specific task by ID for a specific user.
+
+        Args:
+            task_id (str): ID of the task to delete
+            user_id (str): ID of the user who owns the task
+            db (AsyncSession): Async database session
+
+        Returns:
+            bool: True if task was deleted
+
+        Raises:
+            HTTPException: If task is not found or doesn't belong to user
+        """
+        AsyncTaskService.logger.info(f"Deleting task {task_id} for user: {user_id}")
+
+        try:
+            statement = (
+                delete(Task)
+                .where(Task.id == task_id, Task.user_id == user_id)
+                .execution_options(synchronize_session=False)
+            )
+            if db.get_bind().dialect.delete_returning:
+                result = await db.execute(statement.returning(Task.id))
+                deleted = result.first() is not None
+            else:
+                result = await db.execute(statement)
+                deleted = result.rowcount > 0
+
+            if not deleted:
+                AsyncTaskService.logger.warning(f"Task {task_id} not found for user: {user_id}")
+                await db.rollback()
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail="Task not found or does not belong to user"
+                )
+
+            # Leave a tombstone in the same transaction so delta sync clients see the deletion
+            await db.execute(insert(TaskTombstone), TaskService.tombstone_rows(user_id, [task_id]))
+            await db.commit()
+            task_cache.invalidate(user_id)
+
+            AsyncTaskService.logger.info(f"Task {task_id} deleted successfully for user: {user_id}")
+            return True
+        except HTTPException:
+            # Re-raise HTTP exceptions
+            raise
+        except Exception as e:
+            AsyncTaskService.logger.error(f"Unexpected error deleting task {task_id} for user {user_id}: {str(e)}")
+            await db.rollback()
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Unexpected error occurred: {str(e)}"
+            )
+
+    @staticmethod
+    async def toggle_task_completion(task_id: str, user_id: str, db: AsyncSession) -> TaskRead:
+        """
+        Toggle the completion status of a task.
+
+        Args:
+            task_id (str): ID of the task to toggle
+            user_id (str): ID of the user who owns the task
+            db (AsyncSession): Async database session
+
+        Returns:
+            TaskRead: Updated task data with toggled completion status
+
+        Raises:
+            HTTPException: If task is not found or doesn't belong to user
+        """
+        AsyncTaskService.logger.info(f"Toggling completion status for task {task_id} for user: {user_id}")
+
+        try:
+            statement = (
+                update(Task)
+                .where(Task.id == task_id, Task.user_id == user_id)
+                .values(completed=~Task.completed, updated_at=get_current_time())
+            )
+            row = await AsyncTaskService._update_returning(statement, task_id, user_id, db)
+
+            if not row:
+                AsyncTaskService.logger.warning(f"Task {task_id} not found for user: {user_id}")
+                await db.rollback()
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail="Task not found or does not belong to user"
+                )
+
+            await db.commit()
+            task_cache.invalidate(user_id)
+
+            AsyncTaskService.logger.info(f"Task {task_id} completion status toggled for user: {user_id}")
+            return TaskRead(**row)
+        except HTTPException:
+            # Re-raise HTTP exceptions
+            raise
+        except Exception as e:
+            AsyncTaskService.logger.error(f"Unexpected error toggling task {task_id} for user {user_id}: {str(e)}")
+            await db.rollback()
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Unexpected error occurred: {str(e)}"
+            )
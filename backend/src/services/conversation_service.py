@@ -1,4 +1,6 @@
-from typing import List, Optional
+from datetime import datetime
+from typing import List, Optional, Tuple
+from sqlalchemy import func
 from sqlmodel import Session, select
 from src.models.conversation import Conversation, ConversationCreate
 from src.models.message import Message
@@ -23,14 +25,22 @@ class ConversationService:
 
     def get_conversation_by_id(self, conversation_id: int, db_session: Session) -> Optional[Conversation]:
         """Retrieve a conversation by its ID."""
-        self.logger.debug(f"Retrieving conversation by ID: {conversation_id}")
+        self.logger.debug("Retrieving conversation by ID: %s", conversation_id)
         conversation = db_session.get(Conversation, conversation_id)
         if conversation:
-            self.logger.debug(f"Conversation found with ID: {conversation_id}")
+            self.logger.debug("Conversation found with ID: %s", conversation_id)
         else:
             self.logger.warning(f"Conversation not found with ID: {conversation_id}")
         return conversation
 
+    def get_conversation_fingerprint(self, conversation_id: int, db_session: Session) -> Tuple[int, Optional[datetime]]:
+        """Return the message count and latest message timestamp of a conversation without loading messages."""
+        statement = select(func.count(Message.id), func.max(Message.timestamp)).where(
+            Message.conversation_id == conversation_id
+        )
+        count, last_timestamp = db_session.execute(statement).one()
+        return count, last_timestamp
+
     def get_user_conversations(self, user_id: str, db_session: Session) -> List[Conversation]:
         """Retrieve all conversations for a specific user."""
         self.logger.info(f"Retrieving conversations for user: {user_id}")
@@ -57,25 +67,25 @@ class ConversationService:
 
     def add_message_to_conversation(self, conversation_id: int, message: Message, db_session: Session) -> Optional[Message]:
         """Add a message to a conversation."""
-        self.logger.debug(f"Adding message to conversation: {conversation_id}")
+        self.logger.debug("Adding message to conversation: %s", conversation_id)
         conversation = db_session.get(Conversation, conversation_id)
         if conversation:
             conversation.updated_at = conversation.updated_at  # Use current time
             db_session.add(message)
             db_session.commit()
             db_session.refresh(message)
-            self.logger.debug(f"Message added to conversation: {conversation_id}")
+            self.logger.debug("Message added to conversation: %s", conversation_id)
             return message
         self.logger.warning(f"Conversation not found to add message: {conversation_id}")
         return None
 
     def get_conversation_messages(self, conversation_id: int, db_session: Session) -> List[Message]:
         """Retrieve all messages for a specific conversation."""
-        self.logger.debug(f"Retrieving messages for conversation: {conversation_id}")
+        self.logger.debug("Retrieving messages for conversation: %s", conversation_id)
         conversation = db_session.get(Conversation, conversation_id)
         if conversation:
             messages = conversation.messages
-            self.logger.debug(f"Retrieved {len(messages)} messages for conversation: {conversation_id}")
+            self.logger.debug("Retrieved %s messages for conversation: %s", len(messages), conversation_id)
             return messages
         self.logger.warning(f"Conversation not found to retrieve messages: {conversation_id}")
         return []
@@ -0,0 +1,95 @@
+import zlib
+from typing import Iterable, Iterator
+from sqlalchemy import select
+from pydantic_core import to_json
+from ..database.session import get_read_db_session
+from ..models.conversation import Conversation
+from ..models.message import Message
+from ..models.task import Task
+from .task_service import TASK_READ_COLUMNS
+from ..utils.logging_config import get_logger
+
+
+# Conversation and message columns written to the export
+CONVERSATION_EXPORT_COLUMNS = (
+    Conversation.id,
+    Conversation.user_id,
+    Conversation.title,
+    Conversation.created_at,
+    Conversation.updated_at,
+)
+MESSAGE_EXPORT_COLUMNS = (
+    Message.id,
+    Message.conversation_id,
+    Message.sender,
+    Message.content,
+    Message.tool_calls,
+    Message.tool_responses,
+    Message.timestamp,
+)
+
+
+class ExportService:
+    """
+    Service class to stream a user's data as NDJSON.
+
+    Rows are read with server-side cursors (stream_results / yield_per) and written
+    out one chunk at a time, so memory use does not grow with the amount of data.
+    """
+    logger = get_logger(__name__)
+
+    @staticmethod
+    def iter_export_lines(user_id: str, chunk_size: int = 1000) -> Iterator[bytes]:
+        """
+        Yield a user's tasks, conversations and messages as NDJSON.
+
+        Every line is one JSON object with a "type" of "task", "conversation" or
+        "message" followed by the record's fields. Each yielded chunk holds up to
+        chunk_size lines. The generator opens its own session, so it can outlive the
+        request handler that created the response.
+
+        Args:
+            user_id (str): ID of the user whose data to export
+            chunk_size (int): Rows fetched per round trip and lines per yielded chunk
+
+        Yields:
+            bytes: Newline-terminated JSON lines
+        """
+        ExportService.logger.info(f"Exporting data for user: {user_id}")
+
+        user_conversation_ids = select(Conversation.id).where(Conversation.user_id == user_id)
+        sections = (
+            ("task", select(*TASK_READ_COLUMNS).where(Task.user_id == user_id).order_by(Task.created_at, Task.id)),
+            ("conversation", select(*CONVERSATION_EXPORT_COLUMNS).where(Conversation.user_id == user_id).order_by(Conversation.id)),
+            ("message", select(*MESSAGE_EXPORT_COLUMNS).where(Message.conversation_id.in_(user_conversation_ids)).order_by(Message.conversation_id, Message.id)),
+        )
+
+        with get_read_db_session(user_id) as db:
+            for record_type, statement in sections:
+                result = db.execute(statement.execution_options(stream_results=True, yield_per=chunk_size))
+                exported = 0
+                for partition in result.mappings().partitions():
+                    yield b"".join(to_json({"type": record_type, **row}) + b"\n" for row in partition)
+                    exported += len(partition)
+                ExportService.logger.debug("Exported %s %s records for user: %s", exported, record_type, user_id)
+
+        ExportService.logger.info(f"Export completed for user: {user_id}")
+
+    @staticmethod
+    def gzip_chunks(chunks: Iterable[bytes], level: int = 6) -> Iterator[bytes]:
+        """
+        Gzip-compress a stream of chunks incrementally.
+
+        Args:
+            chunks (Iterable[bytes]): Uncompressed chunks
+            level (int): zlib compression level
+
+        Yields:
+            bytes: Pieces of a single gzip member
+        """
+        compressor = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+        for chunk in chunks:
+            compressed = compressor.compress(chunk)
+            if compressed:
+                yield compressed
+        yield compressor.flush()
@@ -0,0 +1,259 @@
+import codecs
+import csv
+import json
+from datetime import timezone
+from typing import Any, AsyncIterable, AsyncIterator, Dict, List, Tuple
+from fastapi import HTTPException, status
+from pydantic import ValidationError
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from ..models.task import Task, TaskCreate, get_current_time, get_uuid
+from ..schemas.task_schemas import TaskImportError, TaskImportResponse
+from .task_cache import task_cache
+from ..utils.logging_config import get_logger
+
+
+# Columns written by an import, in COPY column order
+TASK_IMPORT_COLUMNS = ("id", "title", "description", "completed", "priority", "user_id", "created_at", "updated_at")
+
+# Formats accepted by import_tasks
+IMPORT_FORMATS = ("csv", "ndjson")
+
+# Rejected rows reported back to the client
+MAX_REPORTED_ERRORS = 100
+
+
+class ImportService:
+    """
+    Service class to bulk-import tasks from CSV or NDJSON uploads.
+
+    The upload is parsed and validated row by row as it arrives. Valid rows are
+    written in a single transaction: through COPY on PostgreSQL and through chunked
+    executemany INSERTs elsewhere. Invalid rows are skipped and reported.
+    """
+    logger = get_logger(__name__)
+
+    @staticmethod
+    async def iter_lines(chunks: AsyncIterable[bytes]) -> AsyncIterator[str]:
+        """
+        Split a stream of UTF-8 byte chunks into lines without buffering the whole body.
+
+        Args:
+            chunks (AsyncIterable[bytes]): Raw request body chunks
+
+        Yields:
+            str: Lines without their line terminator
+        """
+        decoder = codecs.getincrementaldecoder("utf-8-sig")()
+        pending = ""
+        async for chunk in chunks:
+            pending += decoder.decode(chunk)
+            *lines, pending = pending.split("\n")
+            for line in lines:
+                yield line.rstrip("\r")
+        pending += decoder.decode(b"", final=True)
+        if pending:
+            yield pending.rstrip("\r")
+
+    @staticmethod
+    async def iter_csv_records(lines: AsyncIterable[str]) -> AsyncIterator[Tuple[int, Dict[str, Any]]]:
+        """
+        Parse CSV lines into records keyed by the header row.
+
+        Quoted fields may span lines: a record is complete once its quotes balance.
+
+        Args:
+            lines (AsyncIterable[str]): CSV lines, header first
+
+        Yields:
+            Tuple[int, Dict[str, Any]]: Line number the record starts on and the record
+        """
+        header = None
+        record_lines: List[str] = []
+        start_line = 0
+        line_number = 0
+        async for line in lines:
+            line_number += 1
+            if not record_lines:
+                start_line = line_number
+            record_lines.append(line)
+            text = "\n".join(record_lines)
+            if text.count('"') % 2:
+                continue
+            record_lines = []
+
+            if not text.strip():
+                continue
+            values = next(csv.reader([text]))
+            if header is None:
+                header = [name.strip().lower() for name in values]
+                continue
+            yield start_line, dict(zip(header, values))
+
+        if record_lines:
+            yield start_line, {"__error__": "Unterminated quoted field"}
+
+    @staticmethod
+    async def iter_ndjson_records(lines: AsyncIterable[str]) -> AsyncIterator[Tuple[int, Dict[str, Any]]]:
+        """
+        Parse NDJSON lines into records.
+
+        Args:
+            lines (AsyncIterable[str]): One JSON object per line
+
+        Yields:
+            Tuple[int, Dict[str, Any]]: Line number and the record
+        """
+        line_number = 0
+        async for line in lines:
+            line_number += 1
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except ValueError as e:
+                yield line_number, {"__error__": f"Invalid JSON: {e}"}
+                continue
+            if not isinstance(record, dict):
+                yield line_number, {"__error__": "Each line must be a JSON object"}
+                continue
+            yield line_number, record
+
+    @staticmethod
+    def validate_record(record: Dict[str, Any], user_id: str) -> TaskCreate:
+        """
+        Validate one imported record against the task creation rules.
+
+        Empty CSV cells fall back to the field defaults and priorities are case-insensitive.
+
+        Args:
+            record (Dict[str, Any]): Parsed record
+            user_id (str): Owner of the imported tasks
+
+        Returns:
+            TaskCreate: Validated task data
+
+        Raises:
+            ValueError: If the record is not a valid task
+        """
+        if "__error__" in record:
+            raise ValueError(record["__error__"])
+
+        data = {"user_id": user_id}
+        for field in ("title", "description", "completed", "priority"):
+            value = record.get(field)
+            if isinstance(value, str):
+                value = value.strip()
+                if field == "priority":
+                    value = value.lower()
+            if value is not None and value != "":
+                data[field] = value
+
+        try:
+            return TaskCreate.model_validate(data)
+        except ValidationError as e:
+            raise ValueError("; ".join(f"{'.'.join(map(str, error['loc']))}: {error['msg']}" for error in e.errors()))
+
+    @staticmethod
+    async def import_tasks(
+        user_id: str,
+        chunks: AsyncIterable[bytes],
+        import_format: str,
+        db: AsyncSession,
+        chunk_size: int = 1000
+    ) -> TaskImportResponse:
+        """
+        Import tasks for a user from a streamed CSV or NDJSON upload.
+
+        Args:
+            user_id (str): Owner of the imported tasks
+            chunks (AsyncIterable[bytes]): Upload body chunks
+            import_format (str): 'csv' or 'ndjson'
+            db (AsyncSession): Async database session
+            chunk_size (int): Rows per executemany batch (ignored by COPY)
+
+        Returns:
+            TaskImportResponse: Imported and failed row counts and the first errors
+
+        Raises:
+            HTTPException: If the format is unknown or the rows cannot be written
+        """
+        if import_format not in IMPORT_FORMATS:
+            raise HTTPException(
+                status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+                detail=f"Unsupported import format: {import_format}"
+            )
+
+        ImportService.logger.info(f"Importing {import_format} tasks for user: {user_id}")
+        lines = ImportService.iter_lines(chunks)
+        records = ImportService.iter_csv_records(lines) if import_format == "csv" else ImportService.iter_ndjson_records(lines)
+
+        errors: List[TaskImportError] = []
+        failed = 0
+        is_postgres = db.get_bind().dialect.name == "postgresql"
+        # asyncpg's binary COPY needs timezone-aware values for timestamptz columns
+        now = get_current_time().replace(tzinfo=timezone.utc) if is_postgres else get_current_time()
+
+        async def iter_rows() -> AsyncIterator[Tuple]:
+            nonlocal failed
+            async for line_number, record in records:
+                try:
+                    task = ImportService.validate_record(record, user_id)
+                except ValueError as e:
+                    failed += 1
+                    if len(errors) < MAX_REPORTED_ERRORS:
+                        errors.append(TaskImportError(line=line_number, error=str(e)))
+                    continue
+                yield (get_uuid(), task.title, task.description, task.completed, task.priority.value, user_id, now, now)
+
+        try:
+            if is_postgres:
+                imported = await ImportService._copy_rows(iter_rows(), db)
+            else:
+                imported = await ImportService._insert_rows(iter_rows(), db, chunk_size)
+            await db.commit()
+        except HTTPException:
+            await db.rollback()
+            raise
+        except Exception as e:
+            ImportService.logger.error(f"Error importing tasks for user {user_id}: {str(e)}")
+            await db.rollback()
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Import failed, no tasks were imported: {str(e)}"
+            )
+
+        if imported:
+            task_cache.invalidate(user_id)
+        ImportService.logger.info(f"Imported {imported} tasks for user {user_id}, {failed} rows rejected")
+        return TaskImportResponse(imported=imported, failed=failed, errors=errors)
+
+    @staticmethod
+    async def _insert_rows(rows: AsyncIterable[Tuple], db: AsyncSession, chunk_size: int) -> int:
+        """Insert rows with one executemany INSERT per chunk, all in the session's transaction."""
+        statement = insert(Task.__table__)
+        imported = 0
+        chunk: List[Dict[str, Any]] = []
+        async for row in rows:
+            chunk.append(dict(zip(TASK_IMPORT_COLUMNS, row)))
+            if len(chunk) >= chunk_size:
+                await db.execute(statement, chunk)
+                imported += len(chunk)
+                chunk = []
+        if chunk:
+            await db.execute(statement, chunk)
+            imported += len(chunk)
+        return imported
+
+    @staticmethod
+    async def _copy_rows(rows: AsyncIterable[Tuple], db: AsyncSession) -> int:
+        """Stream rows into the tasks table with a single COPY over the session's asyncpg connection."""
+        connection = await db.connection()
+        raw_connection = await connection.get_raw_connection()
+        result = await raw_connection.driver_connection.copy_records_to_table(
+            Task.__tablename__,
+            records=rows,
+            columns=list(TASK_IMPORT_COLUMNS)
+        )
+        # asyncpg returns the command tag, e.g. "COPY 100000"
+        return int(result.split()[-1])
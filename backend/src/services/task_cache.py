@@ -0,0 +1,191 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional, Tuple
+from ..config.settings import settings
+from ..utils.logging_config import get_logger
+
+
+class TaskCache:
+    """
+    In-process, memory-bounded LRU cache of per-user task list snapshots.
+
+    Entries are keyed by (user_id, version, query key). Every write to a user's
+    tasks made through this process bumps that user's version, so older snapshots
+    can never be served again and simply age out of the LRU.
+
+    Versions are per process: writes by another worker or by the MCP server (where
+    the agent's tools run unless MCP_TOOLS_IN_PROCESS is set) do not bump them.
+    Entries can therefore be stored with a validator, a value read from the
+    database on every lookup such as the tasks' (count, max(updated_at))
+    fingerprint; an entry whose validator differs is stale and is dropped. Entries
+    without a validator are only bounded by the TTL, so TASK_CACHE_VALIDATE may only
+    be turned off when this process is the only writer.
+
+    Memory is bounded by the total number of cached task rows, not entries, so a
+    few very large lists cannot crowd out the limit unnoticed. Versions are kept for
+    at most max_users users; a user who drops out of that LRU gets the version
+    floor, which is raised past every dropped version, so no user's version ever
+    goes back and snapshots read before their last write stay unreachable.
+    """
+    logger = get_logger(__name__)
+
+    def __init__(self, enabled: bool = True, max_tasks: int = 10000, ttl_seconds: float = 30.0, max_users: int = 10000):
+        self.enabled = enabled
+        self.max_tasks = max_tasks
+        self.ttl_seconds = ttl_seconds
+        self.max_users = max_users
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Tuple[str, int, Hashable], Tuple[float, int, Any, Hashable]]" = OrderedDict()
+        self._versions: "OrderedDict[str, int]" = OrderedDict()
+        self._version_floor = 0
+        self._next_version = 1
+        self._size = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.stale = 0
+
+    def get_version(self, user_id: str) -> int:
+        """Return the current version counter for a user's tasks."""
+        return self._versions.get(user_id, self._version_floor)
+
+    def get(self, user_id: str, key: Hashable, validator: Hashable = None) -> Optional[Any]:
+        """
+        Look up a cached snapshot.
+
+        Args:
+            user_id (str): Owner of the cached tasks
+            key (Hashable): Query parameters that produced the snapshot
+            validator (Hashable): Current database fingerprint; a snapshot stored with a
+                different one is stale and is not served
+
+        Returns:
+            Optional[Any]: The cached value, or None on a miss
+        """
+        if not self.enabled:
+            return None
+
+        with self._lock:
+            entry_key = (user_id, self.get_version(user_id), key)
+            entry = self._entries.get(entry_key)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            expires_at, weight, value, entry_validator = entry
+            expired = expires_at < time.monotonic()
+            if expired or entry_validator != validator:
+                del self._entries[entry_key]
+                self._size -= weight
+                if expired:
+                    self.expirations += 1
+                else:
+                    self.stale += 1
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(entry_key)
+            self.hits += 1
+            return value
+
+    def set(
+        self,
+        user_id: str,
+        key: Hashable,
+        value: Any,
+        weight: int = 1,
+        version: Optional[int] = None,
+        validator: Hashable = None
+    ):
+        """
+        Store a snapshot for the user's current version.
+
+        Args:
+            user_id (str): Owner of the cached tasks
+            key (Hashable): Query parameters that produced the snapshot
+            value (Any): Snapshot to cache
+            weight (int): Number of task rows in the snapshot (used for the memory bound)
+            version (Optional[int]): Version read before the snapshot was loaded; if a write
+                happened in the meantime the snapshot may be stale and is not stored
+            validator (Hashable): Database fingerprint read before the snapshot was loaded
+        """
+        if not self.enabled:
+            return
+
+        weight = max(weight, 1)
+        if weight > self.max_tasks:
+            return
+
+        with self._lock:
+            current_version = self.get_version(user_id)
+            if version is not None and version != current_version:
+                return
+
+            entry_key = (user_id, current_version, key)
+            previous = self._entries.pop(entry_key, None)
+            if previous is not None:
+                self._size -= previous[1]
+
+            self._entries[entry_key] = (time.monotonic() + self.ttl_seconds, weight, value, validator)
+            self._size += weight
+
+            while self._size > self.max_tasks:
+                _, (_, evicted_weight, _, _) = self._entries.popitem(last=False)
+                self._size -= evicted_weight
+                self.evictions += 1
+
+    def invalidate(self, user_id: str):
+        """
+        Bump a user's version after a write so no earlier snapshot is served again.
+
+        Args:
+            user_id (str): User whose tasks changed
+        """
+        with self._lock:
+            self._versions[user_id] = self._next_version
+            self._versions.move_to_end(user_id)
+            self._next_version += 1
+            while len(self._versions) > self.max_users:
+                _, dropped_version = self._versions.popitem(last=False)
+                self._version_floor = max(self._version_floor, dropped_version)
+        self.logger.debug("Task cache invalidated for user: %s", user_id)
+
+    def clear(self):
+        """Drop every cached snapshot and reset the statistics."""
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+            self.hits = self.misses = self.evictions = self.expirations = self.stale = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """Return hit ratio, eviction counts and current size."""
+        lookups = self.hits + self.misses
+        return {
+            "enabled": self.enabled,
+            "entries": len(self._entries),
+            "versioned_users": len(self._versions),
+            "cached_tasks": self._size,
+            "max_tasks": self.max_tasks,
+            "ttl_seconds": self.ttl_seconds,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": self.hits / lookups if lookups else 0.0,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "stale": self.stale
+        }
+
+
+# Global task cache instance
+task_cache = TaskCache(
+    enabled=settings.TASK_CACHE_ENABLED,
+    max_tasks=settings.TASK_CACHE_MAX_TASKS,
+    ttl_seconds=settings.TASK_CACHE_TTL_SECONDS
+)
+
+
+def get_task_cache() -> TaskCache:
+    """Get the global task cache instance."""
+    return task_cache
@@ -1,12 +1,55 @@
-from typing import List, Optional
+import logging
+import re
+from typing import Any, Dict, List, Optional, Tuple
+from sqlalchemy import and_, case, column, delete, func, insert, literal, literal_column, or_, select, table, true, tuple_, update
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import IntegrityError
+from pydantic_core import to_json
 from fastapi import HTTPException, status
-from ..models.task import Task, TaskCreate, TaskUpdate, TaskRead
-from datetime import datetime
+from ..models.task import Task, TaskCreate, TaskUpdate, TaskRead, PriorityEnum, TASK_SEARCH_DOCUMENT, get_current_time, get_uuid
+from ..models.task_tombstone import TaskTombstone
+from ..schemas.task_schemas import BatchOperation, BatchOperationType, BatchOperationResult, BatchOperationResponse
+from datetime import datetime, timedelta
+from .task_cache import task_cache
+from ..config.settings import settings
+from ..utils.helpers import encode_cursor, decode_cursor, encode_sync_token, decode_sync_token
 from ..utils.logging_config import get_logger
 
 
+# Columns the task list can be sorted by; priority sorts by rank rather than alphabetically
+TASK_SORT_COLUMNS = {
+    "created_at": Task.created_at,
+    "updated_at": Task.updated_at,
+    "title": Task.title,
+    "priority": case(
+        (Task.priority == PriorityEnum.low, 0),
+        (Task.priority == PriorityEnum.medium, 1),
+        (Task.priority == PriorityEnum.high, 2),
+        else_=1
+    ),
+}
+
+
+# Columns returned by the fast read path, in TaskRead field order
+TASK_READ_COLUMNS = (
+    Task.title,
+    Task.description,
+    Task.completed,
+    Task.priority,
+    Task.id,
+    Task.user_id,
+    Task.created_at,
+    Task.updated_at,
+)
+
+
+# SQLite full-text index maintained by triggers (see TASK_SEARCH_SQLITE_DDL)
+TASKS_FTS = table("tasks_fts", column("rowid"))
+
+# Task columns declared NOT NULL; a batch update setting one of them to null is rejected per item
+BATCH_NON_NULLABLE_FIELDS = ("title", "completed", "priority")
+
+
 class TaskService:
     """
     Service class to handle business logic for Task operations.
@@ -29,7 +72,7 @@ class TaskService:
             HTTPException: If there's an error creating the task
         """
         TaskService.logger.info(f"Creating task for user: {task_data.user_id}")
-        TaskService.logger.debug(f"Task data: title='{task_data.title}', description='{task_data.description}', completed={task_data.completed}, priority={task_data.priority}")
+        TaskService.logger.debug("Task data: title='%s', description='%s', completed=%s, priority=%s", task_data.title, task_data.description, task_data.completed, task_data.priority)
 
         try:
             # Create a new task instance
@@ -44,6 +87,7 @@ class TaskService:
             # Add to session and commit
             db.add(db_task)
             db.commit()
+            task_cache.invalidate(task_data.user_id)
             db.refresh(db_task)
 
             TaskService.logger.info(f"Task created successfully with ID: {db_task.id}")
@@ -130,56 +174,650 @@ class TaskService:
             )
 
     @staticmethod
-    def get_tasks(user_id: str, db: Session, skip: int = 0, limit: int = 100) -> List[TaskRead]:
+    def parse_status(task_status: Optional[str]) -> Optional[bool]:
+        """
+        Convert a status filter value into a completed flag.
+
+        Args:
+            task_status (Optional[str]): 'all', 'pending' (or 'active') or 'completed'
+
+        Returns:
+            Optional[bool]: None for all tasks, False for pending, True for completed
+
+        Raises:
+            HTTPException: If the status value is not recognised
+        """
+        if task_status is None or task_status == "all":
+            return None
+        if task_status in ("pending", "active"):
+            return False
+        if task_status == "completed":
+            return True
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Invalid status filter: {task_status}"
+        )
+
+    @staticmethod
+    def build_task_rows_query(
+        user_id: str,
+        skip: int = 0,
+        limit: Optional[int] = 100,
+        cursor: Optional[str] = None,
+        completed: Optional[bool] = None,
+        priority: Optional[PriorityEnum] = None,
+        sort_by: str = "created_at",
+        sort_order: str = "asc"
+    ):
+        """
+        Build the Core SELECT used by get_task_rows (shared with the async service).
+
+        Args:
+            user_id (str): ID of the user whose tasks to retrieve
+            skip (int): Number of records to skip (for offset pagination)
+            limit (Optional[int]): Maximum number of records to return, None for no limit
+            cursor (Optional[str]): Opaque cursor from a previous page (for keyset pagination)
+            completed (Optional[bool]): Only return tasks with this completion status
+            priority (Optional[PriorityEnum]): Only return tasks with this priority
+            sort_by (str): One of 'created_at', 'updated_at', 'priority', 'title'
+            sort_order (str): 'asc' or 'desc'
+
+        Returns:
+            Select: Statement selecting TASK_READ_COLUMNS
+
+        Raises:
+            HTTPException: If the cursor or sort parameters are invalid
+        """
+        if sort_by not in TASK_SORT_COLUMNS or sort_order not in ("asc", "desc"):
+            TaskService.logger.warning(f"Invalid sort for user {user_id}: {sort_by} {sort_order}")
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Invalid sort: {sort_by} {sort_order}"
+            )
+        if cursor and sort_by != "created_at":
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Cursor pagination requires sort_by=created_at"
+            )
+
+        # Select only the TaskRead columns for the specific user, filtered in SQL
+        query = select(*TASK_READ_COLUMNS).where(Task.user_id == user_id)
+        if completed is not None:
+            query = query.where(Task.completed == completed)
+        if priority is not None:
+            query = query.where(Task.priority == priority)
+
+        # Order by the requested column, tie-broken by id for a stable order
+        sort_column = TASK_SORT_COLUMNS[sort_by]
+        if sort_order == "desc":
+            query = query.order_by(sort_column.desc(), Task.id.desc())
+        else:
+            query = query.order_by(sort_column.asc(), Task.id.asc())
+
+        if cursor:
+            try:
+                cursor_created_at, cursor_id = decode_cursor(cursor)
+            except ValueError:
+                TaskService.logger.warning(f"Invalid cursor for user {user_id}: {cursor}")
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail="Invalid cursor"
+                )
+            position = tuple_(Task.created_at, Task.id)
+            # Bound with the column types so the id compares as uuid on Postgres, not varchar
+            cursor_position = tuple_(literal(cursor_created_at, Task.created_at.type), literal(cursor_id, Task.id.type))
+            query = query.where(position < cursor_position if sort_order == "desc" else position > cursor_position)
+        else:
+            query = query.offset(skip)
+
+        if limit is not None:
+            query = query.limit(limit)
+
+        return query
+
+    @staticmethod
+    def get_task_rows(
+        user_id: str,
+        db: Session,
+        skip: int = 0,
+        limit: Optional[int] = 100,
+        cursor: Optional[str] = None,
+        completed: Optional[bool] = None,
+        priority: Optional[PriorityEnum] = None,
+        sort_by: str = "created_at",
+        sort_order: str = "asc",
+        fingerprint: Optional[Tuple[int, Optional[datetime]]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Retrieve tasks for a specific user as plain row mappings.
+
+        This is the fast read path: a Core SELECT over only the TaskRead columns,
+        with no ORM identity map and no per-row validation of trusted database data.
+        Filtering and ordering happen in SQL. Results are always tie-broken by id,
+        so the order is stable. When a cursor is given, the page starts right after
+        the cursor position (keyset pagination) and skip is ignored, so deep pages
+        cost the same as the first one. Cursors require sort_by='created_at'.
+
+        Args:
+            user_id (str): ID of the user whose tasks to retrieve
+            db (Session): Database session
+            skip (int): Number of records to skip (for offset pagination)
+            limit (Optional[int]): Maximum number of records to return, None for no limit
+            cursor (Optional[str]): Opaque cursor from a previous page (for keyset pagination)
+            completed (Optional[bool]): Only return tasks with this completion status
+            priority (Optional[PriorityEnum]): Only return tasks with this priority
+            sort_by (str): One of 'created_at', 'updated_at', 'priority', 'title'
+            sort_order (str): 'asc' or 'desc'
+            fingerprint (Optional[Tuple[int, Optional[datetime]]]): get_tasks_fingerprint result for
+                the same filters, if the caller already has it; used to validate the cached rows
+
+        Returns:
+            List[Dict[str, Any]]: Task rows keyed by TaskRead field name; rows may be
+            shared with the task cache and must not be mutated
+
+        Raises:
+            HTTPException: If the cursor or sort parameters are invalid
+        """
+        TaskService.logger.info(
+            f"Retrieving tasks for user: {user_id}, skip: {skip}, limit: {limit}, cursor: {cursor}, "
+            f"completed: {completed}, priority: {priority}, sort: {sort_by} {sort_order}"
+        )
+
+        # Serve from the per-user snapshot cache when this exact query was seen at the current version
+        cache_key = ("list", skip, limit, cursor, completed, priority, sort_by, sort_order)
+        cache_version = task_cache.get_version(user_id)
+        if fingerprint is None and task_cache.enabled and settings.TASK_CACHE_VALIDATE:
+            # Writes from other processes do not invalidate this cache, so check the rows' fingerprint
+            fingerprint = TaskService.get_tasks_fingerprint(user_id, db, completed=completed, priority=priority)
+        cached_rows = task_cache.get(user_id, cache_key, validator=fingerprint)
+        if cached_rows is not None:
+            TaskService.logger.debug("Task cache hit for user: %s", user_id)
+            return list(cached_rows)
+
+        query = TaskService.build_task_rows_query(
+            user_id,
+            skip=skip,
+            limit=limit,
+            cursor=cursor,
+            completed=completed,
+            priority=priority,
+            sort_by=sort_by,
+            sort_order=sort_order
+        )
+
+        try:
+            rows = [dict(row) for row in db.execute(query).mappings()]
+
+            TaskService.logger.info(f"Retrieved {len(rows)} tasks for user: {user_id}")
+            task_cache.set(user_id, cache_key, tuple(rows), weight=len(rows), version=cache_version, validator=fingerprint)
+            return rows
+        except HTTPException:
+            # Re-raise HTTP exceptions
+            raise
+        except Exception as e:
+            TaskService.logger.error(f"Unexpected error retrieving tasks for user {user_id}: {str(e)}")
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Unexpected error occurred: {str(e)}"
+            )
+
+    @staticmethod
+    def get_tasks(user_id: str, db: Session, **filters) -> List[TaskRead]:
         """
-        Retrieve all tasks for a specific user.
+        Retrieve tasks for a specific user as TaskRead objects.
+
+        Takes the same filter, sort and pagination arguments as get_task_rows. The
+        rows come straight from the database, so they are wrapped without re-validation.
 
         Args:
             user_id (str): ID of the user whose tasks to retrieve
             db (Session): Database session
-            skip (int): Number of records to skip (for pagination)
-            limit (int): Maximum number of records to return (for pagination)
+            **filters: skip, limit, cursor, completed, priority, sort_by, sort_order
 
         Returns:
             List[TaskRead]: List of user's tasks
         """
-        TaskService.logger.info(f"Retrieving tasks for user: {user_id}, skip: {skip}, limit: {limit}")
+        return [TaskRead.model_construct(**row) for row in TaskService.get_task_rows(user_id, db, **filters)]
+
+    @staticmethod
+    def serialize_task_rows(rows: List[Dict[str, Any]]) -> bytes:
+        """
+        Serialize task rows directly to JSON bytes.
+
+        Produces the same JSON as a List[TaskRead] response model without building
+        or validating any model instances.
+
+        Args:
+            rows (List[Dict[str, Any]]): Rows returned by get_task_rows
+
+        Returns:
+            bytes: JSON array of tasks
+        """
+        return to_json(rows)
+
+    @staticmethod
+    def get_next_cursor(rows: List[Dict[str, Any]], limit: Optional[int]) -> Optional[str]:
+        """
+        Build the cursor for the page following the given one.
+
+        Args:
+            rows (List[Dict[str, Any]]): Task rows returned for the current page
+            limit (Optional[int]): Page size that was requested
+
+        Returns:
+            Optional[str]: Cursor for the next page, or None if this was the last page
+        """
+        if not rows or limit is None or len(rows) < limit:
+            return None
+        last_row = rows[-1]
+        return encode_cursor(last_row["created_at"], last_row["id"])
+
+    @staticmethod
+    def build_search_query(
+        user_id: str,
+        query: str,
+        dialect_name: str,
+        skip: int = 0,
+        limit: int = 20
+    ):
+        """
+        Build the ranked full-text search SELECT for the given database dialect.
+
+        PostgreSQL matches websearch_to_tsquery() against the GIN-indexed tsvector
+        expression and ranks by ts_rank. SQLite matches the tasks_fts FTS5 table and
+        ranks by bm25. Other databases fall back to a LIKE on every search term.
+
+        Args:
+            user_id (str): ID of the user whose tasks to search
+            query (str): Search text entered by the user
+            dialect_name (str): Name of the database dialect the query will run on
+            skip (int): Number of results to skip
+            limit (int): Maximum number of results to return
+
+        Returns:
+            Select: Statement selecting TASK_READ_COLUMNS, best match first
+
+        Raises:
+            HTTPException: If the query contains no searchable words
+        """
+        terms = re.findall(r"\w+", query)
+        if not terms:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Search query must contain at least one word"
+            )
+
+        statement = select(*TASK_READ_COLUMNS).where(Task.user_id == user_id)
+        if dialect_name == "postgresql":
+            document = literal_column(TASK_SEARCH_DOCUMENT)
+            ts_query = func.websearch_to_tsquery(literal_column("'english'"), query)
+            statement = statement.where(document.op("@@")(ts_query)).order_by(
+                func.ts_rank(document, ts_query).desc(), Task.created_at, Task.id
+            )
+        elif dialect_name == "sqlite":
+            # Quote every term so FTS5 query syntax in user input is matched literally
+            match = " ".join(f'"{term}"' for term in terms)
+            statement = (
+                statement
+                .join(TASKS_FTS, TASKS_FTS.c.rowid == literal_column("tasks.rowid"))
+                .where(literal_column("tasks_fts").op("MATCH")(match))
+                .order_by(func.bm25(literal_column("tasks_fts")), Task.created_at, Task.id)
+            )
+        else:
+            statement = statement.where(and_(*(
+                or_(Task.title.ilike(f"%{term}%"), Task.description.ilike(f"%{term}%")) for term in terms
+            ))).order_by(Task.created_at, Task.id)
+
+        return statement.offset(skip).limit(limit)
+
+    @staticmethod
+    def search_task_rows(user_id: str, query: str, db: Session, skip: int = 0, limit: int = 20) -> List[Dict[str, Any]]:
+        """
+        Full-text search over a user's task titles and descriptions.
+
+        Args:
+            user_id (str): ID of the user whose tasks to search
+            query (str): Search text entered by the user
+            db (Session): Database session
+            skip (int): Number of results to skip
+            limit (int): Maximum number of results to return
+
+        Returns:
+            List[Dict[str, Any]]: Matching task rows keyed by TaskRead field name, best match first
+
+        Raises:
+            HTTPException: If the query is empty or the search fails
+        """
+        TaskService.logger.info(f"Searching tasks for user: {user_id}, query: {query!r}, skip: {skip}, limit: {limit}")
 
+        statement = TaskService.build_search_query(user_id, query, db.get_bind().dialect.name, skip=skip, limit=limit)
         try:
-            # Query for tasks belonging to the specific user with pagination
-            db_tasks = db.query(Task).filter(
-                Task.user_id == user_id
-            ).offset(skip).limit(limit).all()
-
-            TaskService.logger.info(f"Retrieved {len(db_tasks)} tasks for user: {user_id}")
-
-            # Convert to TaskRead schema - make sure to extract values before session closes
-            tasks = []
-            for db_task in db_tasks:
-                # Extract all values from the ORM object before session might close
-                task_dict = {
-                    'id': db_task.id,
-                    'title': db_task.title,
-                    'description': db_task.description,
-                    'completed': db_task.completed,
-                    'priority': db_task.priority,
-                    'user_id': db_task.user_id,
-                    'created_at': db_task.created_at,
-                    'updated_at': db_task.updated_at
+            rows = [dict(row) for row in db.execute(statement).mappings()]
+            TaskService.logger.info(f"Found {len(rows)} tasks for user: {user_id}")
+            return rows
+        except Exception as e:
+            TaskService.logger.error(f"Unexpected error searching tasks for user {user_id}: {str(e)}")
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Unexpected error occurred: {str(e)}"
+            )
+
+    @staticmethod
+    def build_stats_query(user_id: str):
+        """
+        Build the single statement behind get_task_stats.
+
+        Tasks are counted with one GROUP BY over (completed, priority). The oldest
+        pending task (served by the partial pending index) is joined onto every group
+        row, so the whole summary comes back in one round trip.
+
+        Args:
+            user_id (str): ID of the user whose tasks to summarise
+
+        Returns:
+            Select: Statement returning completed, priority, count and the
+            oldest_* TaskRead columns for each group
+        """
+        counts = (
+            select(Task.completed, Task.priority, func.count(Task.id).label("count"))
+            .where(Task.user_id == user_id)
+            .group_by(Task.completed, Task.priority)
+            .subquery("counts")
+        )
+        oldest = (
+            select(*(task_column.label(f"oldest_{task_column.key}") for task_column in TASK_READ_COLUMNS))
+            .where(Task.user_id == user_id, Task.completed == False)  # noqa: E712
+            .order_by(Task.created_at, Task.id)
+            .limit(1)
+            .subquery("oldest")
+        )
+        return select(counts, oldest).select_from(counts.outerjoin(oldest, true()))
+
+    @staticmethod
+    def summarize_task_stats(rows) -> Dict[str, Any]:
+        """
+        Fold the rows returned by build_stats_query into the statistics payload.
+
+        Args:
+            rows: Row mappings returned by the stats query
+
+        Returns:
+            Dict[str, Any]: total, completed, pending, by_priority, pending_by_priority
+            and oldest_pending_task (None when nothing is pending)
+        """
+        by_priority = {priority.value: 0 for priority in PriorityEnum}
+        pending_by_priority = {priority.value: 0 for priority in PriorityEnum}
+        completed = pending = 0
+        oldest_pending_task = None
+
+        for row in rows:
+            priority = row["priority"].value if isinstance(row["priority"], PriorityEnum) else row["priority"]
+            by_priority[priority] = by_priority.get(priority, 0) + row["count"]
+            if row["completed"]:
+                completed += row["count"]
+            else:
+                pending += row["count"]
+                pending_by_priority[priority] = pending_by_priority.get(priority, 0) + row["count"]
+            if oldest_pending_task is None and row["oldest_id"] is not None:
+                oldest_pending_task = {
+                    task_column.key: row[f"oldest_{task_column.key}"] for task_column in TASK_READ_COLUMNS
                 }
 
-                task = TaskRead(**task_dict)
-                tasks.append(task)
+        return {
+            "total": completed + pending,
+            "completed": completed,
+            "pending": pending,
+            "by_priority": by_priority,
+            "pending_by_priority": pending_by_priority,
+            "oldest_pending_task": oldest_pending_task
+        }
 
-            TaskService.logger.debug(f"Converted {len(tasks)} tasks to TaskRead schema")
-            return tasks
+    @staticmethod
+    def get_task_stats(user_id: str, db: Session) -> Dict[str, Any]:
+        """
+        Summarise a user's tasks without loading them.
+
+        Args:
+            user_id (str): ID of the user whose tasks to summarise
+            db (Session): Database session
+
+        Returns:
+            Dict[str, Any]: Counts by status and priority plus the oldest pending task
+
+        Raises:
+            HTTPException: If the statistics cannot be computed
+        """
+        TaskService.logger.info(f"Computing task statistics for user: {user_id}")
+
+        # Validating would cost as much as the stats aggregate, so stats are only
+        # cached when this process is the only writer
+        use_cache = not settings.TASK_CACHE_VALIDATE
+        cache_version = task_cache.get_version(user_id)
+        cached_stats = task_cache.get(user_id, ("stats",)) if use_cache else None
+        if cached_stats is not None:
+            TaskService.logger.debug("Task cache hit for user: %s", user_id)
+            return cached_stats
+
+        try:
+            rows = db.execute(TaskService.build_stats_query(user_id)).mappings().all()
+            stats = TaskService.summarize_task_stats(rows)
+            if use_cache:
+                task_cache.set(user_id, ("stats",), stats, version=cache_version)
+            return stats
         except Exception as e:
-            TaskService.logger.error(f"Unexpected error retrieving tasks for user {user_id}: {str(e)}")
+            TaskService.logger.error(f"Unexpected error computing task statistics for user {user_id}: {str(e)}")
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail=f"Unexpected error occurred: {str(e)}"
             )
 
+    @staticmethod
+    def tombstone_rows(user_id: str, task_ids: List[str], deleted_at: Optional[datetime] = None) -> List[Dict[str, Any]]:
+        """
+        Build task_tombstones rows for deleted tasks.
+
+        Args:
+            user_id (str): ID of the user who owned the tasks
+            task_ids (List[str]): IDs of the deleted tasks
+            deleted_at (Optional[datetime]): Deletion time, defaults to now
+
+        Returns:
+            List[Dict[str, Any]]: Rows to insert into task_tombstones
+        """
+        deleted_at = deleted_at or get_current_time()
+        return [{"task_id": task_id, "user_id": user_id, "deleted_at": deleted_at} for task_id in task_ids]
+
+    @staticmethod
+    def build_changes_queries(user_id: str, since: Optional[str] = None):
+        """
+        Build the statements behind get_task_changes.
+
+        updated_at and deleted_at are set when a write runs, not when it commits,
+        so a write committing after a sync can carry a timestamp older than that
+        sync's token. Incremental syncs therefore re-read TASK_SYNC_OVERLAP_SECONDS
+        before the token; changes in that window may be returned again and clients
+        de-duplicate them by task id and updated_at.
+
+        Args:
+            user_id (str): ID of the user whose changes to read
+            since (Optional[str]): Sync token from the previous sync, None for a full sync
+
+        Returns:
+            Tuple[Select, Optional[Select], Optional[datetime]]: The changed-tasks query,
+            the tombstone query (None for a full sync) and the decoded token timestamp
+
+        Raises:
+            HTTPException: If the sync token is malformed
+        """
+        since_at = None
+        if since:
+            try:
+                since_at = decode_sync_token(since)
+            except ValueError:
+                TaskService.logger.warning(f"Invalid sync token for user {user_id}: {since}")
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail="Invalid sync token"
+                )
+
+        tasks_query = select(*TASK_READ_COLUMNS).where(Task.user_id == user_id).order_by(Task.updated_at, Task.id)
+        tombstones_query = None
+        if since_at is not None:
+            window_start = since_at - timedelta(seconds=settings.TASK_SYNC_OVERLAP_SECONDS)
+            tasks_query = tasks_query.where(Task.updated_at > window_start)
+            tombstones_query = (
+                select(TaskTombstone.task_id, TaskTombstone.deleted_at)
+                .where(TaskTombstone.user_id == user_id, TaskTombstone.deleted_at > window_start)
+                .order_by(TaskTombstone.deleted_at, TaskTombstone.task_id)
+            )
+        return tasks_query, tombstones_query, since_at
+
+    @staticmethod
+    def build_changes_response(rows: List[Dict[str, Any]], tombstones, since_at: Optional[datetime]) -> Dict[str, Any]:
+        """
+        Assemble the delta sync payload and the token for the next sync.
+
+        The next token is the latest change timestamp returned, never earlier than the
+        previous token. Together with the overlap window of build_changes_queries, a
+        change is not skipped as long as its write commits within
+        TASK_SYNC_OVERLAP_SECONDS of running.
+
+        Args:
+            rows (List[Dict[str, Any]]): Changed task rows, ordered by updated_at
+            tombstones: (task_id, deleted_at) rows, ordered by deleted_at
+            since_at (Optional[datetime]): Timestamp of the previous sync token
+
+        Returns:
+            Dict[str, Any]: tasks, deleted task IDs and next_token
+        """
+        # Rows from the overlap window can be older than since_at, so the mark never moves back
+        latest_changes = [since_at] if since_at is not None else []
+        if rows:
+            latest_changes.append(rows[-1]["updated_at"])
+        if tombstones:
+            latest_changes.append(tombstones[-1].deleted_at)
+        synced_at = max(latest_changes) if latest_changes else since_at
+        if synced_at is None:
+            # Full sync of an empty task list: start the next sync from the beginning
+            synced_at = datetime(1970, 1, 1)
+
+        return {
+            "tasks": rows,
+            "deleted": [tombstone.task_id for tombstone in tombstones],
+            "next_token": encode_sync_token(synced_at)
+        }
+
+    @staticmethod
+    def get_task_changes(user_id: str, db: Session, since: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Return the tasks created or updated, and the IDs of tasks deleted, since a sync token.
+
+        Without a token every task is returned (a full sync). Either way the
+        response carries the token to pass as since on the next call.
+
+        Args:
+            user_id (str): ID of the user whose changes to read
+            db (Session): Database session
+            since (Optional[str]): Sync token from the previous sync
+
+        Returns:
+            Dict[str, Any]: tasks (TaskRead rows), deleted (task IDs) and next_token
+
+        Raises:
+            HTTPException: If the sync token is malformed
+        """
+        TaskService.logger.info(f"Reading task changes for user: {user_id}, since: {since}")
+        tasks_query, tombstones_query, since_at = TaskService.build_changes_queries(user_id, since)
+
+        try:
+            rows = [dict(row) for row in db.execute(tasks_query).mappings()]
+            tombstones = db.execute(tombstones_query).all() if tombstones_query is not None else []
+            TaskService.logger.info(f"Found {len(rows)} changed and {len(tombstones)} deleted tasks for user: {user_id}")
+            return TaskService.build_changes_response(rows, tombstones, since_at)
+        except Exception as e:
+            TaskService.logger.error(f"Unexpected error reading task changes for user {user_id}: {str(e)}")
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Unexpected error occurred: {str(e)}"
+            )
+
+    @staticmethod
+    def build_tasks_fingerprint_query(
+        user_id: str,
+        completed: Optional[bool] = None,
+        priority: Optional[PriorityEnum] = None
+    ):
+        """
+        Build the COUNT/MAX(updated_at) aggregate used by get_tasks_fingerprint.
+
+        Args:
+            user_id (str): ID of the user whose tasks to summarise
+            completed (Optional[bool]): Only count tasks with this completion status
+            priority (Optional[PriorityEnum]): Only count tasks with this priority
+
+        Returns:
+            Select: Statement returning one (count, last_updated_at) row
+        """
+        statement = select(func.count(Task.id), func.max(Task.updated_at)).where(Task.user_id == user_id)
+        if completed is not None:
+            statement = statement.where(Task.completed == completed)
+        if priority is not None:
+            statement = statement.where(Task.priority == priority)
+        return statement
+
+    @staticmethod
+    def get_tasks_fingerprint(
+        user_id: str,
+        db: Session,
+        completed: Optional[bool] = None,
+        priority: Optional[PriorityEnum] = None
+    ) -> Tuple[int, Optional[datetime]]:
+        """
+        Summarise a user's (filtered) task set without loading it.
+
+        Runs a single COUNT/MAX aggregate, used to derive ETags for conditional GETs.
+
+        Args:
+            user_id (str): ID of the user whose tasks to summarise
+            db (Session): Database session
+            completed (Optional[bool]): Only count tasks with this completion status
+            priority (Optional[PriorityEnum]): Only count tasks with this priority
+
+        Returns:
+            Tuple[int, Optional[datetime]]: Row count and latest updated_at
+        """
+        statement = TaskService.build_tasks_fingerprint_query(user_id, completed=completed, priority=priority)
+        count, last_updated_at = db.execute(statement).one()
+        return count, last_updated_at
+
+    @staticmethod
+    def _update_returning(statement, task_id: str, user_id: str, db: Session):
+        """
+        Execute a single-task UPDATE and return the updated row.
+
+        Uses UPDATE ... RETURNING where the dialect supports it, so the write and the
+        read-back share one round trip. Older SQLite builds without RETURNING fall
+        back to UPDATE followed by a SELECT inside the same transaction.
+
+        Args:
+            statement: UPDATE statement already filtered by task_id and user_id
+            task_id (str): ID of the task being updated
+            user_id (str): ID of the user who owns the task
+            db (Session): Database session
+
+        Returns:
+            Optional[RowMapping]: The updated row, or None if no task matched
+        """
+        statement = statement.execution_options(synchronize_session=False)
+        if db.get_bind().dialect.update_returning:
+            return db.execute(statement.returning(*Task.__table__.c)).mappings().first()
+
+        if db.execute(statement).rowcount == 0:
+            return None
+        return db.execute(
+            select(*Task.__table__.c).where(Task.id == task_id, Task.user_id == user_id)
+        ).mappings().first()
+
     @staticmethod
     def update_task(task_id: str, user_id: str, task_update: TaskUpdate, db: Session) -> TaskRead:
         """
@@ -198,44 +836,35 @@ class TaskService:
             HTTPException: If task is not found or doesn't belong to user
         """
         TaskService.logger.info(f"Updating task {task_id} for user: {user_id}")
-        TaskService.logger.debug(f"Update data: {task_update.model_dump(exclude_unset=True) if hasattr(task_update, 'model_dump') else task_update.dict(exclude_unset=True)}")
+        if TaskService.logger.isEnabledFor(logging.DEBUG):
+            TaskService.logger.debug("Update data: %s", task_update.model_dump(exclude_unset=True))
 
         try:
-            # Query for the task that belongs to the specific user
-            db_task = db.query(Task).filter(
-                Task.id == task_id,
-                Task.user_id == user_id
-            ).first()
+            # Update only the fields provided, scoped to the owning user, in one statement
+            update_data = task_update.model_dump(exclude_unset=True) if hasattr(task_update, 'model_dump') else task_update.dict(exclude_unset=True)
+            statement = (
+                update(Task)
+                .where(Task.id == task_id, Task.user_id == user_id)
+                .values(**update_data, updated_at=get_current_time())
+            )
+            row = TaskService._update_returning(statement, task_id, user_id, db)
 
-            if not db_task:
+            if not row:
                 TaskService.logger.warning(f"Task {task_id} not found for user: {user_id}")
+                db.rollback()
                 raise HTTPException(
                     status_code=status.HTTP_404_NOT_FOUND,
                     detail="Task not found or does not belong to user"
                 )
 
-            # Update fields if they are provided in the update data
-            update_data = task_update.model_dump(exclude_unset=True) if hasattr(task_update, 'model_dump') else task_update.dict(exclude_unset=True)
-            for field, value in update_data.items():
-                setattr(db_task, field, value)
-
             # Commit the changes
             db.commit()
-            db.refresh(db_task)
+            task_cache.invalidate(user_id)
 
             TaskService.logger.info(f"Task {task_id} updated successfully for user: {user_id}")
 
-            # Return the updated task - extract values to avoid serialization issues
-            return TaskRead(
-                id=db_task.id,
-                title=db_task.title,
-                description=db_task.description,
-                completed=db_task.completed,
-                priority=db_task.priority,
-                user_id=db_task.user_id,
-                created_at=db_task.created_at,
-                updated_at=db_task.updated_at
-            )
+            # Return the updated task straight from the returned row
+            return TaskRead(**row)
         except IntegrityError as e:
             TaskService.logger.error(f"Integrity error updating task {task_id} for user {user_id}: {str(e)}")
             db.rollback()
@@ -273,22 +902,29 @@ class TaskService:
         TaskService.logger.info(f"Deleting task {task_id} for user: {user_id}")
 
         try:
-            # Query for the task that belongs to the specific user
-            db_task = db.query(Task).filter(
-                Task.id == task_id,
-                Task.user_id == user_id
-            ).first()
+            # Delete the task that belongs to the specific user in one statement
+            statement = (
+                delete(Task)
+                .where(Task.id == task_id, Task.user_id == user_id)
+                .execution_options(synchronize_session=False)
+            )
+            if db.get_bind().dialect.delete_returning:
+                deleted = db.execute(statement.returning(Task.id)).first() is not None
+            else:
+                deleted = db.execute(statement).rowcount > 0
 
-            if not db_task:
+            if not deleted:
                 TaskService.logger.warning(f"Task {task_id} not found for user: {user_id}")
+                db.rollback()
                 raise HTTPException(
                     status_code=status.HTTP_404_NOT_FOUND,
                     detail="Task not found or does not belong to user"
                 )
 
-            # Delete the task
-            db.delete(db_task)
+            # Leave a tombstone in the same transaction so delta sync clients see the deletion
+            db.execute(insert(TaskTombstone), TaskService.tombstone_rows(user_id, [task_id]))
             db.commit()
+            task_cache.invalidate(user_id)
 
             TaskService.logger.info(f"Task {task_id} deleted successfully for user: {user_id}")
             return True
@@ -322,45 +958,30 @@ class TaskService:
         TaskService.logger.info(f"Toggling completion status for task {task_id} for user: {user_id}")
 
         try:
-            # Query for the task that belongs to the specific user
-            db_task = db.query(Task).filter(
-                Task.id == task_id,
-                Task.user_id == user_id
-            ).first()
+            # Flip the completion status in the database and bump updated_at
+            statement = (
+                update(Task)
+                .where(Task.id == task_id, Task.user_id == user_id)
+                .values(completed=~Task.completed, updated_at=get_current_time())
+            )
+            row = TaskService._update_returning(statement, task_id, user_id, db)
 
-            if not db_task:
+            if not row:
                 TaskService.logger.warning(f"Task {task_id} not found for user: {user_id}")
+                db.rollback()
                 raise HTTPException(
                     status_code=status.HTTP_404_NOT_FOUND,
                     detail="Task not found or does not belong to user"
                 )
 
-            # Toggle the completion status
-            old_status = db_task.completed
-            db_task.completed = not db_task.completed
-            new_status = db_task.completed
-
-            TaskService.logger.info(f"Task {task_id} completion status changed from {old_status} to {new_status} for user: {user_id}")
-
-            # Update the updated_at timestamp (handled by the Base model's __setattr__)
-            from datetime import datetime
-            db_task.updated_at = datetime.utcnow()
-
             # Commit the changes
             db.commit()
-            db.refresh(db_task)
+            task_cache.invalidate(user_id)
 
-            # Return the updated task - extract values to avoid serialization issues
-            return TaskRead(
-                id=db_task.id,
-                title=db_task.title,
-                description=db_task.description,
-                completed=db_task.completed,
-                priority=db_task.priority,
-                user_id=db_task.user_id,
-                created_at=db_task.created_at,
-                updated_at=db_task.updated_at
-            )
+            TaskService.logger.info(f"Task {task_id} completion status changed to {row['completed']} for user: {user_id}")
+
+            # Return the updated task straight from the returned row
+            return TaskRead(**row)
         except HTTPException:
             # Re-raise HTTP exceptions
             raise
@@ -370,4 +991,152 @@ class TaskService:
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail=f"Unexpected error occurred: {str(e)}"
-            )
\ No newline at end of file
+            )
+
+    @staticmethod
+    def batch_operations(user_id: str, operations: List[BatchOperation], db: Session) -> BatchOperationResponse:
+        """
+        Apply a mixed list of create/update/delete/toggle operations in one transaction.
+
+        Operations are validated individually, then executed as set-based statements:
+        one ownership lookup, one multi-row INSERT, one bulk UPDATE per field set, one
+        toggle UPDATE, one DELETE and one read-back, followed by a single commit. A task
+        may only be referenced once per batch, since set-based statements do not
+        preserve the order of operations on the same row.
+
+        Args:
+            user_id (str): ID of the user who owns the tasks
+            operations (List[BatchOperation]): Operations to apply
+            db (Session): Database session
+
+        Returns:
+            BatchOperationResponse: Counts and per-item results
+
+        Raises:
+            HTTPException: If the transaction fails (nothing is applied in that case)
+        """
+        TaskService.logger.info(f"Applying batch of {len(operations)} operations for user: {user_id}")
+
+        results: List[BatchOperationResult] = [
+            BatchOperationResult(index=index, op=operation.op, task_id=operation.task_id, success=False)
+            for index, operation in enumerate(operations)
+        ]
+
+        try:
+            # One query to find which referenced tasks exist and belong to the user
+            referenced_ids = {operation.task_id for operation in operations if operation.task_id}
+            owned_ids = set()
+            if referenced_ids:
+                owned_ids = set(db.scalars(
+                    select(Task.id).where(Task.user_id == user_id, Task.id.in_(referenced_ids))
+                ).all())
+
+            now = get_current_time()
+            create_rows, update_rows, toggle_ids, delete_ids = [], [], [], []
+            seen_ids = set()
+            for operation, result in zip(operations, results):
+                if operation.op == BatchOperationType.CREATE:
+                    if not operation.title:
+                        result.error = "Title is required to create a task"
+                        continue
+                    result.task_id = get_uuid()
+                    create_rows.append({
+                        "id": result.task_id,
+                        "user_id": user_id,
+                        "title": operation.title,
+                        "description": operation.description,
+                        "completed": bool(operation.completed),
+                        "priority": PriorityEnum(operation.priority or PriorityEnum.medium),
+                        "created_at": now,
+                        "updated_at": now
+                    })
+                    result.success = True
+                    continue
+
+                if not operation.task_id:
+                    result.error = "task_id is required for this operation"
+                elif operation.task_id not in owned_ids:
+                    result.error = "Task not found or does not belong to user"
+                elif operation.task_id in seen_ids:
+                    result.error = "Task is referenced more than once in this batch"
+                if result.error:
+                    continue
+                seen_ids.add(operation.task_id)
+
+                if operation.op == BatchOperationType.UPDATE:
+                    changes = operation.model_dump(include={"title", "description", "completed", "priority"}, exclude_unset=True)
+                    null_fields = sorted(name for name in BATCH_NON_NULLABLE_FIELDS if name in changes and changes[name] is None)
+                    if null_fields:
+                        result.error = f"Cannot set {', '.join(null_fields)} to null"
+                        continue
+                    if "priority" in changes and changes["priority"] is not None:
+                        changes["priority"] = PriorityEnum(changes["priority"])
+                    update_rows.append({"id": operation.task_id, "updated_at": now, **changes})
+                elif operation.op == BatchOperationType.TOGGLE:
+                    toggle_ids.append(operation.task_id)
+                else:
+                    delete_ids.append(operation.task_id)
+                result.success = True
+
+            if create_rows:
+                db.execute(insert(Task), create_rows)
+            if update_rows:
+                # ORM bulk UPDATE by primary key: rows with the same keys share one executemany
+                db.execute(update(Task), update_rows)
+            if toggle_ids:
+                db.execute(
+                    update(Task)
+                    .where(Task.user_id == user_id, Task.id.in_(toggle_ids))
+                    .values(completed=~Task.completed, updated_at=now)
+                    .execution_options(synchronize_session=False)
+                )
+            if delete_ids:
+                db.execute(
+                    delete(Task)
+                    .where(Task.user_id == user_id, Task.id.in_(delete_ids))
+                    .execution_options(synchronize_session=False)
+                )
+                db.execute(insert(TaskTombstone), TaskService.tombstone_rows(user_id, delete_ids, now))
+
+            # Read back every created or modified task in one query
+            changed_ids = [row["id"] for row in create_rows + update_rows] + toggle_ids
+            changed_tasks = {}
+            if changed_ids:
+                for db_task in db.scalars(select(Task).where(Task.user_id == user_id, Task.id.in_(changed_ids))).all():
+                    changed_tasks[db_task.id] = TaskRead(
+                        id=db_task.id,
+                        title=db_task.title,
+                        description=db_task.description,
+                        completed=db_task.completed,
+                        priority=db_task.priority,
+                        user_id=db_task.user_id,
+                        created_at=db_task.created_at,
+                        updated_at=db_task.updated_at
+                    ).model_dump(mode="json")
+
+            db.commit()
+            task_cache.invalidate(user_id)
+        except Exception as e:
+            TaskService.logger.error(f"Batch operation failed for user {user_id}: {str(e)}")
+            db.rollback()
+            # The database error can include the SQL statement, so it is only logged
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail="Batch operation failed, no changes were applied"
+            )
+
+        for result in results:
+            if result.success and result.task_id in changed_tasks:
+                result.task = changed_tasks[result.task_id]
+
+        success_count = sum(1 for result in results if result.success)
+        failure_count = len(results) - success_count
+        TaskService.logger.info(f"Batch completed for user {user_id}: {success_count} succeeded, {failure_count} failed")
+
+        return BatchOperationResponse(
+            success_count=success_count,
+            failure_count=failure_count,
+            total_count=len(results),
+            message=f"{success_count} of {len(results)} operations applied",
+            results=results
+        )
@@ -1,9 +1,9 @@
 from sqlalchemy.orm import Session
-from ..models.user import User, UserCreate
+from ..database.session import mark_written
+from ..models.user import User, UserCreate, get_uuid
 from passlib.context import CryptContext
 from typing import Optional
 from fastapi import HTTPException, status
-import uuid
 from ..utils.logging_config import get_logger
 
 # Password hashing context - using pbkdf2_sha256 as bcrypt is having issues
@@ -16,13 +16,13 @@ class UserService:
     @staticmethod
     def hash_password(password: str) -> str:
         """Hash a plain text password."""
-        UserService.logger.debug(f"Hashing password for user")
+        UserService.logger.debug("Hashing password for user")
         return pwd_context.hash(password)
 
     @staticmethod
     def verify_password(plain_password: str, hashed_password: str) -> bool:
         """Verify a plain text password against a hashed password."""
-        UserService.logger.debug(f"Verifying password")
+        UserService.logger.debug("Verifying password")
         return pwd_context.verify(plain_password, hashed_password)
 
     @staticmethod
@@ -43,10 +43,9 @@ class UserService:
         from datetime import datetime
         hashed_password = UserService.hash_password(user_data.password)
 
-        # Generate a new user ID
-        import uuid
-        user_id = str(uuid.uuid4())
-        UserService.logger.debug(f"Generated user ID: {user_id}")
+        # Generate a new time-ordered user ID
+        user_id = get_uuid()
+        UserService.logger.debug("Generated user ID: %s", user_id)
 
         # Insert user using raw SQL to avoid session compatibility issues
         from sqlalchemy import text
@@ -64,6 +63,7 @@ class UserService:
                 "updated_at": datetime.utcnow()
             }
         )
+        mark_written(db, user_id)
         db.commit()
         UserService.logger.info(f"User created successfully with ID: {user_id}")
 
@@ -89,7 +89,7 @@ class UserService:
         Returns:
             User: User object if found, None otherwise
         """
-        UserService.logger.debug(f"Retrieving user by ID: {user_id}")
+        UserService.logger.debug("Retrieving user by ID: %s", user_id)
 
         from sqlalchemy import text
         result = db.execute(
@@ -98,7 +98,7 @@ class UserService:
         ).fetchone()
 
         if result:
-            UserService.logger.debug(f"User found with ID: {user_id}")
+            UserService.logger.debug("User found with ID: %s", user_id)
             return User(
                 id=result.id,
                 email=result.email,
@@ -107,7 +107,7 @@ class UserService:
                 created_at=result.created_at,
                 updated_at=result.updated_at
             )
-        UserService.logger.debug(f"User not found with ID: {user_id}")
+        UserService.logger.debug("User not found with ID: %s", user_id)
         return None
 
     @staticmethod
@@ -122,7 +122,7 @@ class UserService:
         Returns:
             User: User object if found, None otherwise
         """
-        UserService.logger.debug(f"Retrieving user by email: {email}")
+        UserService.logger.debug("Retrieving user by email: %s", email)
 
         from sqlalchemy import text
         result = db.execute(
@@ -131,7 +131,7 @@ class UserService:
         ).fetchone()
 
         if result:
-            UserService.logger.debug(f"User found with email: {email}")
+            UserService.logger.debug("User found with email: %s", email)
             from datetime import datetime
             return User(
                 id=result.id,
@@ -141,7 +141,7 @@ class UserService:
                 created_at=result.created_at,
                 updated_at=result.updated_at
             )
-        UserService.logger.debug(f"User not found with email: {email}")
+        UserService.logger.debug("User not found with email: %s", email)
         return None
 
     @staticmethod
@@ -214,7 +214,6 @@ class UserService:
         # Build update query dynamically
         from sqlalchemy import text
         from datetime import datetime
-        import uuid
 
         # Prepare update fields
         update_fields = []
@@ -227,7 +226,7 @@ class UserService:
 
         if not update_fields:
             # If no fields to update, just update the timestamp
-            UserService.logger.debug(f"No fields to update for user {user_id}, updating timestamp only")
+            UserService.logger.debug("No fields to update for user %s, updating timestamp only", user_id)
             query = text("UPDATE users SET updated_at = :updated_at WHERE id = :user_id")
         else:
             # Add the updated_at field to the update
@@ -236,6 +235,7 @@ class UserService:
 
         # Execute the update
         db.execute(query, params)
+        mark_written(db, user_id)
         db.commit()
         UserService.logger.info(f"User updated successfully: {user_id}")
 
@@ -1,5 +1,8 @@
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 import re
+import json
+import base64
+import hashlib
 import logging
 from datetime import datetime
 
@@ -213,4 +216,113 @@ def mask_sensitive_data(data: Dict[str, Any], fields_to_mask: list = ["token", "
         elif isinstance(value, dict):
             masked_data[key] = mask_sensitive_data(value, fields_to_mask)
 
-    return masked_data
\ No newline at end of file
+    return masked_data
+
+
+def encode_cursor(created_at: datetime, record_id: str) -> str:
+    """
+    Encode a keyset pagination position into an opaque cursor string.
+
+    Args:
+        created_at (datetime): Creation timestamp of the last record on the page
+        record_id (str): ID of the last record on the page
+
+    Returns:
+        str: URL-safe cursor string
+    """
+    payload = json.dumps([created_at.isoformat(), record_id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, str]:
+    """
+    Decode a cursor produced by encode_cursor.
+
+    Args:
+        cursor (str): Opaque cursor string
+
+    Returns:
+        Tuple[datetime, str]: The (created_at, id) position encoded in the cursor
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, record_id = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        return datetime.fromisoformat(created_at), str(record_id)
+    except Exception as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
+
+
+def encode_sync_token(synced_at: datetime) -> str:
+    """
+    Encode the high-water mark of a delta sync into an opaque token.
+
+    Args:
+        synced_at (datetime): Latest change timestamp the client has seen
+
+    Returns:
+        str: URL-safe sync token
+    """
+    return base64.urlsafe_b64encode(synced_at.isoformat().encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_sync_token(token: str) -> datetime:
+    """
+    Decode a token produced by encode_sync_token.
+
+    Args:
+        token (str): Opaque sync token
+
+    Returns:
+        datetime: The change timestamp encoded in the token
+
+    Raises:
+        ValueError: If the token is malformed
+    """
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        return datetime.fromisoformat(base64.urlsafe_b64decode(padded.encode("ascii")).decode("utf-8"))
+    except Exception as e:
+        raise ValueError(f"Invalid sync token: {token}") from e
+
+
+def make_weak_etag(*parts: Any) -> str:
+    """
+    Build a weak ETag from the values that determine a response's content.
+
+    Args:
+        *parts: Values such as row counts and timestamps
+
+    Returns:
+        str: Weak entity tag, e.g. W/"3f2a..."
+    """
+    digest = hashlib.sha1(repr(parts).encode("utf-8")).hexdigest()[:24]
+    return f'W/"{digest}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    Check an If-None-Match header against an ETag using weak comparison.
+
+    Args:
+        if_none_match (Optional[str]): Raw If-None-Match header value
+        etag (str): Current ETag of the resource
+
+    Returns:
+        bool: True if the client's cached copy is still current
+    """
+    if not if_none_match:
+        return False
+
+    current = etag[2:] if etag.startswith("W/") else etag
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*":
+            return True
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == current:
+            return True
+    return False
@@ -1,14 +1,152 @@
+import atexit
+import copy
+import json
 import logging
+import queue
+import random
+import sys
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+from typing import Optional, TextIO
 from rich.logging import RichHandler
 from rich.console import Console
 
-# Configure rich logging for this module
+# Attributes every LogRecord has; anything else was passed through extra= and is logged as a field
+LOG_RECORD_ATTRIBUTES = frozenset(vars(logging.LogRecord("", 0, "", 0, "", None, None))) | {"message", "asctime"}
+
+LOG_FORMATS = ("rich", "json")
+
 console = Console()
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(message)s",
-    handlers=[RichHandler(console=console, rich_tracebacks=True)]
-)
+
+# Level applied to application loggers returned by get_logger
+_app_level = logging.DEBUG
+_app_loggers = set()
+# Handler installed on the root logger by configure_logging, and the listener draining its queue
+_root_handler: Optional[logging.Handler] = None
+_listener: Optional[QueueListener] = None
+
+
+class JsonFormatter(logging.Formatter):
+    """Format records as one JSON object per line, including fields passed through extra=."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "timestamp": datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        for key, value in record.__dict__.items():
+            if key not in LOG_RECORD_ATTRIBUTES:
+                entry[key] = value
+        if record.exc_info:
+            entry["exc_info"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            entry["exc_info"] = record.exc_text
+        return json.dumps(entry, default=str)
+
+
+class DeferredQueueHandler(QueueHandler):
+    """
+    Queue records for a QueueListener without formatting them in the calling thread.
+
+    The message arguments are merged immediately, since callers may mutate them
+    afterwards; the formatter (JSON serialisation or Rich rendering) and the write
+    run on the listener thread.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
+class DebugSampleFilter(logging.Filter):
+    """Let through only a fraction of DEBUG records; other levels always pass."""
+
+    def __init__(self, rate: float):
+        super().__init__()
+        self.rate = rate
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        return record.levelno > logging.DEBUG or random.random() < self.rate
+
+
+def stop_logging():
+    """Flush queued records and stop the background writer, if one is running."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+def configure_logging(
+    log_format: Optional[str] = None,
+    level: Optional[str] = None,
+    use_queue: Optional[bool] = None,
+    debug_sample_rate: Optional[float] = None,
+    stream: Optional[TextIO] = None
+):
+    """
+    Install the root log handler. Unset arguments are read from Settings.
+
+    Records below the configured level are dropped by the logger before their
+    message is formatted, so log calls should pass values as arguments
+    (logger.debug("Task %s", task_id)) rather than as f-strings. With use_queue,
+    callers only enqueue the record and a QueueListener thread formats and writes it.
+
+    Args:
+        log_format (Optional[str]): 'rich' for coloured console output or 'json' for one object per line
+        level (Optional[str]): Minimum level for application loggers, e.g. 'INFO'
+        use_queue (Optional[bool]): Write records from a background thread
+        debug_sample_rate (Optional[float]): Fraction of DEBUG records to keep, 0 to 1
+        stream (Optional[TextIO]): Output stream, stderr (json) or the console (rich) by default
+
+    Raises:
+        ValueError: If log_format or level is unknown
+    """
+    global _app_level, _root_handler, _listener
+    from ..config.settings import settings
+
+    log_format = (log_format or settings.LOG_FORMAT).lower()
+    level = (level or settings.LOG_LEVEL).upper()
+    use_queue = settings.LOG_QUEUE if use_queue is None else use_queue
+    debug_sample_rate = settings.LOG_DEBUG_SAMPLE_RATE if debug_sample_rate is None else debug_sample_rate
+    if log_format not in LOG_FORMATS:
+        raise ValueError(f"Unknown log format: {log_format}")
+    if level not in logging.getLevelNamesMapping():
+        raise ValueError(f"Unknown log level: {level}")
+
+    if log_format == "json":
+        handler = logging.StreamHandler(stream or sys.stderr)
+        handler.setFormatter(JsonFormatter())
+    else:
+        handler = RichHandler(console=Console(file=stream) if stream else console, rich_tracebacks=True)
+        handler.setFormatter(logging.Formatter("%(message)s"))
+
+    stop_logging()
+    root = logging.getLogger()
+    if _root_handler is not None:
+        root.removeHandler(_root_handler)
+
+    if use_queue:
+        # Unbounded queue: a slow stream delays output, never the request
+        log_queue = queue.SimpleQueue()
+        _listener = QueueListener(log_queue, handler, respect_handler_level=True)
+        _listener.start()
+        handler = DeferredQueueHandler(log_queue)
+    if debug_sample_rate < 1:
+        handler.addFilter(DebugSampleFilter(debug_sample_rate))
+
+    _root_handler = handler
+    root.addHandler(handler)
+    # Third-party loggers stay at INFO or above; application loggers use the configured level
+    _app_level = logging.getLevelNamesMapping()[level]
+    root.setLevel(max(_app_level, logging.INFO))
+    for name in _app_loggers:
+        logging.getLogger(name).setLevel(_app_level)
+
 
 def get_logger(name: str):
     """
@@ -21,5 +159,10 @@ def get_logger(name: str):
         logging.Logger: Configured logger instance
     """
     logger = logging.getLogger(name)
-    logger.setLevel(logging.DEBUG)  # Allow all levels for individual loggers
-    return logger
\ No newline at end of file
+    logger.setLevel(_app_level)
+    _app_loggers.add(name)
+    return logger
+
+
+configure_logging()
+atexit.register(stop_logging)
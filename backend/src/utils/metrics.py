@@ -0,0 +1,383 @@
+import contextvars
+import functools
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+
+# Request latencies from a cached read to a chat turn that waits on the LLM
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+# Single SQL statements: sub-millisecond locally, a few round trips to Neon at worst
+QUERY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+STATEMENT_COUNT_BUCKETS = (0, 1, 2, 3, 5, 8, 13, 21, 34, 55, 100)
+
+# Route label for requests that matched no route, so unknown paths cannot grow the label set
+UNMATCHED_ROUTE = "<unmatched>"
+
+LabelValues = Tuple[str, ...]
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Iterable[str], values: Iterable[str], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) and not value.is_integer() else str(int(value))
+
+
+class Metric:
+    """Base class for a metric family with a fixed set of label names."""
+    type_name = "untyped"
+
+    def __init__(self, name: str, documentation: str, label_names: Tuple[str, ...] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.label_names = label_names
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Dict[str, str]) -> LabelValues:
+        return tuple(str(labels.get(name, "")) for name in self.label_names)
+
+    def samples(self) -> List[str]:
+        raise NotImplementedError
+
+    def render(self) -> str:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.type_name}"]
+        lines.extend(self.samples())
+        return "\n".join(lines)
+
+
+class Counter(Metric):
+    """Monotonically increasing value per label set."""
+    type_name = "counter"
+
+    def __init__(self, name: str, documentation: str, label_names: Tuple[str, ...] = ()):
+        super().__init__(name, documentation, label_names)
+        self._values: Dict[LabelValues, float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: str):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def samples(self) -> List[str]:
+        with self._lock:
+            items = list(self._values.items())
+        return [f"{self.name}{_format_labels(self.label_names, key)} {_format_value(value)}" for key, value in items]
+
+
+class Gauge(Metric):
+    """
+    Value that can go up and down per label set.
+
+    A gauge built with a collect callback is read when /metrics is scraped; the
+    callback returns (label values, value) pairs.
+    """
+    type_name = "gauge"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        label_names: Tuple[str, ...] = (),
+        collect: Optional[Callable[[], Iterable[Tuple[LabelValues, float]]]] = None
+    ):
+        super().__init__(name, documentation, label_names)
+        self._values: Dict[LabelValues, float] = {}
+        self._collect = collect
+
+    def inc(self, amount: float = 1.0, **labels: str):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def dec(self, amount: float = 1.0, **labels: str):
+        self.inc(-amount, **labels)
+
+    def samples(self) -> List[str]:
+        if self._collect is not None:
+            items = list(self._collect())
+        else:
+            with self._lock:
+                items = list(self._values.items())
+        return [f"{self.name}{_format_labels(self.label_names, key)} {_format_value(value)}" for key, value in items]
+
+
+class Histogram(Metric):
+    """Distribution of observed values in cumulative buckets per label set."""
+    type_name = "histogram"
+
+    def __init__(self, name: str, documentation: str, label_names: Tuple[str, ...] = (), buckets: Tuple[float, ...] = LATENCY_BUCKETS):
+        super().__init__(name, documentation, label_names)
+        self.buckets = tuple(sorted(buckets))
+        # Per label set: [count per bucket (last is +Inf)], sum
+        self._values: Dict[LabelValues, Tuple[List[int], List[float]]] = {}
+
+    def observe(self, value: float, **labels: str):
+        key = self._key(labels)
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            counts, total = self._values.setdefault(key, ([0] * (len(self.buckets) + 1), [0.0]))
+            counts[index] += 1
+            total[0] += value
+
+    def samples(self) -> List[str]:
+        with self._lock:
+            items = [(key, list(counts), total[0]) for key, (counts, total) in self._values.items()]
+        lines = []
+        for key, counts, total in items:
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += count
+                labels = _format_labels(self.label_names, key, f'le="{_format_value(bound)}"')
+                lines.append(f"{self.name}_bucket{labels} {cumulative}")
+            labels = _format_labels(self.label_names, key)
+            lines.append(f"{self.name}_sum{labels} {_format_value(total)}")
+            lines.append(f"{self.name}_count{labels} {cumulative}")
+        return lines
+
+
+class MetricsRegistry:
+    """Holds metric families and renders them in the Prometheus text exposition format (0.0.4)."""
+    content_type = "text/plain; version=0.0.4; charset=utf-8"
+
+    def __init__(self):
+        self._metrics: Dict[str, Metric] = {}
+
+    def register(self, metric: Metric) -> Metric:
+        self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, documentation: str, label_names: Tuple[str, ...] = ()) -> Counter:
+        return self.register(Counter(name, documentation, label_names))
+
+    def gauge(self, name: str, documentation: str, label_names: Tuple[str, ...] = (), collect=None) -> Gauge:
+        return self.register(Gauge(name, documentation, label_names, collect))
+
+    def histogram(self, name: str, documentation: str, label_names: Tuple[str, ...] = (), buckets=LATENCY_BUCKETS) -> Histogram:
+        return self.register(Histogram(name, documentation, label_names, buckets))
+
+    def render(self) -> str:
+        return "\n".join(metric.render() for metric in self._metrics.values()) + "\n"
+
+
+registry = MetricsRegistry()
+
+HTTP_REQUESTS = registry.counter(
+    "http_requests_total", "HTTP requests by method, route template and status code.", ("method", "route", "status")
+)
+HTTP_REQUEST_DURATION = registry.histogram(
+    "http_request_duration_seconds", "HTTP request latency by method, route template and status code.", ("method", "route", "status")
+)
+HTTP_REQUESTS_IN_PROGRESS = registry.gauge("http_requests_in_progress", "HTTP requests currently being served.")
+HTTP_REQUEST_DB_STATEMENTS = registry.histogram(
+    "http_request_db_statements", "SQL statements executed per HTTP request.", ("method", "route"), STATEMENT_COUNT_BUCKETS
+)
+HTTP_REQUEST_DB_DURATION = registry.histogram(
+    "http_request_db_duration_seconds", "Time spent executing SQL per HTTP request.", ("method", "route")
+)
+DB_STATEMENTS = registry.counter("db_statements_total", "SQL statements executed, by statement type.", ("statement",))
+DB_STATEMENT_DURATION = registry.histogram(
+    "db_statement_duration_seconds", "Latency of single SQL statements, by statement type.", ("statement",), QUERY_BUCKETS
+)
+LLM_REQUEST_DURATION = registry.histogram(
+    "llm_request_duration_seconds", "Latency of LLM completion calls by model and outcome.", ("model", "outcome")
+)
+MCP_TOOL_DURATION = registry.histogram(
+    "mcp_tool_duration_seconds", "Latency of MCP tool executions by tool and outcome.", ("tool", "outcome")
+)
+MCP_TOOL_CALL_DURATION = registry.histogram(
+    "mcp_tool_call_duration_seconds", "Round-trip latency of MCP tool calls made by the AI agent, by tool and outcome.", ("tool", "outcome")
+)
+
+
+@dataclass
+class RequestDatabaseStats:
+    """SQL statements and database time accumulated by one request."""
+    statements: int = 0
+    seconds: float = 0.0
+
+
+# Set by MetricsMiddleware for the duration of a request; threadpool and greenlet
+# workers run in a copy of the request's context and so update the same object
+_request_db_stats: contextvars.ContextVar[Optional[RequestDatabaseStats]] = contextvars.ContextVar("request_db_stats", default=None)
+
+
+def _statement_type(statement: str) -> str:
+    keyword = statement.lstrip().split(None, 1)[0].upper() if statement.strip() else ""
+    return keyword if keyword in ("SELECT", "INSERT", "UPDATE", "DELETE", "WITH") else "OTHER"
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_start_time", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    elapsed = time.perf_counter() - conn.info["query_start_time"].pop()
+    statement_type = _statement_type(statement)
+    DB_STATEMENTS.inc(statement=statement_type)
+    DB_STATEMENT_DURATION.observe(elapsed, statement=statement_type)
+    stats = _request_db_stats.get()
+    if stats is not None:
+        stats.statements += 1
+        stats.seconds += elapsed
+
+
+def _handle_error(exception_context):
+    # The statement failed, so after_cursor_execute will not pop its start time
+    connection = exception_context.connection
+    if connection is not None and connection.info.get("query_start_time"):
+        connection.info["query_start_time"].pop()
+
+
+_install_lock = threading.Lock()
+
+
+def install_metrics():
+    """
+    Time every SQL statement on every engine for the db_statement and per-request metrics.
+
+    Called on startup when METRICS_ENABLED is set, so with metrics off no statement
+    pays for the timing. Installing more than once has no further effect.
+    """
+    with _install_lock:
+        if event.contains(Engine, "before_cursor_execute", _before_cursor_execute):
+            return
+        event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(Engine, "after_cursor_execute", _after_cursor_execute)
+        event.listen(Engine, "handle_error", _handle_error)
+
+
+def register_pool_metrics(engines: Callable[[], Dict[str, Engine]]):
+    """
+    Export connection pool gauges for the engines returned by engines().
+
+    The callable is read on every scrape, so engines created lazily appear once they exist.
+
+    Args:
+        engines (Callable[[], Dict[str, Engine]]): Engines by label, e.g. {"sync": engine}
+    """
+    def collect(read: Callable) -> Callable[[], List[Tuple[LabelValues, float]]]:
+        def samples():
+            values = []
+            for name, engine in engines().items():
+                pool = engine.pool
+                if hasattr(pool, "checkedout"):
+                    values.append(((name,), read(pool)))
+            return values
+        return samples
+
+    registry.gauge("db_pool_size", "Configured size of the connection pool.", ("engine",), collect(lambda pool: pool.size()))
+    registry.gauge("db_pool_checked_out", "Connections currently checked out of the pool.", ("engine",), collect(lambda pool: pool.checkedout()))
+    registry.gauge("db_pool_checked_in", "Idle connections held by the pool.", ("engine",), collect(lambda pool: pool.checkedin()))
+    registry.gauge("db_pool_overflow", "Connections open beyond the pool size (negative while below it).", ("engine",), collect(lambda pool: pool.overflow()))
+
+    def collect_wait(field: str) -> Callable[[], List[Tuple[LabelValues, float]]]:
+        def samples():
+            values = []
+            for name, engine in engines().items():
+                wait_stats = getattr(engine.pool, "wait_stats", None)
+                if wait_stats is not None:
+                    values.append(((name,), getattr(wait_stats, field)))
+            return values
+        return samples
+
+    # Cumulative values read from the pool's own counters; use rate() on both for the mean wait
+    registry.gauge("db_pool_checkouts", "Connections handed out by the pool since it was created.", ("engine",), collect_wait("checkouts"))
+    registry.gauge("db_pool_checkout_failures", "Checkouts that timed out or could not connect.", ("engine",), collect_wait("failures"))
+    registry.gauge("db_pool_checkout_wait_seconds", "Seconds spent waiting for pool checkouts since the pool was created.", ("engine",), collect_wait("wait_seconds_total"))
+
+
+def observe_duration(histogram: Histogram, started: float, **labels: str):
+    """Record the time since started (a time.perf_counter() value) in histogram."""
+    histogram.observe(time.perf_counter() - started, **labels)
+
+
+@contextmanager
+def track_duration(histogram: Histogram, **labels: str):
+    """Time the block into histogram with outcome="success", or outcome="error" if it raises."""
+    started = time.perf_counter()
+    outcome = "error"
+    try:
+        yield
+        outcome = "success"
+    finally:
+        observe_duration(histogram, started, outcome=outcome, **labels)
+
+
+def instrument_tool(name: str, func):
+    """
+    Wrap an async MCP tool so every call is recorded in mcp_tool_duration_seconds.
+
+    A tool that raises or returns {"success": False} is recorded with outcome="error".
+    """
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs):
+        started = time.perf_counter()
+        outcome = "error"
+        try:
+            result = await func(*args, **kwargs)
+            if not (isinstance(result, dict) and result.get("success") is False):
+                outcome = "success"
+            return result
+        finally:
+            observe_duration(MCP_TOOL_DURATION, started, tool=name, outcome=outcome)
+    return wrapper
+
+
+class MetricsMiddleware:
+    """
+    ASGI middleware recording latency, status and SQL work per HTTP request.
+
+    Requests are labelled with the matched route template (e.g.
+    /api/v1/users/{user_id}/tasks), never the raw path, so label cardinality stays bounded.
+    """
+
+    def __init__(self, app, excluded_paths: Tuple[str, ...] = ("/metrics",)):
+        self.app = app
+        self.excluded_paths = excluded_paths
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["path"] in self.excluded_paths:
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+        stats = RequestDatabaseStats()
+        token = _request_db_stats.set(stats)
+
+        async def send_wrapper(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        HTTP_REQUESTS_IN_PROGRESS.inc()
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = time.perf_counter() - started
+            HTTP_REQUESTS_IN_PROGRESS.dec()
+            _request_db_stats.reset(token)
+            route = scope.get("route")
+            route_path = getattr(route, "path", None) or UNMATCHED_ROUTE
+            method = scope["method"]
+            HTTP_REQUESTS.inc(method=method, route=route_path, status=str(status_code))
+            HTTP_REQUEST_DURATION.observe(elapsed, method=method, route=route_path, status=str(status_code))
+            HTTP_REQUEST_DB_STATEMENTS.observe(stats.statements, method=method, route=route_path)
+            HTTP_REQUEST_DB_DURATION.observe(stats.seconds, method=method, route=route_path)
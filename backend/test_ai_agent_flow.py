@@ -13,7 +13,7 @@ os.environ['OPEN_ROUTER_API_KEY'] = 'sk-or-v1-5ec26249b32b9eebbf6fb7e0428bcf16d9
 print("Testing the complete AI agent service flow...")
 
 # Test the AI agent service's execute_tool_call method
-def test_ai_agent_tool_execution():
+async def test_ai_agent_tool_execution():
     try:
         from src.services.ai_agent_service import AIAgentService
         
@@ -21,7 +21,7 @@ def test_ai_agent_tool_execution():
         ai_service = AIAgentService(openrouter_api_key=os.getenv("OPEN_ROUTER_API_KEY"))
         
         # Test executing the add_task tool through the AI agent service
-        result = ai_service.execute_tool_call(
+        result = await ai_service.execute_tool_call(
             tool_name="add_task",
             tool_arguments={
                 "user_id": "test_user_123",
@@ -36,7 +36,7 @@ def test_ai_agent_tool_execution():
         print(result)
         
         # Test executing the list_tasks tool
-        list_result = ai_service.execute_tool_call(
+        list_result = await ai_service.execute_tool_call(
             tool_name="list_tasks",
             tool_arguments={
                 "user_id": "test_user_123"
@@ -53,4 +53,4 @@ def test_ai_agent_tool_execution():
         traceback.print_exc()
 
 # Run the test
-test_ai_agent_tool_execution()
\ No newline at end of file
+asyncio.run(test_ai_agent_tool_execution())
\ No newline at end of file
@@ -0,0 +1,43 @@
+"""
+Access to the internal monitoring endpoints.
+
+Run with: python -m pytest test_internal_endpoints.py
+"""
+
+import pytest
+from fastapi.testclient import TestClient
+
+import main
+from src.config.settings import settings
+
+INTERNAL_PATHS = ["/cache/stats", "/db/pool/stats", "/metrics"]
+
+
+@pytest.fixture
+def client():
+    with TestClient(main.app) as test_client:
+        yield test_client
+
+
+@pytest.mark.parametrize("path", INTERNAL_PATHS)
+def test_internal_endpoints_are_off_by_default(client, monkeypatch, path):
+    monkeypatch.setattr(settings, "INTERNAL_ENDPOINTS_ENABLED", type(settings).model_fields["INTERNAL_ENDPOINTS_ENABLED"].default)
+    assert client.get(path).status_code == 404
+
+
+@pytest.mark.parametrize("path", INTERNAL_PATHS)
+def test_internal_endpoints_require_the_token(client, monkeypatch, path):
+    monkeypatch.setattr(settings, "INTERNAL_ENDPOINTS_ENABLED", True)
+    monkeypatch.setattr(settings, "INTERNAL_ENDPOINTS_TOKEN", "internal-secret")
+
+    assert client.get(path).status_code == 401
+    assert client.get(path, headers={"Authorization": "Bearer wrong"}).status_code == 401
+    assert client.get(path, headers={"Authorization": "Bearer internal-secret"}).status_code == 200
+
+
+@pytest.mark.parametrize("path", INTERNAL_PATHS)
+def test_internal_endpoints_without_a_token(client, monkeypatch, path):
+    monkeypatch.setattr(settings, "INTERNAL_ENDPOINTS_ENABLED", True)
+    monkeypatch.setattr(settings, "INTERNAL_ENDPOINTS_TOKEN", None)
+
+    assert client.get(path).status_code == 200
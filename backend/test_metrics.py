@@ -0,0 +1,48 @@
+"""
+SQL statement metrics are only collected when METRICS_ENABLED is set.
+
+Run with: python -m pytest test_metrics.py
+"""
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+import main
+from src.config.settings import settings
+from src.utils import metrics
+
+ENGINE_HOOKS = (
+    ("before_cursor_execute", metrics._before_cursor_execute),
+    ("after_cursor_execute", metrics._after_cursor_execute),
+    ("handle_error", metrics._handle_error),
+)
+
+
+def installed():
+    return [event.contains(Engine, name, listener) for name, listener in ENGINE_HOOKS]
+
+
+@pytest.fixture(autouse=True)
+def no_engine_hooks():
+    def remove():
+        for name, listener in ENGINE_HOOKS:
+            if event.contains(Engine, name, listener):
+                event.remove(Engine, name, listener)
+    remove()
+    yield
+    remove()
+
+
+def test_engine_hooks_are_not_installed_with_metrics_off(monkeypatch):
+    monkeypatch.setattr(settings, "METRICS_ENABLED", False)
+    with TestClient(main.app):
+        assert installed() == [False, False, False]
+
+
+def test_engine_hooks_are_installed_once_with_metrics_on(monkeypatch):
+    monkeypatch.setattr(settings, "METRICS_ENABLED", True)
+    with TestClient(main.app):
+        metrics.install_metrics()
+        assert installed() == [True, True, True]
@@ -0,0 +1,146 @@
+"""
+SQL query budgets of the API routes, enforced by pytest_query_budget.
+
+Each test drives a group of endpoints through budget_client; a request running
+more statements than its route's budget in query_budgets.toml fails the test.
+The tests use several tasks or messages where a route could issue one query
+per row, so an N+1 regression shows up as a budget overrun.
+
+Run with: python -m pytest test_query_budgets.py --query-budget-report
+"""
+
+import uuid
+from typing import Any, Dict
+
+import pytest
+
+from pytest_query_budget import QueryBudget, RequestQueries, find_violations, load_budgets
+
+
+ROWS = 5
+
+
+@pytest.fixture
+def stub_llm(monkeypatch):
+    """Answer chat messages without calling a model, as in the API load benchmark."""
+    from src.services.ai_agent_service import AIAgentService
+
+    async def process_user_input(self, user_input: str, conversation_history: list = None) -> Dict[str, Any]:
+        return {"response": f"Noted: {user_input}", "tool_calls": [], "tool_responses": []}
+
+    monkeypatch.setattr(AIAgentService, "process_user_input", process_user_input)
+
+
+def register(client):
+    email = f"{uuid.uuid4().hex[:12]}@example.com"
+    response = client.post("/api/v1/register", json={
+        "email": email, "password": "secret1", "confirm_password": "secret1", "name": "Budget Test"
+    })
+    assert response.status_code == 200
+    user = response.json()
+    return user["id"], email, {"Authorization": f"Bearer {user['token']}"}
+
+
+def create_tasks(client, user_id, headers, count=ROWS):
+    task_ids = []
+    for i in range(count):
+        response = client.post(f"/api/v1/users/{user_id}/tasks", json={"title": f"Task {i}", "user_id": user_id}, headers=headers)
+        assert response.status_code == 201
+        task_ids.append(response.json()["id"])
+    return task_ids
+
+
+def test_auth_routes(budget_client):
+    user_id, email, headers = register(budget_client)
+
+    assert budget_client.post("/api/v1/login", json={"email": email, "password": "secret1"}).status_code == 200
+    assert budget_client.get("/api/v1/profile", headers=headers).status_code == 200
+
+
+def test_task_routes(budget_client):
+    user_id, _, headers = register(budget_client)
+    task_ids = create_tasks(budget_client, user_id, headers)
+    base = f"/api/v1/users/{user_id}/tasks"
+
+    assert len(budget_client.get(base, headers=headers).json()) == ROWS
+    assert budget_client.get(base, params={"status": "pending", "sort_by": "title"}, headers=headers).status_code == 200
+    assert budget_client.get(f"{base}/{task_ids[0]}", headers=headers).status_code == 200
+    assert budget_client.get(f"{base}/search", params={"q": "Task"}, headers=headers).status_code == 200
+    assert budget_client.get(f"{base}/stats", headers=headers).status_code == 200
+    assert budget_client.get(f"{base}/changes", headers=headers).status_code == 200
+    assert budget_client.put(f"{base}/{task_ids[0]}", json={"title": "Renamed"}, headers=headers).status_code == 200
+    assert budget_client.patch(f"{base}/{task_ids[1]}/toggle", headers=headers).status_code == 200
+    assert budget_client.delete(f"{base}/{task_ids[2]}", headers=headers).status_code == 204
+    assert budget_client.get(f"/api/v1/users/{user_id}/export", headers=headers).status_code == 200
+
+
+def test_batch_route(budget_client):
+    user_id, _, headers = register(budget_client)
+    task_ids = create_tasks(budget_client, user_id, headers)
+
+    response = budget_client.post(f"/api/v1/users/{user_id}/tasks/batch", json={
+        "operations": [{"op": "toggle", "task_id": task_id} for task_id in task_ids]
+    }, headers=headers)
+    assert response.status_code == 200
+    assert response.json()["success_count"] == ROWS
+
+
+def test_chat_routes(budget_client, stub_llm):
+    user_id, _, headers = register(budget_client)
+
+    response = budget_client.post(f"/api/{user_id}/chat", json={"message": "Hello"}, headers=headers)
+    assert response.status_code == 200
+    conversation_id = response.json()["conversation_id"]
+    for i in range(ROWS):
+        response = budget_client.post(f"/api/{user_id}/chat", json={"message": f"Message {i}", "conversation_id": conversation_id}, headers=headers)
+        assert response.status_code == 200
+
+    response = budget_client.get(f"/api/{user_id}/conversations/{conversation_id}", headers=headers)
+    assert response.status_code == 200
+
+
+def test_violations_list_the_statements():
+    request = RequestQueries(
+        method="GET",
+        path="/api/v1/users/u1/tasks",
+        route="/api/v1/users/{user_id}/tasks",
+        statements=["SELECT 1", "SELECT\n  2", "SELECT 3"],
+        seconds=0.002,
+    )
+
+    violations = find_violations([request], {request.key: QueryBudget(max_queries=2)})
+
+    assert len(violations) == 1
+    assert "3 queries > budget 2" in violations[0]
+    assert "2. SELECT 2" in violations[0]
+    assert find_violations([request], {request.key: QueryBudget(max_queries=3)}) == []
+    assert find_violations([request], {request.key: QueryBudget(max_db_ms=1)})[0].count("ms in the database") == 1
+
+
+def test_budget_file_covers_known_routes():
+    import main
+
+    budgets = load_budgets()
+    routes = {
+        f"{method} {route.path}"
+        for route in main.app.routes
+        for method in getattr(route, "methods", ())
+    }
+    assert set(budgets) <= routes, f"Budgets for unknown routes: {sorted(set(budgets) - routes)}"
+
+
+def test_batch_update_rejects_null_for_required_fields(budget_client):
+    user_id, _, headers = register(budget_client)
+    task_ids = create_tasks(budget_client, user_id, headers, count=3)
+
+    response = budget_client.post(f"/api/v1/users/{user_id}/tasks/batch", json={"operations": [
+        {"op": "update", "task_id": task_ids[0], "title": None},
+        {"op": "update", "task_id": task_ids[1], "priority": None, "completed": None},
+        {"op": "update", "task_id": task_ids[2], "description": None},
+    ]}, headers=headers)
+
+    assert response.status_code == 200
+    results = response.json()["results"]
+    assert [result["success"] for result in results] == [False, False, True]
+    assert results[0]["error"] == "Cannot set title to null"
+    assert results[1]["error"] == "Cannot set completed, priority to null"
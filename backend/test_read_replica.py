@@ -0,0 +1,264 @@
+"""
+Read replica routing tests, with two SQLite files standing in for the primary and the replica.
+
+The replica is never written by the app, so a row that only exists in one of the
+files shows which database served a read.
+
+Run with: python -m pytest test_read_replica.py
+"""
+
+import asyncio
+import os
+import sys
+import threading
+import time
+import uuid
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+# Settings are required at import time; the fixture points them at temporary files
+for name in ("DATABASE_URL", "NEON_DB_URL"):
+    os.environ.setdefault(name, "sqlite://")
+for name in ("BETTER_AUTH_SECRET", "BETTER_AUTH_URL", "SECRET_KEY"):
+    os.environ.setdefault(name, "test-secret-key-with-at-least-32-bytes")
+
+from fastapi.testclient import TestClient  # noqa: E402
+from sqlalchemy import event  # noqa: E402
+from sqlmodel import Session, SQLModel  # noqa: E402
+
+import main  # noqa: E402
+from src.config.settings import settings  # noqa: E402
+from src.database import connection  # noqa: E402
+from src.database.session import get_read_db_session, recent_writers  # noqa: E402
+from src.database.write_marker import WRITE_MARKER_HEADER, encode_write_marker  # noqa: E402
+from src.mcp_server.tools.add_task import add_task  # noqa: E402
+from src.mcp_server.tools.list_tasks import list_tasks  # noqa: E402
+from src.models.task import Task  # noqa: E402
+from src.models.user import User  # noqa: E402
+
+
+@pytest.fixture
+def databases(tmp_path, monkeypatch):
+    """Point the app at a primary and a replica SQLite file and yield their engines."""
+    monkeypatch.setattr(settings, "NEON_DB_URL", f"sqlite:///{tmp_path / 'primary.db'}")
+    monkeypatch.setattr(settings, "NEON_ASYNC_DB_URL", None)
+    monkeypatch.setattr(settings, "NEON_READ_DB_URL", f"sqlite:///{tmp_path / 'replica.db'}")
+    asyncio.run(connection.dispose_engines())
+    recent_writers.clear()
+
+    primary, replica = connection.get_engine(), connection.get_read_engine()
+    SQLModel.metadata.create_all(primary)
+    SQLModel.metadata.create_all(replica)
+    yield primary, replica
+
+    asyncio.run(connection.dispose_engines())
+    recent_writers.clear()
+
+
+@pytest.fixture
+def client(databases):
+    with TestClient(main.app) as test_client:
+        yield test_client
+
+
+def register(client):
+    """Register a user on the primary and copy the row to the replica, as replication would."""
+    response = client.post("/api/v1/register", json={
+        "email": f"{uuid.uuid4().hex[:12]}@example.com",
+        "password": "secret1",
+        "confirm_password": "secret1",
+        "name": "Replica Test",
+    })
+    assert response.status_code == 200
+    user = response.json()
+    return user["id"], {"Authorization": f"Bearer {user['token']}"}
+
+
+def forget_writes(client):
+    """Let every earlier write count as replicated: no recent writers here and no marker in the client."""
+    recent_writers.clear()
+    client.cookies.clear()
+
+
+def add_replica_only_task(replica, user_id, title="Only on the replica"):
+    with Session(replica) as db:
+        db.add(Task(title=title, user_id=user_id))
+        db.commit()
+
+
+def task_titles(client, user_id, headers):
+    response = client.get(f"/api/v1/users/{user_id}/tasks", headers=headers)
+    assert response.status_code == 200
+    return {task["title"] for task in response.json()}
+
+
+def test_reads_go_to_the_replica(client, databases):
+    _, replica = databases
+    user_id, headers = register(client)
+    add_replica_only_task(replica, user_id)
+    forget_writes(client)
+
+    assert task_titles(client, user_id, headers) == {"Only on the replica"}
+
+
+def test_reads_after_own_write_go_to_the_primary(client, databases):
+    _, replica = databases
+    user_id, headers = register(client)
+    add_replica_only_task(replica, user_id)
+    forget_writes(client)
+
+    response = client.post(f"/api/v1/users/{user_id}/tasks", json={"title": "Just written", "user_id": user_id}, headers=headers)
+    assert response.status_code == 201
+
+    assert task_titles(client, user_id, headers) == {"Just written"}
+    task_id = response.json()["id"]
+    assert client.get(f"/api/v1/users/{user_id}/tasks/{task_id}", headers=headers).status_code == 200
+
+
+def test_reads_return_to_the_replica_after_the_window(client, databases, monkeypatch):
+    _, replica = databases
+    user_id, headers = register(client)
+    add_replica_only_task(replica, user_id)
+    client.post(f"/api/v1/users/{user_id}/tasks", json={"title": "Just written", "user_id": user_id}, headers=headers)
+
+    monkeypatch.setattr(recent_writers, "window", 0.0)
+    monkeypatch.setattr(settings, "READ_YOUR_WRITES_SECONDS", 0.0)
+
+    assert task_titles(client, user_id, headers) == {"Only on the replica"}
+
+
+def test_write_cookie_routes_reads_on_another_worker(client, databases):
+    _, replica = databases
+    user_id, headers = register(client)
+    add_replica_only_task(replica, user_id)
+    forget_writes(client)
+
+    client.post(f"/api/v1/users/{user_id}/tasks", json={"title": "Just written", "user_id": user_id}, headers=headers)
+    # The next request lands on a worker that did not see the write
+    recent_writers.clear()
+
+    assert task_titles(client, user_id, headers) == {"Just written"}
+
+
+def test_write_header_routes_reads_on_another_worker(client, databases):
+    _, replica = databases
+    user_id, headers = register(client)
+    add_replica_only_task(replica, user_id)
+    forget_writes(client)
+
+    response = client.post(f"/api/v1/users/{user_id}/tasks", json={"title": "Just written", "user_id": user_id}, headers=headers)
+    marker = response.headers[WRITE_MARKER_HEADER]
+    forget_writes(client)
+
+    assert task_titles(client, user_id, {**headers, WRITE_MARKER_HEADER: marker}) == {"Just written"}
+
+
+def test_reads_do_not_query_the_primary_without_a_marker(client, databases):
+    primary, replica = databases
+    user_id, headers = register(client)
+    add_replica_only_task(replica, user_id)
+    forget_writes(client)
+    primary_statements = []
+
+    def count_statement(conn, cursor, statement, parameters, context, executemany):
+        primary_statements.append(statement)
+
+    event.listen(primary, "before_cursor_execute", count_statement)
+    try:
+        assert task_titles(client, user_id, headers) == {"Only on the replica"}
+    finally:
+        event.remove(primary, "before_cursor_execute", count_statement)
+    assert primary_statements == []
+
+
+@pytest.mark.parametrize("marker", [
+    lambda user_id: encode_write_marker(str(uuid.uuid4()), time.time()),
+    lambda user_id: encode_write_marker(user_id, time.time())[:-1] + "-",
+    lambda user_id: encode_write_marker(user_id, time.time() - 60),
+], ids=["other-user", "bad-signature", "expired"])
+def test_invalid_write_markers_are_ignored(client, databases, marker):
+    _, replica = databases
+    user_id, headers = register(client)
+    add_replica_only_task(replica, user_id)
+    forget_writes(client)
+
+    assert task_titles(client, user_id, {**headers, WRITE_MARKER_HEADER: marker(user_id)}) == {"Only on the replica"}
+
+
+def test_stickiness_is_per_user(client, databases):
+    _, replica = databases
+    writer_id, writer_headers = register(client)
+    reader_id, reader_headers = register(client)
+    add_replica_only_task(replica, reader_id)
+    forget_writes(client)
+
+    client.post(f"/api/v1/users/{writer_id}/tasks", json={"title": "Written", "user_id": writer_id}, headers=writer_headers)
+
+    assert task_titles(client, reader_id, reader_headers) == {"Only on the replica"}
+
+
+def test_profile_right_after_register_reads_the_primary(client):
+    # The replica never receives the user, so only the primary can answer
+    _, headers = register(client)
+
+    assert client.get("/api/v1/profile", headers=headers).status_code == 200
+
+
+def test_list_tasks_tool_follows_the_routing(client, databases):
+    _, replica = databases
+    user_id, _ = register(client)
+    add_replica_only_task(replica, user_id)
+    forget_writes(client)
+
+    result = asyncio.run(list_tasks(user_id))
+    assert [task["title"] for task in result["tasks"]] == ["Only on the replica"]
+
+    assert asyncio.run(add_task(user_id, "Added by the agent"))["success"]
+    result = asyncio.run(list_tasks(user_id))
+    assert [task["title"] for task in result["tasks"]] == ["Added by the agent"]
+
+
+def test_without_a_replica_reads_use_the_primary(databases, monkeypatch):
+    primary, _ = databases
+    monkeypatch.setattr(settings, "NEON_READ_DB_URL", None)
+    user_id = str(uuid.uuid4())
+    with Session(primary) as db:
+        db.add(User(id=user_id, email="primary@example.com", name="Primary", hashed_password="x"))
+        db.commit()
+
+    with get_read_db_session(user_id) as db:
+        assert db.get(User, user_id) is not None
+
+
+@pytest.mark.parametrize("getter, attribute", [
+    (connection.get_async_engine, "async_engine"),
+    (connection.get_async_read_engine, "async_read_engine"),
+])
+def test_async_engines_are_created_once_under_concurrency(monkeypatch, getter, attribute):
+    monkeypatch.setattr(settings, "NEON_READ_DB_URL", "sqlite:///replica.db")
+    created = []
+    start = threading.Barrier(8)
+
+    def slow_create(database_url=None):
+        time.sleep(0.05)
+        created.append(database_url)
+        return object()
+
+    monkeypatch.setattr(connection, "create_async_db_engine", slow_create)
+    monkeypatch.setattr(connection, attribute, None)
+    results = []
+
+    def worker():
+        start.wait()
+        results.append(getter())
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(created) == 1
+    assert len({id(engine) for engine in results}) == 1
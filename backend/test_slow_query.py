@@ -0,0 +1,65 @@
+"""
+Plan capture of the slow query log.
+
+Run with: python -m pytest test_slow_query.py
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from src.config.settings import settings
+from src.database.slow_query import capture_plan, get_explain_prefix
+
+
+class RecordingCursor:
+    def __init__(self, statements, fail=False):
+        self.statements = statements
+        self.fail = fail
+
+    def execute(self, statement, parameters=None):
+        self.statements.append(statement)
+        if self.fail and statement.startswith("EXPLAIN"):
+            raise RuntimeError("explain failed")
+
+    def fetchall(self):
+        return [("Seq Scan on tasks",)]
+
+    def close(self):
+        pass
+
+
+def postgres_connection(statements, fail=False):
+    return SimpleNamespace(
+        dialect=SimpleNamespace(name="postgresql"),
+        connection=SimpleNamespace(cursor=lambda: RecordingCursor(statements, fail))
+    )
+
+
+@pytest.mark.parametrize("statement, analyze, expected", [
+    ("SELECT * FROM tasks", False, "EXPLAIN "),
+    ("SELECT * FROM tasks", True, "EXPLAIN (ANALYZE, BUFFERS) "),
+    ("WITH moved AS (UPDATE tasks SET completed = true RETURNING id) SELECT * FROM moved", True, "EXPLAIN "),
+    ("UPDATE tasks SET completed = true", True, "EXPLAIN "),
+])
+def test_analyze_is_opt_in_and_only_for_plain_selects(statement, analyze, expected):
+    assert get_explain_prefix("postgresql", statement, analyze=analyze) == expected
+
+
+@pytest.mark.parametrize("fail", [False, True], ids=["explained", "explain-failed"])
+def test_explain_is_always_rolled_back(monkeypatch, fail):
+    monkeypatch.setattr(settings, "SLOW_QUERY_EXPLAIN_ANALYZE", True)
+    statements = []
+
+    if fail:
+        with pytest.raises(RuntimeError):
+            capture_plan(postgres_connection(statements, fail), "SELECT * FROM tasks", {})
+    else:
+        assert capture_plan(postgres_connection(statements), "SELECT * FROM tasks", {}) == "Seq Scan on tasks"
+
+    assert statements == [
+        "SAVEPOINT slow_query_explain",
+        "EXPLAIN (ANALYZE, BUFFERS) SELECT * FROM tasks",
+        "ROLLBACK TO SAVEPOINT slow_query_explain",
+        "RELEASE SAVEPOINT slow_query_explain",
+    ]
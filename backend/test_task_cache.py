@@ -0,0 +1,111 @@
+"""
+Task cache consistency when tasks are written by another process.
+
+Writes made straight through a session, as the MCP server or another worker
+would, never invalidate this process's cache; reads must still see them.
+
+Run with: python -m pytest test_task_cache.py
+"""
+
+import asyncio
+import uuid
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlmodel import Session
+
+import main
+from src.database.connection import get_engine
+from src.mcp_server.tools.list_tasks import list_tasks
+from src.models.task import Task
+from src.services.task_cache import TaskCache, task_cache
+
+
+@pytest.fixture
+def client():
+    task_cache.clear()
+    with TestClient(main.app) as test_client:
+        yield test_client
+    task_cache.clear()
+
+
+def register(client):
+    response = client.post("/api/v1/register", json={
+        "email": f"{uuid.uuid4().hex[:12]}@example.com",
+        "password": "secret1",
+        "confirm_password": "secret1",
+        "name": "Cache Test",
+    })
+    assert response.status_code == 200
+    user = response.json()
+    return user["id"], {"Authorization": f"Bearer {user['token']}"}
+
+
+def write_from_another_process(user_id, title):
+    with Session(get_engine()) as db:
+        db.add(Task(title=title, user_id=user_id))
+        db.commit()
+
+
+def test_task_list_etag_and_body_follow_outside_writes(client):
+    user_id, headers = register(client)
+    url = f"/api/v1/users/{user_id}/tasks"
+    client.post(url, json={"title": "First", "user_id": user_id}, headers=headers)
+
+    first = client.get(url, headers=headers)
+    assert [task["title"] for task in first.json()] == ["First"]
+
+    write_from_another_process(user_id, "Second")
+
+    second = client.get(url, headers={**headers, "If-None-Match": first.headers["ETag"]})
+    assert second.status_code == 200
+    assert [task["title"] for task in second.json()] == ["First", "Second"]
+    assert client.get(url, headers={**headers, "If-None-Match": second.headers["ETag"]}).status_code == 304
+
+
+def test_list_tasks_tool_sees_outside_writes(client):
+    user_id, _ = register(client)
+    write_from_another_process(user_id, "First")
+    assert [task["title"] for task in asyncio.run(list_tasks(user_id))["tasks"]] == ["First"]
+
+    write_from_another_process(user_id, "Second")
+
+    assert [task["title"] for task in asyncio.run(list_tasks(user_id))["tasks"]] == ["First", "Second"]
+    assert task_cache.stats()["stale"] >= 1
+
+
+def test_task_stats_see_outside_writes(client):
+    user_id, headers = register(client)
+    url = f"/api/v1/users/{user_id}/tasks/stats"
+    before = client.get(url, headers=headers).json()
+
+    write_from_another_process(user_id, "Written elsewhere")
+
+    assert client.get(url, headers=headers).json() != before
+
+
+def test_versions_are_bounded_and_never_go_back():
+    cache = TaskCache(max_users=2)
+    version = cache.get_version("reader")
+    cache.invalidate("reader")
+    for user_id in ("a", "b", "c"):
+        cache.invalidate(user_id)
+
+    assert cache.stats()["versioned_users"] == 2
+    # "reader" dropped out of the versions LRU; a snapshot loaded before its write is still refused
+    cache.set("reader", "list", ["stale"], version=version)
+    assert cache.get("reader", "list") is None
+    cache.set("reader", "list", ["fresh"], version=cache.get_version("reader"))
+    assert cache.get("reader", "list") == ["fresh"]
+
+
+def test_task_list_etag_does_not_depend_on_the_process(client):
+    user_id, headers = register(client)
+    url = f"/api/v1/users/{user_id}/tasks"
+    client.post(url, json={"title": "First", "user_id": user_id}, headers=headers)
+    etag = client.get(url, headers=headers).headers["ETag"]
+
+    # Another worker, or this one after a restart, has never seen a write for the user
+    task_cache.invalidate(user_id)
+
+    assert client.get(url, headers={**headers, "If-None-Match": etag}).status_code == 304
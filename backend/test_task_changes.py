@@ -0,0 +1,59 @@
+"""
+Delta sync (/tasks/changes) with writes that commit after a sync has read past them.
+
+Run with: python -m pytest test_task_changes.py
+"""
+
+import uuid
+from datetime import timedelta
+
+import pytest
+from sqlmodel import Session, SQLModel
+
+from src.config.settings import settings
+from src.database.connection import get_engine
+from src.models.task import Task
+from src.services.task_service import TaskService
+from src.utils.helpers import decode_sync_token
+
+
+@pytest.fixture
+def db():
+    engine = get_engine()
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        yield session
+
+
+def add_task(db, user_id, title, updated_at=None):
+    task = Task(title=title, user_id=user_id)
+    if updated_at is not None:
+        task.created_at = task.updated_at = updated_at
+    db.add(task)
+    db.commit()
+    return task.id
+
+
+def test_late_commit_is_not_skipped(db):
+    user_id = str(uuid.uuid4())
+    add_task(db, user_id, "Synced")
+    first = TaskService.get_task_changes(user_id, db)
+    token_at = decode_sync_token(first["next_token"])
+
+    # A write stamped before the sync's high-water mark that only committed afterwards
+    late_id = add_task(db, user_id, "Committed late", updated_at=token_at - timedelta(seconds=1))
+
+    second = TaskService.get_task_changes(user_id, db, since=first["next_token"])
+    assert late_id in [task["id"] for task in second["tasks"]]
+    assert decode_sync_token(second["next_token"]) == token_at
+
+
+def test_without_overlap_nothing_is_resent(db, monkeypatch):
+    monkeypatch.setattr(settings, "TASK_SYNC_OVERLAP_SECONDS", 0.0)
+    user_id = str(uuid.uuid4())
+    add_task(db, user_id, "Synced")
+    token = TaskService.get_task_changes(user_id, db)["next_token"]
+
+    changes = TaskService.get_task_changes(user_id, db, since=token)
+    assert changes["tasks"] == [] and changes["deleted"] == []
+    assert changes["next_token"] == token
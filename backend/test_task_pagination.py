@@ -0,0 +1,116 @@
+"""
+Keyset (cursor) pagination of task lists.
+
+Runs on the test database from conftest.py; with TEST_DATABASE_URL pointing at
+Postgres the cursor is compared against the native uuid id column.
+
+Run with: python -m pytest test_task_pagination.py
+"""
+
+import asyncio
+import uuid
+from datetime import datetime, timedelta
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.dialects.postgresql import asyncpg, psycopg2
+from sqlmodel import Session, SQLModel
+
+import main
+from src.database.connection import get_engine
+from src.mcp_server.tools.list_tasks import DEFAULT_LIST_LIMIT, list_tasks
+from src.models.conversation import Conversation
+from src.models.task import Task
+from src.models.task_tombstone import TaskTombstone
+from src.models.user import User
+from src.services.task_cache import task_cache
+from src.services.task_service import TaskService
+from src.utils.helpers import encode_cursor
+
+
+@pytest.fixture
+def db():
+    engine = get_engine()
+    SQLModel.metadata.create_all(engine)
+    task_cache.clear()
+    with Session(engine) as session:
+        yield session
+    task_cache.clear()
+
+
+def add_tasks(db, user_id, count):
+    # Pairs of tasks share a timestamp, so pages also break ties on the id
+    start = datetime(2024, 1, 1)
+    for i in range(count):
+        db.add(Task(title=f"Task {i}", user_id=user_id, created_at=start + timedelta(seconds=i // 2)))
+    db.commit()
+
+
+def page_through(db, user_id, sort_order, limit=3):
+    seen, cursor = [], None
+    while True:
+        rows = TaskService.get_task_rows(user_id, db, limit=limit, cursor=cursor, sort_order=sort_order)
+        seen.extend(row["id"] for row in rows)
+        if len(rows) < limit:
+            return seen
+        cursor = encode_cursor(rows[-1]["created_at"], rows[-1]["id"])
+
+
+@pytest.mark.parametrize("sort_order", ["asc", "desc"])
+def test_cursor_pages_cover_every_task_once(db, sort_order):
+    user_id = str(uuid.uuid4())
+    add_tasks(db, user_id, 8)
+
+    expected = [row["id"] for row in TaskService.get_task_rows(user_id, db, limit=None, sort_order=sort_order)]
+
+    assert page_through(db, user_id, sort_order) == expected
+    assert len(set(expected)) == 8
+
+
+@pytest.mark.parametrize("dialect", [asyncpg.dialect(), psycopg2.dialect()], ids=["asyncpg", "psycopg2"])
+def test_cursor_binds_with_the_column_types(dialect):
+    created_at, task_id = datetime(2024, 1, 1), str(uuid.uuid4())
+    query = TaskService.build_task_rows_query("user", cursor=encode_cursor(created_at, task_id))
+
+    compiled = query.compile(dialect=dialect)
+    binds = {param.value: param.type for param in compiled.binds.values()}
+
+    assert isinstance(binds[task_id], type(Task.id.type))
+    assert isinstance(binds[created_at], type(Task.created_at.type))
+    if isinstance(dialect, asyncpg.dialect):
+        assert "::UUID)" in str(compiled)
+
+
+@pytest.mark.parametrize("column", [Task.user_id, TaskTombstone.user_id, Conversation.user_id], ids=str)
+def test_user_id_columns_have_the_users_key_type(column):
+    # Same native uuid type as users.id on Postgres, so joins and foreign keys need no casts
+    assert isinstance(column.type, type(User.id.type))
+    assert column.type.compile(dialect=psycopg2.dialect()) == "UUID"
+
+
+@pytest.mark.parametrize("query", ["limit=-1", "limit=0", "limit=101", "skip=-1"])
+def test_task_list_rejects_out_of_range_paging(query):
+    with TestClient(main.app) as client:
+        response = client.post("/api/v1/register", json={
+            "email": f"{uuid.uuid4().hex[:12]}@example.com",
+            "password": "secret1",
+            "confirm_password": "secret1",
+            "name": "Paging Test",
+        })
+        user = response.json()
+        headers = {"Authorization": f"Bearer {user['token']}"}
+
+        assert client.get(f"/api/v1/users/{user['id']}/tasks?{query}", headers=headers).status_code == 422
+
+
+def test_list_tasks_tool_caps_and_reports_truncation(db):
+    user_id = str(uuid.uuid4())
+    add_tasks(db, user_id, DEFAULT_LIST_LIMIT + 1)
+
+    result = asyncio.run(list_tasks(user_id))
+    assert len(result["tasks"]) == DEFAULT_LIST_LIMIT
+    assert result["truncated"] and "more exist" in result["message"]
+
+    result = asyncio.run(list_tasks(user_id, limit=DEFAULT_LIST_LIMIT + 1))
+    assert len(result["tasks"]) == DEFAULT_LIST_LIMIT + 1
+    assert not result["truncated"] and "message" not in result
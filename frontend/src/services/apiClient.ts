@@ -34,9 +34,20 @@ class ApiClient {
       (config.headers as Record<string, string>)['Authorization'] = `Bearer ${token}`;
     }
 
+    // Echo the marker of this user's last write so reads are not served from a lagging replica
+    const lastWrite = typeof window !== 'undefined' ? sessionStorage.getItem('last_write') : null;
+    if (lastWrite && config.headers) {
+      (config.headers as Record<string, string>)['X-Last-Write'] = lastWrite;
+    }
+
     try {
       const response = await fetch(url, config);
 
+      const writeMarker = response.headers.get('X-Last-Write');
+      if (writeMarker && typeof window !== 'undefined') {
+        sessionStorage.setItem('last_write', writeMarker);
+      }
+
       if (!response.ok) {
         // Handle different status codes appropriately
         const errorData = await response.json().catch(() => ({}));
@@ -40,6 +40,12 @@ class ChatAPIService {
         body: JSON.stringify(requestBody)
       });
 
+      // Tasks changed by the assistant are read from the primary while this marker is fresh
+      const writeMarker = response.headers.get('X-Last-Write');
+      if (writeMarker) {
+        sessionStorage.setItem('last_write', writeMarker);
+      }
+
       if (!response.ok) {
         const errorData = await response.json().catch(() => ({}));
         throw new Error(errorData.detail || `HTTP error! status: ${response.status}`);